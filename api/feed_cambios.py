@@ -0,0 +1,73 @@
+"""Emisión del registro de cambios por un socket local
+
+Protocolo: el cliente se conecta y envía una línea con el último seq que
+ya procesó (vacía o 0 para empezar desde el principio). El servidor le
+responde con un cambio por línea en JSON (seq, tabla, operacion, clave,
+datos, fecha) y mantiene la conexión abierta enviando los cambios nuevos a
+medida que se confirman. Si la conexión se corta, el cliente vuelve a
+conectarse con el último seq que recibió completo.
+
+Ejemplo:
+    printf '0\\n' | nc 127.0.0.1 8001
+"""
+import json
+import socketserver
+import threading
+
+from services.cambios_service import CambiosService
+
+
+class ManejadorCambios(socketserver.StreamRequestHandler):
+    """Atiende a un consumidor del registro de cambios"""
+
+    def handle(self):
+        linea = self.rfile.readline(64).strip()
+        try:
+            seq = int(linea or 0)
+        except ValueError:
+            self.wfile.write(b'{"error":"La primera linea debe ser el ultimo seq procesado"}\n')
+            return
+
+        servidor = self.server
+        try:
+            for cambio in servidor.cambios.seguir(seq, servidor.intervalo, detener=servidor.detener):
+                self.wfile.write(json.dumps(cambio.a_dict(), ensure_ascii=False,
+                                            separators=(",", ":")).encode("utf-8") + b"\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class ServidorCambios(socketserver.ThreadingTCPServer):
+    """Servidor TCP con un hilo por consumidor"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, direccion, db, intervalo=0.5):
+        """
+        Args:
+            direccion (tuple): (host, puerto); puerto 0 elige uno libre
+            db (Database): Base de datos de la que leer los cambios
+            intervalo (float): Segundos entre consultas cuando no hay cambios nuevos
+        """
+        super().__init__(direccion, ManejadorCambios)
+        self.cambios = CambiosService(db)
+        self.intervalo = intervalo
+        self.detener = threading.Event()
+
+    def shutdown(self):
+        self.detener.set()
+        super().shutdown()
+
+
+def servir_cambios(db, host="127.0.0.1", puerto=8001):
+    """Emite el registro de cambios hasta que se interrumpe con Ctrl+C"""
+    servidor = ServidorCambios((host, puerto), db)
+    print(f"Registro de cambios disponible en {host}:{servidor.server_address[1]} (Ctrl+C para detener)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor de cambios detenido.")
+    finally:
+        servidor.detener.set()
+        servidor.server_close()
@@ -0,0 +1,553 @@
+"""Servidor HTTP/JSON sobre los servicios de grupos, semilleros y entregables
+
+Rutas:
+    GET   /grupos                        Todos los grupos
+    GET   /grupos/{id}                   Un grupo
+    GET   /semilleros                    Página de semilleros (tamano, despues, antes, grupo_id, status)
+                                         o búsqueda por texto (q, limit)
+    GET   /semilleros/{id}               Semillero con objetivos, investigadores, grupo y entregable
+    POST  /semilleros                    Crear semillero
+    PATCH /semilleros/{id}               Cambiar status
+    GET   /semilleros/{id}/entregable    Entregable del semillero
+    POST  /semilleros/{id}/entregable    Asignar entregable
+    PATCH /entregables/{id}              Cambiar estado de un entregable
+    GET   /entregables/pendientes        Cola de revisión por fecha de entrega (tamano, despues)
+    POST  /entregables/estado            Cambiar el estado de varios entregables (estado, ids,
+                                         grupo_id, tipo, entregado_hasta)
+    GET   /reportes                      Reportes agregados
+    GET   /metricas                      Métricas de las consultas en formato Prometheus
+                                         (o JSON con formato=json)
+    GET   /actividad                     Registro de actividad, de lo más reciente a lo más antiguo
+                                         (semillero_id o actor, desde, hasta, limite)
+    GET   /cambios                       Registro de cambios posteriores a un seq (desde, limite)
+
+Las respuestas GET se guardan ya serializadas en una CacheConsultas que
+depende de las tablas leídas, incluidas las escrituras que hagan el menú,
+una importación u otro proceso sobre el mismo archivo; servir() limita
+además su antigüedad a TTL_RESPUESTAS segundos. El ETag es el hash del cuerpo y se calcula
+una sola vez por versión de las tablas; Last-Modified es la marca
+actualizado_en más reciente de esas tablas. Un cliente que envía
+If-None-Match o If-Modified-Since recibe 304 sin cuerpo; para responderle
+sólo se lee la versión de las tablas (el último cambio de cada una en el
+registro de cambios), no los datos. Los cuerpos grandes se comprimen con
+gzip si el cliente lo acepta.
+
+Cada petición se atiende dentro de una traza de las métricas de la base de
+datos; su identificador se devuelve en la cabecera X-Traza. Las acciones
+se atribuyen en el registro de actividad al usuario de la cabecera
+X-Usuario o, si no viene, a la dirección del cliente.
+"""
+import base64
+import gzip
+import hashlib
+import json
+from collections import namedtuple
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from db.migraciones import TABLAS_CON_MARCA_TEMPORAL
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.actividad_service import ActividadService, como_actor
+from services.cambios_service import CambiosService
+from services.cache import CacheConsultas
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.reports import ReporteService
+from services.semillero_service import SemilleroService
+
+
+# Cuerpos menores que esto no compensan el coste de comprimir
+UMBRAL_GZIP = 1024
+
+# Segundos que servir() mantiene una respuesta en caché como mucho
+TTL_RESPUESTAS = 5.0
+
+# Tamaño máximo del cuerpo de una petición POST o PATCH
+MAXIMO_CUERPO = 1024 * 1024
+
+TABLAS_SEMILLERO = ("semilleros", "semillero_objetivos", "investigadores", "grupos_investigacion", "entregables")
+
+
+class ErrorApi(Exception):
+    """Error que se devuelve al cliente con el código HTTP indicado"""
+
+    def __init__(self, estado, mensaje, errores=None):
+        super().__init__(mensaje)
+        self.estado = estado
+        self.mensaje = mensaje
+        self.errores = errores
+
+
+TIPO_JSON = "application/json; charset=utf-8"
+TIPO_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Respuesta(namedtuple("Respuesta", ["estado", "cuerpo", "etag", "ultima_modificacion", "comprimido", "tipo"],
+                           defaults=(TIPO_JSON,))):
+    """Respuesta ya serializada, con sus validadores y la versión gzip si procede"""
+
+    __slots__ = ()
+
+    @classmethod
+    def desde_datos(cls, estado, datos, ultima_modificacion=None):
+        cuerpo = json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return cls.desde_cuerpo(estado, cuerpo, ultima_modificacion)
+
+    @classmethod
+    def desde_cuerpo(cls, estado, cuerpo, ultima_modificacion=None, tipo=TIPO_JSON):
+        etag = '"' + hashlib.sha1(cuerpo).hexdigest() + '"'
+        comprimido = gzip.compress(cuerpo, compresslevel=6) if len(cuerpo) >= UMBRAL_GZIP else None
+        return cls(estado, cuerpo, etag, ultima_modificacion, comprimido, tipo)
+
+
+def codificar_cursor(cursor):
+    """Convierte un cursor (nombre, id) de Pagina en un texto apto para la URL"""
+    if cursor is None:
+        return None
+    return base64.urlsafe_b64encode(json.dumps(list(cursor)).encode("utf-8")).decode("ascii")
+
+
+def decodificar_cursor(texto):
+    """Operación inversa de codificar_cursor"""
+    if not texto:
+        return None
+    try:
+        nombre, semillero_id = json.loads(base64.urlsafe_b64decode(texto.encode("ascii")))
+        return nombre, int(semillero_id)
+    except (ValueError, TypeError):
+        raise ErrorApi(HTTPStatus.BAD_REQUEST, "Cursor de paginación no válido")
+
+
+def _grupo_json(grupo):
+    return {"id": grupo.id, "nombre": grupo.nombre, "campo": grupo.campo,
+            "identificador": grupo.identificador, "director": grupo.director}
+
+
+def _resumen_json(semillero):
+    return semillero._asdict()
+
+
+def _investigador_json(investigador):
+    return {"id": investigador.id, "nombre": investigador.nombre, "email": investigador.email}
+
+
+def _entregable_json(entregable):
+    return {"id": entregable.id, "titulo": entregable.titulo, "descripcion": entregable.descripcion,
+            "tipo": entregable.tipo, "semillero_id": entregable.semillero_id,
+            "fecha_entrega": entregable.fecha_entrega, "estado": entregable.estado}
+
+
+def _semillero_json(semillero):
+    return {
+        "id": semillero.id,
+        "nombre": semillero.nombre,
+        "status": semillero.status,
+        "objetivo_principal": semillero.objetivo_principal,
+        "objetivos_especificos": semillero.objetivos_especificos,
+        "grupo": _grupo_json(semillero.grupo) if semillero.grupo else None,
+        "estudiantes": [_investigador_json(i) for i in semillero.estudiantes],
+        "tutores": [_investigador_json(i) for i in semillero.tutores],
+        "entregable": _entregable_json(semillero.entregable) if semillero.entregable else None,
+    }
+
+
+def _entero(texto, nombre):
+    try:
+        return int(texto)
+    except (TypeError, ValueError):
+        raise ErrorApi(HTTPStatus.BAD_REQUEST, f"{nombre} debe ser un número entero")
+
+
+class ApiSemilleros:
+    """Rutas de la API, independientes del servidor HTTP que las atiende"""
+
+    # Respuestas GET guardadas; las búsquedas generan muchas claves distintas
+    MAXIMO_RESPUESTAS = 2000
+
+    def __init__(self, db, ttl=None):
+        """
+        Args:
+            db (Database): Base de datos compartida por los hilos del servidor
+            ttl (float, optional): Antigüedad máxima de las respuestas en caché,
+                útil si otro proceso escribe en la misma base de datos
+        """
+        self.db = db
+        self.grupos = GrupoService(db, ttl)
+        self.actividad = ActividadService.compartido(db)
+        self.entregables = EntregableService(db, self.actividad)
+        self.semilleros = SemilleroService(db, self.grupos, self.entregables, self.actividad)
+        self.reportes = ReporteService(db, ttl)
+        self.cambios = CambiosService(db)
+        self.cache = CacheConsultas(db, ttl, maximo=self.MAXIMO_RESPUESTAS)
+
+    def atender(self, metodo, ruta, consulta=None, cuerpo=None):
+        """Atiende una petición y devuelve la Respuesta
+
+        Args:
+            metodo (str): 'GET', 'POST' o 'PATCH'
+            ruta (str): Ruta sin parámetros (por ejemplo '/semilleros/3')
+            consulta (dict, optional): Parámetros de la URL (nombre -> valor)
+            cuerpo (dict, optional): Cuerpo JSON ya decodificado
+
+        Raises:
+            ErrorApi: Si la ruta no existe o la petición no es válida
+        """
+        consulta = consulta or {}
+        partes = [parte for parte in ruta.split("/") if parte]
+
+        if metodo == "GET" and partes == ["metricas"]:
+            # Cambian con cada consulta: no se guardan en la caché de respuestas
+            if consulta.get("formato") == "json":
+                return Respuesta.desde_datos(HTTPStatus.OK, self.db.metricas.instantanea())
+            return Respuesta.desde_cuerpo(HTTPStatus.OK, self.db.metricas.a_prometheus().encode("utf-8"),
+                                          tipo=TIPO_PROMETHEUS)
+
+        if metodo == "GET" and partes == ["actividad"]:
+            # Incluye lo aún pendiente de escribir, que no cambia la versión de la tabla: sin caché
+            return Respuesta.desde_datos(HTTPStatus.OK, self._actividad(consulta))
+
+        if metodo == "GET" and partes == ["cambios"]:
+            # Los triggers escriben en cambios sin pasar por las versiones de tabla: sin caché
+            return Respuesta.desde_datos(HTTPStatus.OK, self._cambios(consulta))
+
+        if metodo == "GET":
+            tablas, calcular = self._lectura(partes, consulta)
+            clave = (tuple(partes), tuple(sorted(consulta.items())))
+            return self.cache.obtener(clave, tablas, lambda: self._responder(tablas, calcular))
+
+        if metodo == "POST" and partes == ["semilleros"]:
+            return self._crear_semillero(cuerpo or {})
+        if metodo == "POST" and len(partes) == 3 and partes[0] == "semilleros" and partes[2] == "entregable":
+            return self._crear_entregable(_entero(partes[1], "id"), cuerpo or {})
+        if metodo == "PATCH" and len(partes) == 2 and partes[0] == "semilleros":
+            return self._cambiar_status(_entero(partes[1], "id"), cuerpo or {})
+        if metodo == "POST" and partes == ["entregables", "estado"]:
+            return self._cambiar_estado_entregables(cuerpo or {})
+        if metodo == "PATCH" and len(partes) == 2 and partes[0] == "entregables":
+            return self._cambiar_estado_entregable(_entero(partes[1], "id"), cuerpo or {})
+
+        raise ErrorApi(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {metodo} {ruta}")
+
+    def _lectura(self, partes, consulta):
+        """Tablas de las que depende una ruta GET y función que calcula sus datos"""
+        if partes == ["grupos"]:
+            return ("grupos_investigacion",), lambda: [_grupo_json(g) for g in self.grupos.obtener_todos()]
+
+        if len(partes) == 2 and partes[0] == "grupos":
+            grupo_id = _entero(partes[1], "id")
+
+            def grupo():
+                encontrado = self.grupos.obtener_por_id(grupo_id)
+                if not encontrado:
+                    raise ErrorApi(HTTPStatus.NOT_FOUND, f"No existe el grupo {grupo_id}")
+                return _grupo_json(encontrado)
+            return ("grupos_investigacion",), grupo
+
+        if partes == ["semilleros"]:
+            if consulta.get("q"):
+                limite = _entero(consulta.get("limit", 20), "limit")
+                return TABLAS_SEMILLERO, lambda: [
+                    _resumen_json(s) for s in self.semilleros.buscar(consulta["q"], limite)
+                ]
+            return ("semilleros", "grupos_investigacion"), lambda: self._pagina_semilleros(consulta)
+
+        if len(partes) == 2 and partes[0] == "semilleros":
+            semillero_id = _entero(partes[1], "id")
+
+            def semillero():
+                encontrado = self.semilleros.obtener_por_id(semillero_id, prefetch=SemilleroService.RELACIONES)
+                if not encontrado:
+                    raise ErrorApi(HTTPStatus.NOT_FOUND, f"No existe el semillero {semillero_id}")
+                return _semillero_json(encontrado)
+            return TABLAS_SEMILLERO, semillero
+
+        if len(partes) == 3 and partes[0] == "semilleros" and partes[2] == "entregable":
+            semillero_id = _entero(partes[1], "id")
+
+            def entregable():
+                encontrado = self.entregables.obtener_por_semillero(semillero_id)
+                if not encontrado:
+                    raise ErrorApi(HTTPStatus.NOT_FOUND, f"El semillero {semillero_id} no tiene entregable")
+                return _entregable_json(encontrado)
+            return ("entregables",), entregable
+
+        if partes == ["entregables", "pendientes"]:
+            return ("entregables", "semilleros"), lambda: self._cola_revision(consulta)
+
+        if partes == ["reportes"]:
+            return ("grupos_investigacion", "semilleros", "investigadores", "entregables", "contador_semilleros",
+                    "contador_entregables"), lambda: [
+                reporte._asdict() for reporte in self.reportes.reportes_estandar()
+            ]
+
+        raise ErrorApi(HTTPStatus.NOT_FOUND, "Ruta no encontrada: GET /" + "/".join(partes))
+
+    def _pagina_semilleros(self, consulta):
+        tamano = _entero(consulta.get("tamano", 20), "tamano")
+        if not 1 <= tamano <= 500:
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "tamano debe estar entre 1 y 500")
+        grupo_id = _entero(consulta["grupo_id"], "grupo_id") if consulta.get("grupo_id") else None
+
+        pagina = self.semilleros.listar_pagina(tamano=tamano,
+                                               despues=decodificar_cursor(consulta.get("despues")),
+                                               antes=decodificar_cursor(consulta.get("antes")),
+                                               grupo_id=grupo_id, status=consulta.get("status") or None)
+        return {
+            "elementos": [_resumen_json(s) for s in pagina.elementos],
+            "anterior": codificar_cursor(pagina.anterior),
+            "siguiente": codificar_cursor(pagina.siguiente),
+        }
+
+    def _cola_revision(self, consulta):
+        tamano = _entero(consulta.get("tamano", 20), "tamano")
+        if not 1 <= tamano <= 500:
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "tamano debe estar entre 1 y 500")
+
+        pagina = self.entregables.cola_revision(tamano=tamano, despues=decodificar_cursor(consulta.get("despues")))
+        return {
+            "elementos": [dict(_entregable_json(e), semillero_nombre=e.semillero_nombre) for e in pagina.elementos],
+            "siguiente": codificar_cursor(pagina.siguiente),
+        }
+
+    def _actividad(self, consulta):
+        limite = _entero(consulta.get("limite", 100), "limite")
+        if not 1 <= limite <= 1000:
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "limite debe estar entre 1 y 1000")
+        filtro = dict(desde=consulta.get("desde"), hasta=consulta.get("hasta"), limite=limite)
+
+        if consulta.get("semillero_id"):
+            actividades = self.actividad.por_semillero(_entero(consulta["semillero_id"], "semillero_id"), **filtro)
+        elif consulta.get("actor"):
+            actividades = self.actividad.por_actor(consulta["actor"], **filtro)
+        else:
+            actividades = self.actividad.entre_fechas(**filtro)
+        return [{"id": a.id, "fecha": a.fecha, "actor": a.actor, "accion": a.accion, "entidad": a.entidad,
+                 "entidad_id": a.entidad_id, "semillero_id": a.semillero_id, "detalle": a.detalle}
+                for a in actividades]
+
+    def _cambios(self, consulta):
+        limite = _entero(consulta.get("limite", CambiosService.LIMITE), "limite")
+        if not 1 <= limite <= 10000:
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "limite debe estar entre 1 y 10000")
+        desde = _entero(consulta.get("desde", 0), "desde")
+
+        cambios = self.cambios.cambios_desde(desde, limite)
+        return {
+            "cambios": [cambio.a_dict() for cambio in cambios],
+            "siguiente": cambios[-1].seq if cambios else desde,
+        }
+
+    def _ultima_modificacion(self, tablas):
+        """Marca actualizado_en más reciente de las tablas (cada MAX usa su índice)"""
+        con_marca = [tabla for tabla in tablas if tabla in TABLAS_CON_MARCA_TEMPORAL]
+        if not con_marca:
+            return None
+        query = "SELECT MAX(marca) FROM (" + " UNION ALL ".join(
+            f"SELECT MAX(actualizado_en) AS marca FROM {tabla}" for tabla in con_marca) + ")"
+        valor = self.db.execute_query(query, fetch='one')[0]
+        if not valor:
+            return None
+        return datetime.fromisoformat(valor[:19]).replace(tzinfo=timezone.utc)
+
+    def _responder(self, tablas, calcular):
+        ultima_modificacion = self._ultima_modificacion(tablas)
+        return Respuesta.desde_datos(HTTPStatus.OK, calcular(), ultima_modificacion)
+
+    def _crear_semillero(self, datos):
+        try:
+            grupo_id = int(datos.get("grupo_id"))
+        except (TypeError, ValueError):
+            grupo_id = None
+        if grupo_id and not self.grupos.obtener_por_id(grupo_id):
+            raise ErrorApi(HTTPStatus.UNPROCESSABLE_ENTITY, "Semillero no válido",
+                           [f"El grupo con ID {grupo_id} no existe"])
+
+        semillero = Semillero(
+            nombre=datos.get("nombre", ""),
+            objetivo_principal=datos.get("objetivo_principal", ""),
+            objetivos_especificos=list(datos.get("objetivos_especificos") or []),
+            grupo_id=grupo_id,
+            status="pendiente"
+        )
+        semillero.estudiantes = list(datos.get("estudiantes") or [])
+        semillero.tutores = list(datos.get("tutores") or [])
+
+        semillero_id, errores = self.semilleros.crear_semillero(semillero)
+        if not semillero_id:
+            raise ErrorApi(HTTPStatus.UNPROCESSABLE_ENTITY, "Semillero no válido", errores)
+        return Respuesta.desde_datos(HTTPStatus.CREATED, {"id": semillero_id})
+
+    def _crear_entregable(self, semillero_id, datos):
+        entregable = Entregable(
+            titulo=datos.get("titulo", ""),
+            descripcion=datos.get("descripcion", ""),
+            tipo=datos.get("tipo", ""),
+            semillero_id=semillero_id,
+            fecha_entrega=datos.get("fecha_entrega")
+        )
+        errores = entregable.validar()
+        if errores:
+            raise ErrorApi(HTTPStatus.UNPROCESSABLE_ENTITY, "Entregable no válido", errores)
+
+        creado, mensaje = self.entregables.crear_entregable(entregable)
+        if not creado:
+            raise ErrorApi(HTTPStatus.CONFLICT, mensaje)
+        return Respuesta.desde_datos(HTTPStatus.CREATED, {"id": entregable.id, "mensaje": mensaje})
+
+    def _cambiar_status(self, semillero_id, datos):
+        if datos.get("status") not in SemilleroService.STATUS_VALIDOS:
+            raise ErrorApi(HTTPStatus.UNPROCESSABLE_ENTITY, "El status debe ser 'activo' o 'pendiente'")
+        if not self.semilleros.cambiar_status(semillero_id, datos["status"]):
+            raise ErrorApi(HTTPStatus.NOT_FOUND, f"No existe el semillero {semillero_id}")
+        return Respuesta.desde_datos(HTTPStatus.OK, {"id": semillero_id, "status": datos["status"]})
+
+    def _cambiar_estado_entregables(self, datos):
+        ids = datos.get("ids")
+        if ids is not None and (not isinstance(ids, list) or not all(isinstance(i, int) for i in ids)):
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "ids debe ser una lista de números enteros")
+        grupo_id = _entero(datos["grupo_id"], "grupo_id") if datos.get("grupo_id") is not None else None
+
+        try:
+            cambiados = self.entregables.cambiar_estado_lote(datos.get("estado"), ids=ids, grupo_id=grupo_id,
+                                                             tipo=datos.get("tipo"),
+                                                             entregado_hasta=datos.get("entregado_hasta"))
+        except ValueError as e:
+            raise ErrorApi(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+        return Respuesta.desde_datos(HTTPStatus.OK, {"estado": datos["estado"], "cambiados": cambiados})
+
+    def _cambiar_estado_entregable(self, entregable_id, datos):
+        cambiado, mensaje = self.entregables.cambiar_estado(entregable_id, datos.get("estado"))
+        if not cambiado:
+            raise ErrorApi(HTTPStatus.UNPROCESSABLE_ENTITY, mensaje)
+        return Respuesta.desde_datos(HTTPStatus.OK, {"id": entregable_id, "mensaje": mensaje})
+
+
+class ManejadorHTTP(BaseHTTPRequestHandler):
+    """Traduce peticiones HTTP a ApiSemilleros y aplica caché condicional y gzip"""
+
+    # HTTP/1.1 mantiene la conexión abierta entre peticiones del mismo cliente
+    protocol_version = "HTTP/1.1"
+    server_version = "SemillerosAPI/1.0"
+    # Cabeceras y cuerpo se escriben por separado: sin TCP_NODELAY cada respuesta
+    # esperaría el ACK retardado del cliente (~40 ms) en conexiones persistentes
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._atender("GET")
+
+    def do_POST(self):
+        self._atender("POST")
+
+    def do_PATCH(self):
+        self._atender("PATCH")
+
+    def log_message(self, formato, *args):
+        if self.server.registrar:
+            super().log_message(formato, *args)
+
+    def _leer_cuerpo(self):
+        longitud = int(self.headers.get("Content-Length") or 0)
+        if longitud > MAXIMO_CUERPO:
+            raise ErrorApi(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "El cuerpo de la petición es demasiado grande")
+        if not longitud:
+            return None
+        try:
+            datos = json.loads(self.rfile.read(longitud))
+        except ValueError:
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser JSON válido")
+        if not isinstance(datos, dict):
+            raise ErrorApi(HTTPStatus.BAD_REQUEST, "El cuerpo debe ser un objeto JSON")
+        return datos
+
+    def _atender(self, metodo):
+        url = urlsplit(self.path)
+        consulta = {nombre: valores[-1] for nombre, valores in parse_qs(url.query).items()}
+
+        actor = self.headers.get("X-Usuario") or f"api:{self.client_address[0]}"
+        with self.server.api.db.metricas.traza(f"{metodo} {url.path}") as traza, como_actor(actor):
+            try:
+                cuerpo = self._leer_cuerpo() if metodo != "GET" else None
+                respuesta = self.server.api.atender(metodo, url.path, consulta, cuerpo)
+            except ErrorApi as e:
+                datos = {"error": e.mensaje}
+                if e.errores:
+                    datos["errores"] = e.errores
+                respuesta = Respuesta.desde_datos(e.estado, datos)
+            except Exception as e:
+                self.log_error("Error atendiendo %s %s: %r", metodo, self.path, e)
+                respuesta = Respuesta.desde_datos(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Error interno"})
+
+        if metodo == "GET" and respuesta.estado == HTTPStatus.OK and self._sin_cambios(respuesta):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._cabeceras_validacion(respuesta)
+            self.send_header("X-Traza", traza.id)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        cuerpo = respuesta.cuerpo
+        comprimir = respuesta.comprimido is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+
+        self.send_response(respuesta.estado)
+        self.send_header("Content-Type", respuesta.tipo)
+        self.send_header("X-Traza", traza.id)
+        if metodo == "GET" and respuesta.estado == HTTPStatus.OK:
+            self._cabeceras_validacion(respuesta)
+            self.send_header("Vary", "Accept-Encoding")
+        if comprimir:
+            cuerpo = respuesta.comprimido
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _cabeceras_validacion(self, respuesta):
+        self.send_header("ETag", respuesta.etag)
+        self.send_header("Cache-Control", "no-cache")
+        if respuesta.ultima_modificacion:
+            self.send_header("Last-Modified", format_datetime(respuesta.ultima_modificacion, usegmt=True))
+
+    def _sin_cambios(self, respuesta):
+        """Comprueba If-None-Match (o, si no viene, If-Modified-Since)"""
+        etags = self.headers.get("If-None-Match")
+        if etags is not None:
+            return etags.strip() == "*" or respuesta.etag in [e.strip().removeprefix("W/") for e in etags.split(",")]
+
+        desde = self.headers.get("If-Modified-Since")
+        if desde and respuesta.ultima_modificacion:
+            try:
+                return respuesta.ultima_modificacion <= parsedate_to_datetime(desde)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+class ServidorApi(ThreadingHTTPServer):
+    """Servidor HTTP con un hilo por conexión; los hilos comparten el pool de conexiones"""
+
+    daemon_threads = True
+
+    def __init__(self, direccion, db, ttl=None, registrar=True):
+        super().__init__(direccion, ManejadorHTTP)
+        self.api = ApiSemilleros(db, ttl)
+        self.registrar = registrar
+
+
+def servir(db, host="127.0.0.1", puerto=8000, ttl=TTL_RESPUESTAS):
+    """Atiende peticiones hasta que se interrumpe con Ctrl+C
+
+    Args:
+        ttl (float, optional): Segundos máximos que una respuesta se sirve desde la caché
+    """
+    servidor = ServidorApi((host, puerto), db, ttl)
+    print(f"API disponible en http://{host}:{servidor.server_port}/ (Ctrl+C para detener)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor detenido.")
+    finally:
+        servidor.server_close()
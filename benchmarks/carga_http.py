@@ -0,0 +1,134 @@
+"""Prueba de carga de la API HTTP contra una instancia local
+
+Sin --url levanta un ServidorApi en un puerto libre sobre una base
+temporal con semilleros sintéticos. Varios clientes con conexión
+persistente piden una mezcla de listados, detalles y búsquedas. Se mide
+dos veces: pidiendo siempre el cuerpo completo y revalidando con
+If-None-Match, como haría un cliente con caché. Para cada pasada muestra
+peticiones por segundo, latencias p50/p95, respuestas 304 y bytes recibidos.
+
+Uso:
+    python -m benchmarks.carga_http [--clientes N] [--peticiones N] [--semilleros N] [--url http://host:puerto]
+"""
+import argparse
+import http.client
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.concurrencia import _poblar
+from db.database import Database
+from services.grupo_service import GrupoService
+
+
+def _rutas(n, semilleros, semilla):
+    aleatorio = random.Random(semilla)
+    rutas = []
+    for _ in range(n):
+        tipo = aleatorio.random()
+        if tipo < 0.5:
+            rutas.append(f"/semilleros/{aleatorio.randint(1, semilleros)}")
+        elif tipo < 0.8:
+            rutas.append(f"/semilleros?tamano=50&grupo_id={aleatorio.randint(1, 8)}")
+        elif tipo < 0.9:
+            rutas.append("/grupos")
+        else:
+            rutas.append(f"/semilleros?q=Persona+{aleatorio.randint(1, 50)}")
+    return rutas
+
+
+def _cliente(host, puerto, rutas, revalidar, resultados):
+    conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+    etags = {}
+    latencias, no_modificadas, recibidos = [], 0, 0
+
+    for ruta in rutas:
+        cabeceras = {"Accept-Encoding": "gzip"}
+        if revalidar and ruta in etags:
+            cabeceras["If-None-Match"] = etags[ruta]
+
+        inicio = time.perf_counter()
+        conexion.request("GET", ruta, headers=cabeceras)
+        respuesta = conexion.getresponse()
+        cuerpo = respuesta.read()
+        latencias.append(time.perf_counter() - inicio)
+
+        recibidos += len(cuerpo)
+        if respuesta.status == 304:
+            no_modificadas += 1
+        elif respuesta.getheader("ETag"):
+            etags[ruta] = respuesta.getheader("ETag")
+
+    conexion.close()
+    resultados.append((latencias, no_modificadas, recibidos))
+
+
+def medir(host, puerto, clientes, peticiones, semilleros, revalidar):
+    # Cada cliente repite su propia secuencia: la segunda mitad revalida lo pedido en la primera
+    por_cliente = peticiones // clientes
+    resultados = []
+    hilos = []
+    for numero in range(clientes):
+        rutas = _rutas(por_cliente // 2, semilleros, numero) * 2
+        hilos.append(threading.Thread(target=_cliente, args=(host, puerto, rutas, revalidar, resultados)))
+
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    total = time.perf_counter() - inicio
+
+    latencias = sorted(latencia for datos in resultados for latencia in datos[0])
+    no_modificadas = sum(datos[1] for datos in resultados)
+    recibidos = sum(datos[2] for datos in resultados)
+    p95 = latencias[int(len(latencias) * 0.95) - 1]
+
+    etiqueta = "con If-None-Match" if revalidar else "sin revalidación"
+    print(f"{etiqueta:<20} {len(latencias) / total:>8.0f} pet/s   p50 {statistics.median(latencias) * 1000:>6.2f} ms"
+          f"   p95 {p95 * 1000:>6.2f} ms   304: {no_modificadas:>5}   {recibidos / 1024:>9.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=8)
+    parser.add_argument("--peticiones", type=int, default=4000)
+    parser.add_argument("--semilleros", type=int, default=2000)
+    parser.add_argument("--url", help="API ya en marcha (por defecto se levanta una local)")
+    args = parser.parse_args()
+
+    if args.url:
+        url = urlsplit(args.url)
+        print(f"{args.peticiones} peticiones, {args.clientes} clientes contra {args.url}")
+        for revalidar in (False, True):
+            medir(url.hostname, url.port or 80, args.clientes, args.peticiones, args.semilleros, revalidar)
+        return
+
+    from api.servidor import ServidorApi
+
+    with tempfile.TemporaryDirectory() as directorio:
+        with Database(os.path.join(directorio, "benchmark.db"), pool_size=args.clientes) as db:
+            GrupoService(db).cargar_datos_iniciales()
+            _poblar(db, args.semilleros)
+
+            for revalidar in (False, True):
+                # Servidor nuevo en cada pasada para empezar con la caché de respuestas vacía
+                servidor = ServidorApi(("127.0.0.1", 0), db, registrar=False)
+                hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+                hilo.start()
+                if not revalidar:
+                    print(f"{args.peticiones} peticiones, {args.clientes} clientes, {args.semilleros} semilleros")
+                try:
+                    medir("127.0.0.1", servidor.server_port, args.clientes, args.peticiones, args.semilleros,
+                          revalidar)
+                finally:
+                    servidor.shutdown()
+                    servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Mide el rendimiento de la fachada asyncio con muchas peticiones concurrentes
+
+Crea una base temporal con semilleros sintéticos y lanza peticiones de
+lectura mezcladas (detalle por ID, páginas del listado y búsquedas) con
+distintos niveles de concurrencia. Para cada nivel muestra peticiones por
+segundo y latencias p50/p95, junto a la ejecución secuencial síncrona.
+
+Uso:
+    python -m benchmarks.concurrencia [--semilleros N] [--peticiones N] [--concurrencia 1 10 50]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from db.database import Database
+from services.asincrono import ServiciosAsincronos
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+
+def _poblar(db, n):
+    """Inserta n semilleros con objetivos e investigadores en una transacción"""
+    with db.transaction():
+        db.execute_many("INSERT INTO semilleros (id, nombre, objetivo_principal, grupo_id, status) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(i, f"Semillero {i:06d}", "Objetivo general", i % 8 + 1,
+                          "activo" if i % 2 else "pendiente") for i in range(1, n + 1)])
+        db.execute_many("INSERT INTO semillero_objetivos (semillero_id, orden, objetivo) VALUES (?, ?, ?)",
+                        [(i, orden, f"Objetivo {orden} de {i}") for i in range(1, n + 1) for orden in (1, 2)])
+        db.execute_many("INSERT INTO investigadores (nombre, tipo, email, semillero_id) VALUES (?, ?, ?, ?)",
+                        [(f"Persona {i}-{j}", "tutor" if j == 0 else "estudiante", f"p{i}-{j}@ean.edu.co", i)
+                         for i in range(1, n + 1) for j in range(3)])
+
+
+def _peticiones(n, semilleros, semilla=42):
+    """Secuencia reproducible de peticiones (operación, argumento)"""
+    aleatorio = random.Random(semilla)
+    operaciones = []
+    for _ in range(n):
+        tipo = aleatorio.random()
+        if tipo < 0.6:
+            operaciones.append(("obtener_por_id", aleatorio.randint(1, semilleros)))
+        elif tipo < 0.9:
+            operaciones.append(("listar_pagina", (f"Semillero {aleatorio.randint(1, semilleros):06d}", 0)))
+        else:
+            operaciones.append(("buscar", f"Persona {aleatorio.randint(1, semilleros)}"))
+    return operaciones
+
+
+def _llamar(servicio, operacion, argumento):
+    """Llama a la operación con los mismos argumentos en la API síncrona o asíncrona"""
+    if operacion == "obtener_por_id":
+        return servicio.obtener_por_id(argumento, prefetch=SemilleroService.RELACIONES)
+    if operacion == "listar_pagina":
+        return servicio.listar_pagina(despues=argumento)
+    return servicio.buscar(argumento)
+
+
+def _resumen(etiqueta, total, latencias):
+    latencias = sorted(latencias)
+    p95 = latencias[int(len(latencias) * 0.95) - 1]
+    print(f"{etiqueta:<28} {len(latencias) / total:>10.0f} pet/s   "
+          f"p50 {statistics.median(latencias) * 1000:>7.2f} ms   p95 {p95 * 1000:>7.2f} ms")
+
+
+def medir_sincrono(db, operaciones):
+    servicio = SemilleroService(db)
+    latencias = []
+    inicio = time.perf_counter()
+    for operacion, argumento in operaciones:
+        t = time.perf_counter()
+        _llamar(servicio, operacion, argumento)
+        latencias.append(time.perf_counter() - t)
+    _resumen("Síncrono secuencial", time.perf_counter() - inicio, latencias)
+
+
+async def medir_asincrono(db, operaciones, concurrencia):
+    latencias = []
+    limite = asyncio.Semaphore(concurrencia)
+
+    async with ServiciosAsincronos(db) as servicios:
+        async def peticion(operacion, argumento):
+            async with limite:
+                t = time.perf_counter()
+                await _llamar(servicios.semilleros, operacion, argumento)
+                latencias.append(time.perf_counter() - t)
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(peticion(operacion, argumento) for operacion, argumento in operaciones))
+        total = time.perf_counter() - inicio
+
+    _resumen(f"asyncio, {concurrencia} concurrentes", total, latencias)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--semilleros", type=int, default=5000)
+    parser.add_argument("--peticiones", type=int, default=2000)
+    parser.add_argument("--concurrencia", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        with Database(os.path.join(directorio, "benchmark.db")) as db:
+            GrupoService(db).cargar_datos_iniciales()
+            _poblar(db, args.semilleros)
+            operaciones = _peticiones(args.peticiones, args.semilleros)
+
+            print(f"{args.peticiones} peticiones sobre {args.semilleros} semilleros "
+                  f"(pool de {db.pool.tamano} conexiones)")
+            medir_sincrono(db, operaciones)
+            for concurrencia in args.concurrencia:
+                asyncio.run(medir_asincrono(db, operaciones, concurrencia))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Genera semilleros sintéticos reproducibles para los benchmarks
+
+Con la misma semilla se obtienen siempre los mismos datos, y los datos de
+N semilleros son los primeros N de cualquier ejecución mayor, así que los
+resultados a distintas escalas (de 10 a 1.000.000 de semilleros) son
+comparables. Cada semillero tiene entre 1 y 4 objetivos, entre 2 y 8
+estudiantes, 1 o 2 tutores y, en el 60 % de los casos, un entregable.
+
+Uso:
+    python -m benchmarks.datos_sinteticos --semilleros N --salida ARCHIVO.db [--semilla 42]
+"""
+import argparse
+import random
+import time
+
+from models.entregable import Entregable
+
+
+NOMBRES = ["Ana", "Luis", "María", "Carlos", "Laura", "Andrés", "Camila", "Jorge", "Valentina", "Diego",
+           "Paula", "Santiago", "Daniela", "Felipe", "Sofía", "Juan", "Isabela", "Mateo", "Natalia", "Sebastián"]
+APELLIDOS = ["García", "Rodríguez", "Martínez", "López", "Gómez", "Pérez", "Sánchez", "Ramírez", "Torres",
+             "Díaz", "Vargas", "Moreno", "Rojas", "Castro", "Ortiz", "Jiménez", "Ruiz", "Herrera", "Medina", "Suárez"]
+TEMAS = ["inteligencia artificial", "economía circular", "finanzas sostenibles", "emprendimiento social",
+         "analítica de datos", "cadenas de suministro", "innovación educativa", "energías renovables",
+         "marketing digital", "salud pública", "ciudades inteligentes", "gobierno corporativo"]
+ENFOQUES = ["Laboratorio de", "Observatorio de", "Semillero en", "Grupo de estudio en", "Iniciativa de"]
+
+# Proporción de semilleros por estado y de entregables por estado
+PESOS_STATUS = {"activo": 7, "pendiente": 3}
+PESOS_ESTADO = {"pendiente": 10, "aprobado": 7, "rechazado": 3}
+PROPORCION_CON_ENTREGABLE = 0.6
+
+
+def _persona(aleatorio, semillero_id, indice, tipo):
+    nombre = f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(APELLIDOS)}"
+    return (nombre, tipo, f"{tipo[0]}{semillero_id}.{indice}@ean.edu.co", semillero_id)
+
+
+def _semillero(aleatorio, semillero_id, grupos):
+    """Filas de un semillero y de todo lo que cuelga de él"""
+    tema = aleatorio.choice(TEMAS)
+    semillero = (semillero_id, f"{aleatorio.choice(ENFOQUES)} {tema} {semillero_id}",
+                 f"Investigar aplicaciones de {tema}", aleatorio.choice(grupos),
+                 aleatorio.choices(list(PESOS_STATUS), list(PESOS_STATUS.values()))[0])
+
+    objetivos = [(semillero_id, orden, f"Objetivo {orden} sobre {tema}")
+                 for orden in range(1, aleatorio.randint(1, 4) + 1)]
+    investigadores = ([_persona(aleatorio, semillero_id, i, "estudiante") for i in range(aleatorio.randint(2, 8))]
+                      + [_persona(aleatorio, semillero_id, i, "tutor") for i in range(aleatorio.randint(1, 2))])
+
+    entregable = None
+    if aleatorio.random() < PROPORCION_CON_ENTREGABLE:
+        fecha = f"{aleatorio.randint(2023, 2025)}-{aleatorio.randint(1, 12):02d}-{aleatorio.randint(1, 28):02d}"
+        entregable = (f"Resultado {semillero_id}", f"Entregable sobre {tema}",
+                      aleatorio.choice(Entregable.TIPOS_VALIDOS), semillero_id, fecha,
+                      aleatorio.choices(list(PESOS_ESTADO), list(PESOS_ESTADO.values()))[0])
+
+    return semillero, objetivos, investigadores, entregable
+
+
+def generar(db, semilleros, semilla=42, tamano_lote=10000, progreso=None):
+    """Inserta semilleros sintéticos en una base de datos con los grupos ya cargados
+
+    Cada lote se guarda en una transacción.
+
+    Args:
+        db (Database): Base de datos de destino (sin semilleros)
+        semilleros (int): Número de semilleros a generar
+        semilla (int): Semilla del generador aleatorio
+        tamano_lote (int): Semilleros por transacción
+        progreso (callable, optional): Función llamada con los semilleros generados tras cada lote
+
+    Returns:
+        dict: Filas insertadas por tabla
+    """
+    grupos = [fila['id'] for fila in db.execute_query("SELECT id FROM grupos_investigacion ORDER BY id", fetch='all')]
+    if not grupos:
+        raise ValueError("La base de datos no tiene grupos de investigación")
+
+    aleatorio = random.Random(semilla)
+    totales = dict.fromkeys(["semilleros", "semillero_objetivos", "investigadores", "entregables"], 0)
+
+    for inicio in range(1, semilleros + 1, tamano_lote):
+        filas = {tabla: [] for tabla in totales}
+        for semillero_id in range(inicio, min(inicio + tamano_lote, semilleros + 1)):
+            semillero, objetivos, investigadores, entregable = _semillero(aleatorio, semillero_id, grupos)
+            filas["semilleros"].append(semillero)
+            filas["semillero_objetivos"] += objetivos
+            filas["investigadores"] += investigadores
+            if entregable:
+                filas["entregables"].append(entregable)
+
+        # Objetivos e investigadores antes que sus semilleros, como en ImportacionService: el índice
+        # de búsqueda de cada semillero se construye una sola vez al insertarlo
+        with db.transaction():
+            db.consulta_varias("semillero_objetivos.insertar", filas["semillero_objetivos"])
+            db.consulta_varias("investigadores.insertar", filas["investigadores"])
+            db.execute_many("INSERT INTO semilleros (id, nombre, objetivo_principal, grupo_id, status) "
+                            "VALUES (?, ?, ?, ?, ?)", filas["semilleros"])
+            db.consulta_varias("entregables.insertar", filas["entregables"])
+
+        for tabla, nuevas in filas.items():
+            totales[tabla] += len(nuevas)
+        if progreso:
+            progreso(totales["semilleros"])
+
+    return totales
+
+
+def registros(semilleros, grupos, semilla=42):
+    """Semilleros sintéticos como registros de importación (el formato JSON Lines de ImportacionService)
+
+    Con la misma semilla los datos son los mismos que inserta generar().
+
+    Args:
+        semilleros (int): Número de registros
+        grupos (list): IDs de grupo entre los que elegir
+        semilla (int): Semilla del generador aleatorio
+
+    Yields:
+        dict: Un registro por semillero
+    """
+    aleatorio = random.Random(semilla)
+    for semillero_id in range(1, semilleros + 1):
+        semillero, objetivos, investigadores, entregable = _semillero(aleatorio, semillero_id, grupos)
+        registro = {
+            "nombre": semillero[1], "objetivo_principal": semillero[2], "grupo_id": semillero[3],
+            "status": semillero[4], "objetivos_especificos": [objetivo for _, _, objetivo in objetivos],
+            "estudiantes": [{"nombre": nombre, "email": email}
+                            for nombre, tipo, email, _ in investigadores if tipo == "estudiante"],
+            "tutores": [{"nombre": nombre, "email": email}
+                        for nombre, tipo, email, _ in investigadores if tipo == "tutor"],
+        }
+        if entregable:
+            titulo, descripcion, tipo, _, fecha, estado = entregable
+            registro["entregable"] = {"titulo": titulo, "descripcion": descripcion, "tipo": tipo,
+                                      "fecha_entrega": fecha, "estado": estado}
+        yield registro
+
+
+def main():
+    from db.database import Database
+    from services.grupo_service import GrupoService
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--semilleros", type=int, default=10000)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--salida", required=True, help="archivo SQLite a crear")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    with Database(args.salida) as db:
+        GrupoService(db).cargar_datos_iniciales()
+        totales = generar(db, args.semilleros, args.semilla,
+                          progreso=lambda hechos: print(f"\r{hechos} semilleros", end="", flush=True))
+    print(f"\n{totales} en {time.perf_counter() - inicio:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
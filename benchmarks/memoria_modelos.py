@@ -0,0 +1,71 @@
+"""Mide los bytes por fila de las distintas representaciones de semilleros
+
+Uso:
+    python -m benchmarks.memoria_modelos [--filas N]
+"""
+import argparse
+import tracemalloc
+
+from models.resultados import ConjuntoResultados
+from models.semillero import Semillero, SemilleroResumen
+
+
+class SemilleroConDict:
+    """Semillero con __dict__ y listas creadas siempre, como antes de usar __slots__"""
+
+    def __init__(self, id=None, nombre="", objetivo_principal="", objetivos_especificos=None,
+                 grupo_id=None, status="pendiente"):
+        self.id = id
+        self.nombre = nombre
+        self.objetivo_principal = objetivo_principal
+        self.objetivos_especificos = objetivos_especificos or []
+        self.grupo_id = grupo_id
+        self.status = status
+        self.estudiantes = []
+        self.tutores = []
+        self.grupo_nombre = None
+
+
+def _filas(n):
+    """Filas sintéticas con cadenas distintas, como las devuelve SQLite"""
+    return [(i, f"Semillero {i}", "pendiente" if i % 2 else "activo", f"Grupo {i % 8}") for i in range(n)]
+
+
+def _bytes_por_fila(construir, n):
+    filas = _filas(n)
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    resultado = construir(filas)
+    fin = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del resultado
+    return (fin - inicio) / n
+
+
+def medir(n):
+    """Devuelve un diccionario representación -> bytes por fila"""
+    return {
+        "Semillero con __dict__ (antes)": _bytes_por_fila(
+            lambda filas: [SemilleroConDict(id=f[0], nombre=f[1], status=f[2]) for f in filas], n),
+        "Semillero con __slots__": _bytes_por_fila(
+            lambda filas: [Semillero(id=f[0], nombre=f[1], status=f[2]) for f in filas], n),
+        "Lista de SemilleroResumen": _bytes_por_fila(
+            lambda filas: [SemilleroResumen(*f) for f in filas], n),
+        "ConjuntoResultados (columnar)": _bytes_por_fila(
+            lambda filas: ConjuntoResultados.desde_filas(SemilleroResumen._fields, filas, SemilleroResumen,
+                                                         tipos={"id": "q"}), n),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filas", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"Bytes por fila con {args.filas} filas (sin contar las cadenas leídas de la base de datos):")
+    for nombre, valor in medir(args.filas).items():
+        print(f"  {nombre:<35} {valor:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,627 @@
+"""Mide todos los métodos públicos de los servicios sobre datos sintéticos
+
+Crea una base temporal con benchmarks.datos_sinteticos (o copia una ya
+generada con --datos) y ejecuta cada caso repetidamente durante --tiempo
+segundos. Por caso guarda en JSON la latencia (p50, p95, p99, media y
+máximo), las consultas SQL por llamada y el pico de memoria de una llamada.
+Con --base compara el resultado con uno guardado anteriormente y termina
+con código 1 si algún caso empeora más de lo tolerado.
+
+Los casos que escriben o borran van después de los de lectura, y los que
+destruyen historial (archivar, compactar) al final, para que no alteren la
+medición de los demás.
+
+Uso:
+    python -m benchmarks.servicios [--semilleros N] [--datos ARCHIVO.db] [--casos PATRON ...]
+                                   [--salida resultados.json] [--base base.json] [--tolerancia 0.2]
+"""
+import argparse
+import fnmatch
+import inspect
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.datos_sinteticos import APELLIDOS, TEMAS, generar, registros
+from db.database import Database
+from models.entregable import Entregable
+from models.grupo import Grupo
+from models.semillero import Semillero
+from services.actividad_service import ActividadService, como_actor
+from services.cambios_service import CambiosService
+from services.entregable_service import EntregableService
+from services.exportacion_service import ExportacionService
+from services.grupo_service import GrupoService
+from services.importacion_service import ImportacionService
+from services.reports import ReporteService
+from services.semillero_service import SemilleroService
+
+
+SERVICIOS = (GrupoService, SemilleroService, EntregableService, ReporteService,
+             ActividadService, CambiosService, ExportacionService, ImportacionService)
+
+# Métodos públicos que no se miden, con el motivo
+EXCLUIDOS = {
+    "CambiosService.compactar_cada": "sólo arranca un hilo; su trabajo es CambiosService.compactar",
+}
+
+ACTORES = ["coordinador", "tutor", "api:127.0.0.1"]
+
+# Caso -> función que recibe el Contexto y devuelve la llamada a medir, que recibe el número de iteración
+CASOS = {}
+
+
+def caso(nombre):
+    def registrar(preparar):
+        CASOS[nombre] = preparar
+        return preparar
+    return registrar
+
+
+class Contexto:
+    """Base de datos y servicios compartidos por los casos"""
+
+    def __init__(self, db, semilleros, semilla, directorio, iteraciones):
+        self.db = db
+        self.semilleros = semilleros
+        self.directorio = directorio
+        # Llamadas que hará cada caso como mucho (las medidas y la de memoria)
+        self.iteraciones = iteraciones
+        self.semilla = semilla
+        self.aleatorio = random.Random(semilla)
+        # Intervalo largo: las escrituras de actividad ocurren dentro de las operaciones medidas
+        self.actividad = ActividadService(db, intervalo=3600)
+        self.grupos = GrupoService(db)
+        self.entregables = EntregableService(db, self.actividad)
+        self.semilleros_service = SemilleroService(db, self.grupos, self.entregables, self.actividad)
+        self.reportes = ReporteService(db)
+        self.cambios = CambiosService(db)
+        self.grupo_ids = [fila['id'] for fila in db.execute_query("SELECT id FROM grupos_investigacion",
+                                                                   fetch='all')]
+
+    def semillero_id(self):
+        return self.aleatorio.randint(1, self.semilleros)
+
+    def ids(self, consulta, cantidad):
+        """IDs devueltos por una consulta, repetidos hasta llegar a cantidad"""
+        encontrados = [fila[0] for fila in self.db.execute_query(consulta, (cantidad,), fetch='all')]
+        return list(itertools.islice(itertools.cycle(encontrados), cantidad)) if encontrados else []
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio, nombre)
+
+
+def _nuevo_semillero(ctx, i):
+    semillero = Semillero(nombre=f"Benchmark {i}", objetivo_principal="Objetivo del benchmark",
+                          objetivos_especificos=["Primer objetivo", "Segundo objetivo"],
+                          grupo_id=ctx.aleatorio.choice(ctx.grupo_ids))
+    semillero.estudiantes = [{"nombre": f"Estudiante {i}-{j}", "email": f"b{i}.{j}@ean.edu.co"} for j in range(3)]
+    semillero.tutores = [{"nombre": f"Tutor {i}", "email": f"t{i}@ean.edu.co"}]
+    return semillero
+
+
+def _recorrer(listar, **kwargs):
+    """Llamada que pide páginas consecutivas y vuelve a la primera al terminar"""
+    cursor = [None]
+
+    def siguiente(i):
+        pagina = listar(despues=cursor[0], **kwargs)
+        cursor[0] = pagina.siguiente
+    return siguiente
+
+
+# --- GrupoService ---
+
+@caso("GrupoService.obtener_todos")
+def _(ctx):
+    return lambda i: ctx.grupos.obtener_todos()
+
+
+@caso("GrupoService.obtener_por_id")
+def _(ctx):
+    return lambda i: ctx.grupos.obtener_por_id(ctx.aleatorio.choice(ctx.grupo_ids))
+
+
+@caso("GrupoService.listar_pagina")
+def _(ctx):
+    return _recorrer(ctx.grupos.listar_pagina, tamano=3)
+
+
+@caso("GrupoService.estadisticas_cache")
+def _(ctx):
+    return lambda i: ctx.grupos.estadisticas_cache()
+
+
+@caso("GrupoService.obtener_lineas_investigacion")
+def _(ctx):
+    return lambda i: ctx.grupos.obtener_lineas_investigacion(ctx.aleatorio.choice(ctx.grupo_ids))
+
+
+@caso("GrupoService.cargar_datos_iniciales")
+def _(ctx):
+    return lambda i: ctx.grupos.cargar_datos_iniciales()
+
+
+# --- SemilleroService ---
+
+@caso("SemilleroService.obtener_todos")
+def _(ctx):
+    return lambda i: ctx.semilleros_service.obtener_todos()
+
+
+@caso("SemilleroService.listar_resumen")
+def _(ctx):
+    return lambda i: ctx.semilleros_service.listar_resumen(ctx.aleatorio.choice(ctx.grupo_ids))
+
+
+@caso("SemilleroService.listar_pagina")
+def _(ctx):
+    return _recorrer(ctx.semilleros_service.listar_pagina)
+
+
+@caso("SemilleroService.buscar")
+def _(ctx):
+    palabras = APELLIDOS + [tema.split()[0] for tema in TEMAS]
+    return lambda i: ctx.semilleros_service.buscar(ctx.aleatorio.choice(palabras))
+
+
+@caso("SemilleroService.obtener_por_id")
+def _(ctx):
+    return lambda i: ctx.semilleros_service.obtener_por_id(ctx.semillero_id(), prefetch=SemilleroService.RELACIONES)
+
+
+@caso("SemilleroService.obtener_por_grupo")
+def _(ctx):
+    return lambda i: ctx.semilleros_service.obtener_por_grupo(ctx.aleatorio.choice(ctx.grupo_ids))
+
+
+@caso("SemilleroService.precargar")
+def _(ctx):
+    def precargar(i):
+        semilleros = [Semillero(id=ctx.semillero_id()) for _ in range(50)]
+        ctx.semilleros_service.precargar(semilleros, SemilleroService.RELACIONES)
+    return precargar
+
+
+# --- EntregableService ---
+
+@caso("EntregableService.obtener_por_semillero")
+def _(ctx):
+    return lambda i: ctx.entregables.obtener_por_semillero(ctx.semillero_id())
+
+
+@caso("EntregableService.obtener_por_semilleros")
+def _(ctx):
+    return lambda i: ctx.entregables.obtener_por_semilleros([ctx.semillero_id() for _ in range(100)])
+
+
+@caso("EntregableService.transiciones")
+def _(ctx):
+    return lambda i: ctx.entregables.transiciones()
+
+
+@caso("EntregableService.cola_revision")
+def _(ctx):
+    return _recorrer(ctx.entregables.cola_revision)
+
+
+# --- ReporteService (con una caché nueva en cada llamada, para medir la consulta) ---
+
+def _reporte(metodo, *args, **kwargs):
+    def preparar(ctx):
+        return lambda i: getattr(ReporteService(ctx.db), metodo)(*args, **kwargs)
+    return preparar
+
+
+for _metodo in ("semilleros_por_grupo", "semilleros_por_status", "proporcion_activos_pendientes",
+                "entregables_por_tipo_y_estado", "entregables_por_estado", "reportes_estandar",
+                "total_semilleros", "total_entregables", "verificar_contadores"):
+    caso(f"ReporteService.{_metodo}")(_reporte(_metodo))
+caso("ReporteService.investigadores_por_semillero")(_reporte("investigadores_por_semillero", limite=20))
+
+
+# --- ActividadService (lecturas) ---
+
+@caso("ActividadService.por_semillero")
+def _(ctx):
+    return lambda i: ctx.actividad.por_semillero(ctx.semillero_id())
+
+
+@caso("ActividadService.por_actor")
+def _(ctx):
+    return lambda i: ctx.actividad.por_actor(ctx.aleatorio.choice(ACTORES))
+
+
+@caso("ActividadService.entre_fechas")
+def _(ctx):
+    return lambda i: ctx.actividad.entre_fechas(desde="2000-01-01")
+
+
+@caso("ActividadService.compartido")
+def _(ctx):
+    return lambda i: ActividadService.compartido(ctx.db)
+
+
+# --- CambiosService (lecturas) ---
+
+@caso("CambiosService.ultimo_seq")
+def _(ctx):
+    return lambda i: ctx.cambios.ultimo_seq()
+
+
+@caso("CambiosService.cambios_desde")
+def _(ctx):
+    ultimo = ctx.cambios.ultimo_seq()
+    return lambda i: ctx.cambios.cambios_desde(ctx.aleatorio.randint(0, ultimo), 100)
+
+
+@caso("CambiosService.seguir")
+def _(ctx):
+    # Sólo lo ya registrado: se toman 100 cambios desde un punto con al menos 100 posteriores
+    ultimo = ctx.cambios.ultimo_seq()
+    return lambda i: list(itertools.islice(
+        ctx.cambios.seguir(ctx.aleatorio.randint(0, max(ultimo - 100, 0)), limite=100), min(ultimo, 100)))
+
+
+@caso("CambiosService.exportar_jsonl")
+def _(ctx):
+    # Cada llamada exporta a un directorio que ya contiene todo salvo los últimos 1000 cambios
+    def exportar(i):
+        directorio = ctx.ruta(f"cambios-{i}")
+        os.makedirs(directorio)
+        ultimo = ctx.cambios.ultimo_seq()
+        open(os.path.join(directorio, f"cambios-{1:012d}-{max(ultimo - 1000, 0):012d}.jsonl"), "w").close()
+        ctx.cambios.exportar_jsonl(directorio)
+    return exportar
+
+
+# --- Exportación e importación ---
+
+@caso("ExportacionService.exportar")
+def _(ctx):
+    servicio = ExportacionService(ctx.db)
+    return lambda i: servicio.exportar(ctx.ruta(f"exportacion-{i}"), formato="jsonl")
+
+
+@caso("ImportacionService.importar")
+def _(ctx):
+    ruta = ctx.ruta("importacion.jsonl")
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for i in range(100):
+            archivo.write(json.dumps({
+                "nombre": f"Importado {i}", "objetivo_principal": "Objetivo importado",
+                "objetivos_especificos": ["Uno", "Dos"], "grupo_id": ctx.grupo_ids[i % len(ctx.grupo_ids)],
+                "estudiantes": [{"nombre": f"Estudiante {i}-{j}", "email": ""} for j in range(3)],
+                "tutores": [{"nombre": f"Tutor {i}", "email": ""}],
+                "entregable": {"titulo": f"Entregable {i}", "descripcion": "Importado",
+                               "tipo": Entregable.TIPOS_VALIDOS[i % len(Entregable.TIPOS_VALIDOS)]},
+            }, ensure_ascii=False) + "\n")
+    servicio = ImportacionService(ctx.db)
+    return lambda i: servicio.importar(ruta, reanudar=False)
+
+
+# --- Escrituras ---
+
+@caso("GrupoService.crear_grupo")
+def _(ctx):
+    return lambda i: ctx.grupos.crear_grupo(Grupo(nombre=f"Grupo benchmark {i}", campo="Benchmark",
+                                                  identificador=f"BENCH{i:06d}", director="Director"))
+
+
+@caso("SemilleroService.crear_semillero")
+def _(ctx):
+    return lambda i: ctx.semilleros_service.crear_semillero(_nuevo_semillero(ctx, i))
+
+
+@caso("SemilleroService.cambiar_status")
+def _(ctx):
+    return lambda i: ctx.semilleros_service.cambiar_status(ctx.semillero_id(), ("activo", "pendiente")[i % 2])
+
+
+@caso("EntregableService.crear_entregable")
+def _(ctx):
+    libres = ctx.ids("SELECT id FROM semilleros WHERE id NOT IN (SELECT semillero_id FROM entregables) "
+                     "ORDER BY id LIMIT ?", ctx.iteraciones)
+    return lambda i: ctx.entregables.crear_entregable(Entregable(
+        titulo=f"Entregable benchmark {i}", descripcion="Creado por el benchmark",
+        tipo=Entregable.TIPOS_VALIDOS[i % len(Entregable.TIPOS_VALIDOS)], semillero_id=libres[i]))
+
+
+@caso("EntregableService.cambiar_estado")
+def _(ctx):
+    # Cada entregable pendiente se aprueba y vuelve a pendiente en la llamada siguiente
+    pendientes = ctx.ids("SELECT id FROM entregables WHERE estado = 'pendiente' ORDER BY id LIMIT ?",
+                         ctx.iteraciones // 2 + 1)
+    return lambda i: ctx.entregables.cambiar_estado(pendientes[i // 2], ("aprobado", "pendiente")[i % 2])
+
+
+@caso("EntregableService.cambiar_estado_lote")
+def _(ctx):
+    pendientes = ctx.ids("SELECT id FROM entregables WHERE estado = 'pendiente' ORDER BY id LIMIT ?", 100)
+    return lambda i: ctx.entregables.cambiar_estado_lote(("aprobado", "pendiente")[i % 2], ids=pendientes)
+
+
+@caso("ReporteService.reconstruir_contadores")
+def _(ctx):
+    return lambda i: ctx.reportes.reconstruir_contadores()
+
+
+@caso("ActividadService.registrar")
+def _(ctx):
+    return lambda i: ctx.actividad.registrar("benchmark", "semillero", i, ctx.semillero_id(), {"iteracion": i})
+
+
+@caso("ActividadService.vaciar")
+def _(ctx):
+    def vaciar(i):
+        for j in range(50):
+            ctx.actividad.registrar("benchmark", "semillero", j, ctx.semillero_id())
+        ctx.actividad.vaciar()
+    return vaciar
+
+
+@caso("ActividadService.cerrar")
+def _(ctx):
+    def cerrar(i):
+        servicio = ActividadService(ctx.db, intervalo=3600)
+        servicio.registrar("benchmark", "semillero", i, ctx.semillero_id())
+        servicio.cerrar()
+    return cerrar
+
+
+# --- Destructivos: borran historial ---
+
+@caso("ActividadService.archivar")
+def _(ctx):
+    def archivar(i):
+        ctx.actividad.registrar("benchmark", "semillero", i, ctx.semillero_id())
+        ctx.actividad.archivar(_despues_de_ahora(), ctx.ruta("actividad"))
+    return archivar
+
+
+@caso("ActividadService.archivar_dias")
+def _(ctx):
+    def archivar_dias(i):
+        ctx.actividad.registrar("benchmark", "semillero", i, ctx.semillero_id())
+        ctx.actividad.archivar_dias(0, ctx.ruta("actividad"))
+    return archivar_dias
+
+
+@caso("ActividadService.leer_archivo")
+def _(ctx):
+    _sembrar_actividad(ctx)
+    ruta = ctx.actividad.archivar(_despues_de_ahora(), ctx.ruta("actividad-leer"))
+    return lambda i: sum(1 for _ in ActividadService.leer_archivo(ruta))
+
+
+@caso("CambiosService.compactar")
+def _(ctx):
+    # Cada llamada cambia algunas filas y compacta todo el registro
+    def compactar(i):
+        for _ in range(10):
+            ctx.semilleros_service.cambiar_status(ctx.semillero_id(), ("activo", "pendiente")[i % 2])
+        ctx.cambios.compactar(dias=0)
+    return compactar
+
+
+# Al final: cada llamada añade tantos semilleros como tiene la base y no debe alterar otros casos
+@caso("ImportacionService.importar[masiva]")
+def _(ctx):
+    # Importación del tamaño de la base medida (con --semilleros 10000, unos 65.000 investigadores):
+    # a esta escala pesan los triggers por fila, que un archivo de 100 registros no deja ver
+    ruta = ctx.ruta("importacion-masiva.jsonl")
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for registro in registros(ctx.semilleros, ctx.grupo_ids, ctx.semilla):
+            archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    servicio = ImportacionService(ctx.db)
+    return lambda i: servicio.importar(ruta, reanudar=False)
+
+
+def _despues_de_ahora():
+    """Límite de archivar() que incluye lo registrado en este mismo milisegundo"""
+    return datetime.now(timezone.utc) + timedelta(seconds=1)
+
+
+def _sembrar_actividad(ctx, cantidad=None):
+    """Registra actividad de varios actores sobre semilleros al azar"""
+    cantidad = cantidad or min(ctx.semilleros, 10000)
+    for i in range(cantidad):
+        with como_actor(ACTORES[i % len(ACTORES)]):
+            ctx.actividad.registrar("benchmark", "semillero", i, ctx.semillero_id())
+    ctx.actividad.vaciar()
+
+
+def metodos_publicos():
+    """Nombres 'Clase.metodo' de los métodos públicos de SERVICIOS (sin propiedades)"""
+    return sorted(f"{clase.__name__}.{nombre}" for clase in SERVICIOS
+                  for nombre, miembro in vars(clase).items()
+                  if not nombre.startswith("_") and (inspect.isfunction(miembro)
+                                                     or isinstance(miembro, (classmethod, staticmethod))))
+
+
+def _percentil(ordenadas, p):
+    return ordenadas[max(math.ceil(p * len(ordenadas)) - 1, 0)]
+
+
+def medir(ctx, nombre, tiempo=0.5, max_iteraciones=200):
+    """Ejecuta un caso hasta agotar el tiempo o las iteraciones y resume sus mediciones
+
+    La memoria se mide en una llamada adicional con tracemalloc activo, que
+    no cuenta para las latencias.
+
+    Returns:
+        dict: Iteraciones, latencias en milisegundos, consultas por llamada y pico de memoria en KB
+    """
+    # Cada caso elige los mismos datos aunque los anteriores hayan hecho otro número de iteraciones
+    ctx.aleatorio.seed(f"{ctx.semilla}:{nombre}")
+    llamada = CASOS[nombre](ctx)
+    latencias, consultas = [], []
+    limite = time.perf_counter() + tiempo
+    while len(latencias) < max_iteraciones and (not latencias or time.perf_counter() < limite):
+        with ctx.db.metricas.traza(nombre) as traza:
+            inicio = time.perf_counter()
+            llamada(len(latencias))
+            latencias.append(time.perf_counter() - inicio)
+        consultas.append(len(traza.consultas))
+
+    tracemalloc.start()
+    try:
+        llamada(len(latencias))
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    ordenadas = sorted(segundos * 1000 for segundos in latencias)
+    return {
+        "iteraciones": len(latencias),
+        "p50_ms": round(_percentil(ordenadas, 0.50), 4),
+        "p95_ms": round(_percentil(ordenadas, 0.95), 4),
+        "p99_ms": round(_percentil(ordenadas, 0.99), 4),
+        "media_ms": round(statistics.fmean(ordenadas), 4),
+        "max_ms": round(ordenadas[-1], 4),
+        "consultas": statistics.median_low(consultas),
+        "memoria_pico_kb": round(pico / 1024, 1),
+    }
+
+
+def ejecutar(db, semilleros, semilla=42, casos=None, tiempo=0.5, max_iteraciones=200, directorio=None,
+             progreso=None):
+    """Mide los casos indicados (todos por defecto) sobre una base ya poblada con generar()
+
+    Args:
+        db (Database): Base con los semilleros sintéticos; los casos de escritura la modifican
+        semilleros (int): Semilleros generados en db
+        semilla (int): Semilla de las elecciones al azar de los casos
+        casos (list, optional): Patrones fnmatch de los casos a medir
+        tiempo (float): Segundos por caso
+        max_iteraciones (int): Llamadas medidas por caso como máximo
+        directorio (str, optional): Carpeta para los archivos de los casos; por defecto una temporal
+        progreso (callable, optional): Función llamada con el nombre y el resultado de cada caso
+
+    Returns:
+        dict: meta (escala y entorno) y casos (nombre -> mediciones)
+    """
+    seleccionados = [nombre for nombre in CASOS
+                     if not casos or any(fnmatch.fnmatchcase(nombre, patron) for patron in casos)]
+
+    with tempfile.TemporaryDirectory() as temporal:
+        ctx = Contexto(db, semilleros, semilla, directorio or temporal, max_iteraciones + 1)
+        _sembrar_actividad(ctx)
+        resultados = {}
+        for nombre in seleccionados:
+            resultados[nombre] = medir(ctx, nombre, tiempo, max_iteraciones)
+            if progreso:
+                progreso(nombre, resultados[nombre])
+        ctx.actividad.cerrar()
+
+    return {
+        "meta": {
+            "semilleros": semilleros,
+            "semilla": semilla,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "casos": resultados,
+    }
+
+
+def comparar(resultados, base, tolerancia=0.2, margen_ms=0.05, margen_kb=16):
+    """Casos que han empeorado respecto a una ejecución anterior
+
+    Una latencia (p50 o p95) o un pico de memoria empeoran si superan el de
+    la base en más de tolerancia (proporción) y además en más del margen
+    absoluto, para no avisar por ruido en operaciones de microsegundos. Las
+    consultas por llamada no tienen ruido: cualquier aumento cuenta.
+
+    Args:
+        resultados (dict): Resultado de ejecutar()
+        base (dict): Resultado guardado de una ejecución anterior
+        tolerancia (float): Empeoramiento relativo permitido
+
+    Returns:
+        list: Descripción de cada empeoramiento; vacía si no hay ninguno
+
+    Raises:
+        ValueError: Si las dos ejecuciones no usan el mismo número de semilleros
+    """
+    if resultados["meta"]["semilleros"] != base["meta"]["semilleros"]:
+        raise ValueError(f"La base se midió con {base['meta']['semilleros']} semilleros "
+                         f"y estos resultados con {resultados['meta']['semilleros']}")
+
+    regresiones = []
+    for nombre, actual in resultados["casos"].items():
+        anterior = base["casos"].get(nombre)
+        if anterior is None:
+            continue
+
+        for metrica, margen in (("p50_ms", margen_ms), ("p95_ms", margen_ms), ("memoria_pico_kb", margen_kb)):
+            if actual[metrica] > anterior[metrica] * (1 + tolerancia) + margen:
+                aumento = (actual[metrica] / anterior[metrica] - 1) * 100 if anterior[metrica] else math.inf
+                regresiones.append(f"{nombre}: {metrica} {anterior[metrica]} -> {actual[metrica]} (+{aumento:.0f} %)")
+        if actual["consultas"] > anterior["consultas"]:
+            regresiones.append(f"{nombre}: consultas {anterior['consultas']} -> {actual['consultas']}")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--semilleros", type=int, default=10000)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--datos", help="base creada con benchmarks.datos_sinteticos (se copia; no se modifica)")
+    parser.add_argument("--casos", nargs="+", help="patrones de los casos a medir, p. ej. 'SemilleroService.*'")
+    parser.add_argument("--tiempo", type=float, default=0.5, help="segundos por caso")
+    parser.add_argument("--max-iteraciones", type=int, default=200)
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--base", help="resultados JSON anteriores con los que comparar")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "benchmark.db")
+        if args.datos:
+            shutil.copyfile(args.datos, ruta)
+        with Database(ruta) as db:
+            if args.datos:
+                semilleros = db.execute_query("SELECT MAX(id) FROM semilleros", fetch='one')[0]
+            else:
+                GrupoService(db).cargar_datos_iniciales()
+                inicio = time.perf_counter()
+                generar(db, args.semilleros, args.semilla)
+                semilleros = args.semilleros
+                print(f"{semilleros} semilleros generados en {time.perf_counter() - inicio:.1f} s")
+
+            print(f"{'Caso':<48} {'iter':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'consultas':>9} {'KB':>9}")
+            resultados = ejecutar(db, semilleros, args.semilla, args.casos, args.tiempo, args.max_iteraciones,
+                                  progreso=lambda nombre, r: print(
+                                      f"{nombre:<48} {r['iteraciones']:>6} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} "
+                                      f"{r['p99_ms']:>9.3f} {r['consultas']:>9} {r['memoria_pico_kb']:>9.1f}"))
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            regresiones = comparar(resultados, json.load(archivo), args.tolerancia)
+        if regresiones:
+            print(f"\n{len(regresiones)} empeoramientos respecto a {args.base}:")
+            for regresion in regresiones:
+                print(f"  {regresion}")
+            sys.exit(1)
+        print(f"\nSin empeoramientos respecto a {args.base}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""Registro central de las consultas SQL con nombre
+
+Los servicios ejecutan estas consultas por su nombre con
+Database.consulta() y Database.consulta_varias(). Así cada consulta llega a
+SQLite siempre con el mismo texto: el módulo sqlite3 guarda, por conexión,
+las sentencias ya compiladas indexadas por su texto, y como las conexiones
+del pool viven toda la ejecución, cada consulta registrada se compila una
+sola vez por conexión y después se reutiliza.
+
+Tener todas las consultas en un mismo sitio permite además revisar su plan
+de ejecución (Database.revisar_planes) y detectar las que recorren tablas
+enteras por falta de un índice.
+
+Las consultas cuyo texto depende de los argumentos (IN con un número
+variable de IDs, filtros opcionales de la paginación) siguen construyéndose
+en cada servicio.
+"""
+
+import re
+from collections import namedtuple
+
+
+class Consulta(namedtuple("Consulta", ["sql", "recorrido_completo"])):
+    """Consulta registrada
+
+    recorrido_completo indica que la consulta lee a propósito toda la tabla
+    (listados completos y reportes agregados), por lo que su SCAN no se
+    considera un índice que falta.
+    """
+
+    __slots__ = ()
+
+
+class AdvertenciaPlan(UserWarning):
+    """Una consulta registrada recorre una tabla completa"""
+
+
+CONSULTAS = {}
+
+
+def registrar(nombre, sql, recorrido_completo=False):
+    """Añade una consulta al registro
+
+    Raises:
+        ValueError: Si ya hay una consulta con ese nombre
+    """
+    if nombre in CONSULTAS:
+        raise ValueError(f"Consulta ya registrada: {nombre}")
+    CONSULTAS[nombre] = Consulta(sql, recorrido_completo)
+
+
+def sql(nombre):
+    """Devuelve el texto de una consulta registrada
+
+    Raises:
+        ValueError: Si no hay ninguna consulta con ese nombre
+    """
+    try:
+        return CONSULTAS[nombre].sql
+    except KeyError:
+        raise ValueError(f"Consulta no registrada: {nombre}") from None
+
+
+# Paso del plan que lee todas las filas de una tabla o índice. No cuentan las
+# tablas virtuales (FTS5 decide su propio acceso), las subconsultas ya
+# materializadas ni SCAN CONSTANT ROW.
+_RECORRIDO = re.compile(r"^SCAN (?!CONSTANT ROW)(?!\()(\w+)(?!.*VIRTUAL TABLE)")
+
+
+def recorridos(plan):
+    """Devuelve los pasos de un EXPLAIN QUERY PLAN que recorren una tabla completa
+
+    Args:
+        plan (list): Filas (id, parent, notused, detail) de EXPLAIN QUERY PLAN
+
+    Returns:
+        list: Texto detail de cada paso SCAN
+    """
+    return [fila[3] for fila in plan if _RECORRIDO.match(fila[3])]
+
+
+# --- Grupos de investigación ---
+
+registrar("grupos.insertar", """
+    INSERT INTO grupos_investigacion
+    (nombre, campo, identificador, director)
+    VALUES (?, ?, ?, ?)
+""")
+
+registrar("grupos.todos", """
+    SELECT id, nombre, campo, identificador, director
+    FROM grupos_investigacion
+    ORDER BY nombre
+""", recorrido_completo=True)
+
+registrar("grupos.contar", "SELECT COUNT(*) FROM grupos_investigacion", recorrido_completo=True)
+
+# --- Semilleros ---
+
+registrar("semilleros.insertar", """
+    INSERT INTO semilleros
+    (nombre, objetivo_principal, grupo_id, status)
+    VALUES (?, ?, ?, ?)
+""")
+
+registrar("semilleros.todos", """
+    SELECT s.id, s.nombre, s.objetivo_principal,
+           s.grupo_id, g.nombre as grupo_nombre, s.status
+    FROM semilleros s
+    LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+    ORDER BY s.nombre
+""", recorrido_completo=True)
+
+registrar("semilleros.por_id", """
+    SELECT s.id, s.nombre, s.objetivo_principal,
+           s.grupo_id, s.status, g.nombre as grupo_nombre
+    FROM semilleros s
+    JOIN grupos_investigacion g ON s.grupo_id = g.id
+    WHERE s.id = ?
+""")
+
+registrar("semilleros.por_grupo", """
+    SELECT s.id, s.nombre, s.objetivo_principal,
+           s.grupo_id, s.status, g.nombre as grupo_nombre
+    FROM semilleros s
+    JOIN grupos_investigacion g ON s.grupo_id = g.id
+    WHERE s.grupo_id = ?
+    ORDER BY s.nombre
+""")
+
+registrar("semilleros.buscar", """
+    SELECT s.id, s.nombre, s.status, g.nombre as grupo_nombre
+    FROM semilleros_fts f
+    JOIN semilleros s ON s.id = f.rowid
+    LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+    WHERE semilleros_fts MATCH ?
+    ORDER BY bm25(semilleros_fts, 10.0, 4.0, 1.0), s.nombre
+    LIMIT ?
+""")
+
+# Sin cambio real no hay fila modificada (ni entrada en el registro de actividad)
+registrar("semilleros.cambiar_status", "UPDATE semilleros SET status = ? WHERE id = ? AND status IS NOT ?")
+
+registrar("semilleros.existe", "SELECT 1 FROM semilleros WHERE id = ?")
+
+registrar("semillero_objetivos.insertar", """
+    INSERT INTO semillero_objetivos (semillero_id, orden, objetivo)
+    VALUES (?, ?, ?)
+""")
+
+registrar("investigadores.insertar", """
+    INSERT INTO investigadores
+    (nombre, tipo, email, semillero_id)
+    VALUES (?, ?, ?, ?)
+""")
+
+# --- Entregables ---
+
+registrar("entregables.insertar", """
+    INSERT INTO entregables (titulo, descripcion, tipo, semillero_id, fecha_entrega, estado)
+    VALUES (?, ?, ?, ?, ?, ?)
+""")
+
+registrar("entregables.por_semillero", """
+    SELECT e.*, s.nombre as semillero_nombre
+    FROM entregables e
+    LEFT JOIN semilleros s ON e.semillero_id = s.id
+    WHERE e.semillero_id = ?
+""")
+
+registrar("entregables.estado", "SELECT estado FROM entregables WHERE id = ?")
+
+# Sólo cambia el estado si la transición está permitida; ninguna fila si no
+registrar("entregables.transicion", """
+    UPDATE entregables SET estado = ?
+    WHERE id = ? AND estado IN (SELECT desde FROM transiciones_entregable WHERE hacia = ?)
+    RETURNING semillero_id
+""")
+
+registrar("entregables.transiciones", """
+    SELECT desde, hacia FROM transiciones_entregable ORDER BY desde, hacia
+""", recorrido_completo=True)
+
+# Cola de revisión por (fecha de entrega, id) sobre el índice parcial idx_entregables_pendientes.
+# La condición sobre la fecha sola es redundante, pero sin ella SQLite recorre el
+# índice desde el principio en lugar de saltar a la posición del cursor
+registrar("entregables.pendientes", """
+    SELECT e.*, s.nombre as semillero_nombre
+    FROM entregables e
+    LEFT JOIN semilleros s ON e.semillero_id = s.id
+    WHERE e.estado = 'pendiente' AND COALESCE(e.fecha_entrega, '') >= ?
+      AND (COALESCE(e.fecha_entrega, ''), e.id) > (?, ?)
+    ORDER BY COALESCE(e.fecha_entrega, ''), e.id
+    LIMIT ?
+""")
+
+# --- Reportes ---
+
+# Los recuentos de semilleros y entregables se leen de las tablas de contadores que mantienen
+# los triggers (una fila por grupo y estado, o por tipo y estado) en lugar de recorrer las tablas
+
+registrar("reportes.semilleros_por_grupo", """
+    SELECT g.id AS grupo_id, g.nombre AS grupo,
+           COALESCE(SUM(c.total), 0) AS semilleros,
+           COALESCE(SUM(CASE WHEN c.status = 'activo' THEN c.total END), 0) AS activos,
+           COALESCE(SUM(CASE WHEN c.status = 'pendiente' THEN c.total END), 0) AS pendientes
+    FROM grupos_investigacion g
+    LEFT JOIN contador_semilleros c ON c.grupo_id = g.id
+    GROUP BY g.id
+    ORDER BY g.nombre
+""", recorrido_completo=True)
+
+registrar("reportes.semilleros_por_status", """
+    SELECT status, SUM(total) AS semilleros
+    FROM contador_semilleros
+    GROUP BY status
+    ORDER BY status
+""", recorrido_completo=True)
+
+registrar("reportes.proporcion_activos_pendientes", """
+    SELECT COALESCE(SUM(CASE WHEN status = 'activo' THEN total END), 0) AS activos,
+           COALESCE(SUM(CASE WHEN status = 'pendiente' THEN total END), 0) AS pendientes,
+           ROUND(CAST(SUM(CASE WHEN status = 'activo' THEN total END) AS REAL)
+                 / NULLIF(SUM(CASE WHEN status = 'pendiente' THEN total END), 0), 2) AS proporcion
+    FROM contador_semilleros
+""", recorrido_completo=True)
+
+registrar("reportes.entregables_por_tipo_y_estado", """
+    SELECT tipo, estado, total AS entregables
+    FROM contador_entregables
+    ORDER BY tipo, estado
+""", recorrido_completo=True)
+
+registrar("reportes.entregables_por_estado", """
+    SELECT estado, SUM(total) AS entregables
+    FROM contador_entregables
+    GROUP BY estado
+    ORDER BY estado
+""", recorrido_completo=True)
+
+# LIMIT -1 equivale en SQLite a no poner límite
+registrar("reportes.investigadores_por_semillero", """
+    SELECT s.id AS semillero_id, s.nombre AS semillero,
+           COALESCE(SUM(i.tipo = 'estudiante'), 0) AS estudiantes,
+           COALESCE(SUM(i.tipo = 'tutor'), 0) AS tutores,
+           COUNT(i.id) AS total
+    FROM semilleros s
+    LEFT JOIN investigadores i ON i.semillero_id = s.id
+    GROUP BY s.id
+    ORDER BY s.nombre
+    LIMIT ?
+""", recorrido_completo=True)
+
+# --- Registro de actividad ---
+
+registrar("actividades.insertar", """
+    INSERT INTO actividades (fecha, actor, accion, entidad, entidad_id, semillero_id, detalle)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+""")
+
+# Cada consulta por semillero, actor o fechas lee un tramo de su índice, ya en orden
+registrar("actividades.por_semillero", """
+    SELECT * FROM actividades
+    WHERE semillero_id = ? AND fecha >= ? AND fecha < ?
+    ORDER BY fecha DESC, id DESC
+    LIMIT ?
+""")
+
+registrar("actividades.por_actor", """
+    SELECT * FROM actividades
+    WHERE actor = ? AND fecha >= ? AND fecha < ?
+    ORDER BY fecha DESC, id DESC
+    LIMIT ?
+""")
+
+registrar("actividades.entre_fechas", """
+    SELECT * FROM actividades
+    WHERE fecha >= ? AND fecha < ?
+    ORDER BY fecha DESC, id DESC
+    LIMIT ?
+""")
+
+registrar("actividades.ultima_antes_de", """
+    SELECT id FROM actividades WHERE fecha < ? ORDER BY fecha DESC, id DESC LIMIT 1
+""")
+
+registrar("actividades.archivar", "DELETE FROM actividades WHERE id <= ?")
+
+registrar("actividades_archivadas.insertar", """
+    INSERT INTO actividades_archivadas (archivo, desde_id, hasta_id, filas, creado_en)
+    VALUES (?, ?, ?, ?, ?)
+""")
+
+# --- Registro de cambios (CDC) ---
+
+registrar("cambios.desde", """
+    SELECT seq, tabla, operacion, clave, datos, fecha FROM cambios
+    WHERE seq > ?
+    ORDER BY seq
+    LIMIT ?
+""")
+
+registrar("cambios.ultimo", "SELECT COALESCE(MAX(seq), 0) FROM cambios")
+
+registrar("cambios.ultimo_de_tabla", "SELECT COALESCE(MAX(seq), 0) FROM cambios WHERE tabla = ?")
+
+registrar("cambios.ultimo_antes_de", """
+    SELECT seq FROM cambios WHERE fecha < ? ORDER BY fecha DESC, seq DESC LIMIT 1
+""")
+
+# Se conserva el último cambio de cada fila: quien aplique el registro compactado llega al mismo estado
+registrar("cambios.compactar", """
+    DELETE FROM cambios
+    WHERE seq <= ? AND seq NOT IN (
+        SELECT MAX(seq) FROM cambios WHERE seq <= ? GROUP BY tabla, clave
+    )
+""", recorrido_completo=True)
+
+# --- Contadores ---
+
+# Un filtro a NULL no restringe. Con los dos filtros es una búsqueda por clave primaria; con
+# uno, un recorrido de una tabla con una fila por combinación de valores
+registrar("contadores.semilleros", """
+    SELECT COALESCE(SUM(total), 0) FROM contador_semilleros
+    WHERE (? IS NULL OR grupo_id = ?) AND (? IS NULL OR status = ?)
+""", recorrido_completo=True)
+
+registrar("contadores.entregables", """
+    SELECT COALESCE(SUM(total), 0) FROM contador_entregables
+    WHERE (? IS NULL OR tipo = ?) AND (? IS NULL OR estado = ?)
+""", recorrido_completo=True)
@@ -2,104 +2,366 @@ import sqlite3
 import os
 import json
 import re  # Añadido para usar re.search en el método execute_query
+import threading
+import time
+import warnings
+import weakref
+from contextlib import contextmanager
+
+from db.consultas import CONSULTAS, AdvertenciaPlan, recorridos, sql
+from db.metricas import Metricas, traza_actual
+from db.migraciones import CONTADORES, TABLAS_CON_CAMBIOS, migrar
+from db.perfiles import resolver_perfil
+from db.pool import PoolConexiones
+
+
+# Tabla afectada por una sentencia de escritura (INSERT, REPLACE, UPDATE o DELETE)
+_TABLA_ESCRITURA = re.compile(
+    r'^\s*(?:INSERT|REPLACE|UPDATE|DELETE)\s+(?:OR\s+\w+\s+)?(?:INTO\s+|FROM\s+)?["`\[]?(\w+)',
+    re.IGNORECASE
+)
+
+# Tabla del registro de cambios en la que se anotan las escrituras de cada tabla, vengan de
+# donde vengan (los contadores sólo cambian con los triggers de semilleros y entregables)
+_TABLA_EN_REGISTRO_CAMBIOS = {tabla: tabla for tabla in TABLAS_CON_CAMBIOS}
+_TABLA_EN_REGISTRO_CAMBIOS.update((contador, tabla) for contador, (tabla, _) in CONTADORES.items())
+
+
+def _base_ocupada(error):
+    """Indica si un error de SQLite es SQLITE_BUSY o SQLITE_LOCKED (se puede reintentar)"""
+    codigo = getattr(error, "sqlite_errorcode", None)
+    if codigo is not None:
+        return codigo & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    mensaje = str(error)
+    return "database is locked" in mensaje or "database is busy" in mensaje
 
 
 class Database:
     """Gestión de conexión y operaciones con SQLite"""
 
-    def __init__(self, db_path="db/semilleros.db"):
+    # Reintentos ante SQLITE_BUSY una vez agotado el busy_timeout del perfil
+    REINTENTOS_OCUPADA = 5
+    ESPERA_REINTENTO = 0.05  # segundos; se duplica en cada reintento
+
+    # Cada cuántos commits se comprueba el tamaño del WAL
+    COMMITS_ENTRE_REVISIONES_WAL = 200
+
+    # Hueco en la caché de sentencias de cada conexión, además de las consultas
+    # registradas, para las que se construyen en cada servicio
+    SENTENCIAS_NO_REGISTRADAS = 128
+
+    def __init__(self, db_path="db/semilleros.db", pool_size=5, perfil=None, depurar_consultas=False,
+                 metricas=None):
+        """
+        Args:
+            db_path (str): Ruta del archivo de la base de datos
+            pool_size (int): Conexiones abiertas como máximo a la vez
+            perfil (str | dict, optional): Nombre de un perfil de db.perfiles
+                ('concurrente' por defecto, 'seguro', 'compatible') o diccionario
+                de PRAGMA a aplicar a cada conexión
+            depurar_consultas (bool): Revisar al arrancar el plan de cada consulta
+                registrada y avisar (AdvertenciaPlan) de las que recorren una tabla completa
+            metricas (Metricas, optional): Donde registrar tiempos, filas y contadores;
+                por defecto uno nuevo sin registro de consultas lentas
+        """
         self.db_path = db_path
-        self._crear_estructura()
-        self._verificar_estructura()  # Añadimos verificación adicional
+        self.pragmas = resolver_perfil(perfil)
+        self.metricas = metricas or Metricas()
+        # Las conexiones se reutilizan entre consultas en lugar de abrir una por llamada, y
+        # cada una guarda compiladas todas las consultas registradas
+        self.pool = PoolConexiones(db_path, tamano=pool_size, pragmas=self.pragmas,
+                                   sentencias_en_cache=len(CONSULTAS) + self.SENTENCIAS_NO_REGISTRADAS,
+                                   metricas=self.metricas)
+        self._commits = 0
+        # Conexión de la transacción abierta por cada hilo con transaction()
+        self._local = threading.local()
+        # Contador de escrituras confirmadas por tabla, usado para invalidar cachés
+        self._versiones = {}
+        self._versiones_lock = threading.Lock()
+        # Último seq de cada tabla en el registro de cambios, leído una vez por traza
+        self._versiones_externas = weakref.WeakKeyDictionary()
+        # Funciones a ejecutar en close() antes de cerrar el pool
+        self._al_cerrar = []
+        # Versiones del esquema aplicadas durante este arranque
+        self.migraciones_aplicadas = self._migrar()
+
+        if depurar_consultas:
+            for nombre, pasos in self.revisar_planes().items():
+                warnings.warn(f"La consulta '{nombre}' recorre tablas completas: {'; '.join(pasos)}",
+                              AdvertenciaPlan, stacklevel=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Cierra todas las conexiones abiertas por la base de datos"""
+        while self._al_cerrar:
+            self._al_cerrar.pop()()
+        self.pool.cerrar()
+
+    def al_cerrar(self, funcion):
+        """Registra una función sin argumentos que close() ejecutará antes de cerrar las conexiones
+
+        Las funciones se ejecutan en orden inverso al de registro, una sola vez.
+        """
+        self._al_cerrar.append(funcion)
 
-    def _crear_estructura(self):
-        """Crea la estructura de la base de datos si no existe"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def al_confirmar(self, funcion):
+        """Registra una función sin argumentos que se ejecutará tras el commit de la transacción de este hilo
 
-        # Tabla de grupos de investigación
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS grupos_investigacion (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            facultad TEXT,
-            area_conocimiento TEXT
-        )
-        ''')
-
-        # Tabla de semilleros
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS semilleros (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            objetivo_principal TEXT,
-            objetivos_especificos TEXT,
-            grupo_id INTEGER,
-            status TEXT DEFAULT 'pendiente',
-            FOREIGN KEY (grupo_id) REFERENCES grupos_investigacion(id)
-        )
-        ''')
-
-        # Tabla de investigadores
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS investigadores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            nombre TEXT NOT NULL,
-            tipo TEXT NOT NULL,
-            identificacion TEXT,
-            programa TEXT,
-            email TEXT
-        )
-        ''')
-
-        # Tabla de relación entre semilleros e investigadores
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS semillero_investigador (
-            semillero_id INTEGER,
-            investigador_id INTEGER,
-            rol TEXT,
-            PRIMARY KEY (semillero_id, investigador_id),
-            FOREIGN KEY (semillero_id) REFERENCES semilleros(id),
-            FOREIGN KEY (investigador_id) REFERENCES investigadores(id)
-        )
-        ''')
-
-        # Tabla de entregables
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS entregables (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            titulo TEXT NOT NULL,
-            descripcion TEXT,
-            tipo TEXT NOT NULL,
-            semillero_id INTEGER NOT NULL,
-            fecha_entrega TEXT,
-            estado TEXT DEFAULT 'pendiente',
-            FOREIGN KEY (semillero_id) REFERENCES semilleros(id)
-        )
-        ''')
-
-        conn.commit()
-        conn.close()
-
-    def _verificar_estructura(self):
-        """Verifica y actualiza la estructura de la base de datos si es necesario"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        Se ejecuta con la conexión ya devuelta al pool, una sola vez aunque se
+        registre varias veces, y se descarta si la transacción se deshace.
+        Fuera de transaction() se ejecuta en el momento.
+        """
+        if self._transaccion_actual() is None:
+            funcion()
+        elif funcion not in self._local.al_confirmar:
+            self._local.al_confirmar.append(funcion)
+
+    def _transaccion_actual(self):
+        """Devuelve la conexión de la transacción abierta en este hilo, si existe"""
+        return getattr(self._local, "conexion", None)
+
+    @contextmanager
+    def _conexion(self):
+        """Presta una conexión del pool durante el bloque with
+
+        Dentro de transaction() se reutiliza la conexión de la transacción.
+        """
+        conn = self._transaccion_actual()
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self.pool.obtener()
+        fallo = False
+        try:
+            yield conn
+        except sqlite3.Error:
+            fallo = True
+            raise
+        finally:
+            self.pool.liberar(conn, fallo)
 
-        # Verificar si existe la columna objetivo_principal en la tabla semilleros
-        cursor.execute("PRAGMA table_info(semilleros)")
-        columnas = [info[1] for info in cursor.fetchall()]
+    def _confirmar(self, conn, query):
+        """Hace commit salvo que la sentencia forme parte de transaction()
 
-        # Si no existe la columna, añadirla
-        if 'objetivo_principal' not in columnas:
+        La tabla modificada se registra para incrementar su versión cuando
+        los cambios queden confirmados.
+        """
+        match = _TABLA_ESCRITURA.match(query)
+        tabla = match.group(1).lower() if match else None
+
+        if self._transaccion_actual() is None:
+            conn.commit()
+            self.metricas.contar("commits")
+            if tabla:
+                self._incrementar_versiones([tabla])
+            self._despues_de_commit(conn)
+        elif tabla:
+            self._local.tablas_modificadas.add(tabla)
+
+    def _con_reintentos(self, funcion):
+        """Ejecuta funcion y la repite con espera creciente si la base está ocupada
+
+        busy_timeout ya hace esperar a SQLite; esto cubre los casos en que
+        devuelve SQLITE_BUSY sin esperar (por ejemplo un lector que intenta
+        escribir sobre una instantánea antigua del WAL) o en que otro proceso
+        retiene el bloqueo más tiempo del previsto. Dentro de transaction() no
+        se reintenta: repetir una sentencia suelta dejaría la transacción a medias.
+        """
+        if self._transaccion_actual() is not None:
+            return funcion()
+
+        espera = self.ESPERA_REINTENTO
+        for intento in range(self.REINTENTOS_OCUPADA + 1):
             try:
-                cursor.execute('ALTER TABLE semilleros ADD COLUMN objetivo_principal TEXT NOT NULL DEFAULT ""')
-                conn.commit()
-                print("Base de datos actualizada: añadida columna objetivo_principal a la tabla semilleros")
-            except sqlite3.Error as e:
-                print(f"Error al actualizar la estructura de la base de datos: {e}")
+                return funcion()
+            except sqlite3.OperationalError as e:
+                if not _base_ocupada(e) or intento == self.REINTENTOS_OCUPADA:
+                    raise
+            self.metricas.contar("reintentos_ocupada")
+            time.sleep(espera)
+            espera *= 2
+
+    def _despues_de_commit(self, conn):
+        """Cuenta los commits y cada cierto número revisa el tamaño del WAL"""
+        with self._versiones_lock:
+            self._commits += 1
+            revisar = self._commits % self.COMMITS_ENTRE_REVISIONES_WAL == 0
+
+        if revisar:
+            self._revisar_wal(conn)
+
+    def _revisar_wal(self, conn):
+        """Fuerza un checkpoint TRUNCATE si el WAL supera journal_size_limit
+
+        Los checkpoints automáticos (wal_autocheckpoint) son pasivos: si
+        siempre hay algún lector activo no pueden reiniciar el WAL y el
+        archivo crece sin límite. Este checkpoint espera a los lectores
+        (como mucho busy_timeout) y deja el WAL vacío.
+        """
+        limite = self.pragmas.get("journal_size_limit")
+        if not limite or str(self.pragmas.get("journal_mode", "")).upper() != "WAL":
+            return
+
+        try:
+            tamano = os.path.getsize(self.db_path + "-wal")
+        except OSError:
+            return
+
+        if tamano > limite:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+
+    def checkpoint(self, modo="PASSIVE"):
+        """Copia el contenido del WAL a la base de datos
+
+        Args:
+            modo (str): 'PASSIVE', 'FULL', 'RESTART' o 'TRUNCATE' (ver PRAGMA wal_checkpoint)
+
+        Returns:
+            tuple: (1 si algún lector o escritor impidió completarlo, páginas en el WAL,
+                páginas copiadas); (0, -1, -1) si la base no está en modo WAL
+        """
+        modo = modo.upper()
+        if modo not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            raise ValueError(f"Modo de checkpoint no válido: {modo}")
+
+        with self._conexion() as conn:
+            return tuple(conn.execute(f"PRAGMA wal_checkpoint({modo})").fetchone())
+
+    def _incrementar_versiones(self, tablas):
+        """Marca como modificadas las tablas indicadas"""
+        with self._versiones_lock:
+            for tabla in tablas:
+                self._versiones[tabla] = self._versiones.get(tabla, 0) + 1
+
+    def version_tablas(self, tablas):
+        """Devuelve la versión actual de las tablas indicadas
+
+        La versión de cada tabla aumenta cada vez que se confirma una escritura
+        hecha con execute_query o execute_many sobre ella. Esos contadores sólo
+        ven las escrituras de este objeto Database, así que para las tablas del
+        registro de cambios se añade el último seq de cada una, que los
+        triggers incrementan con cualquier escritura confirmada por cualquier
+        conexión o proceso. Dos lecturas con la misma versión ven los mismos datos.
+
+        Args:
+            tablas (iterable): Nombres de tabla
 
-        conn.close()
+        Returns:
+            tuple: Versión de cada tabla en el mismo orden y, para las que están en
+                el registro de cambios, su último seq
+        """
+        tablas = tuple(tablas)
+        with self._versiones_lock:
+            versiones = tuple(self._versiones.get(tabla, 0) for tabla in tablas)
+        registradas = sorted({_TABLA_EN_REGISTRO_CAMBIOS[tabla] for tabla in tablas
+                              if tabla in _TABLA_EN_REGISTRO_CAMBIOS})
+        if not registradas:
+            return versiones
+        return versiones + self._ultimos_cambios(registradas)
+
+    def _ultimos_cambios(self, tablas):
+        """Último seq de cada tabla en el registro de cambios
+
+        Dentro de una traza (una opción del menú, una petición HTTP) cada tabla
+        se consulta como mucho una vez y el valor se reutiliza hasta que la
+        operación termina: las escrituras de otros procesos se ven desde la
+        siguiente operación, y las de este Database ya cambian los contadores
+        locales. Fuera de una traza se consulta en cada llamada.
+        """
+        traza = traza_actual()
+        with self._versiones_lock:
+            leidas = dict(self._versiones_externas.get(traza, {})) if traza is not None else {}
+
+        for tabla in tablas:
+            if tabla not in leidas:
+                leidas[tabla] = self.consulta("cambios.ultimo_de_tabla", (tabla,), fetch='one')[0]
+
+        if traza is not None:
+            with self._versiones_lock:
+                self._versiones_externas.setdefault(traza, {}).update(leidas)
+        return tuple(leidas[tabla] for tabla in tablas)
+
+    @contextmanager
+    def transaction(self):
+        """Agrupa varias sentencias en una única transacción con un solo commit
+
+        Todas las llamadas a execute_query/execute_many dentro del bloque usan
+        la misma conexión. Si el bloque lanza una excepción se deshacen todos
+        los cambios. Las transacciones anidadas se unen a la exterior.
+
+        Ejemplo:
+            with db.transaction():
+                db.execute_query(...)
+                db.execute_many(...)
+        """
+        if self._transaccion_actual() is not None:
+            yield
+            return
+
+        al_confirmar = []
+        with self._conexion() as conn:
+            # IMMEDIATE reserva la escritura desde el inicio y evita bloqueos a mitad de la transacción
+            self._con_reintentos(lambda: conn.execute("BEGIN IMMEDIATE"))
+            self._local.conexion = conn
+            self._local.tablas_modificadas = set()
+            self._local.al_confirmar = al_confirmar
+            try:
+                yield
+            except BaseException:
+                conn.rollback()
+                self.metricas.contar("rollbacks")
+                raise
+            else:
+                conn.commit()
+                self.metricas.contar("commits")
+                self._incrementar_versiones(self._local.tablas_modificadas)
+            finally:
+                self._local.conexion = None
+                self._local.tablas_modificadas = None
+                self._local.al_confirmar = None
+
+            self._despues_de_commit(conn)
+
+        for funcion in al_confirmar:
+            funcion()
+
+    @contextmanager
+    def lectura(self):
+        """Agrupa varias lecturas en una transacción diferida con una sola vista de los datos
+
+        BEGIN (DEFERRED) toma la instantánea en la primera lectura y, con
+        WAL, no bloquea a los escritores como lo haría transaction(). Al
+        salir se hace rollback, así que el bloque no debe escribir. Dentro de
+        transaction() se usa la transacción abierta.
+        """
+        if self._transaccion_actual() is not None:
+            yield
+            return
+
+        with self._conexion() as conn:
+            conn.execute("BEGIN")
+            self._local.conexion = conn
+            self._local.tablas_modificadas = set()
+            self._local.al_confirmar = []
+            try:
+                yield
+            finally:
+                conn.rollback()
+                self._local.conexion = None
+                self._local.tablas_modificadas = None
+                self._local.al_confirmar = None
+
+    def _migrar(self):
+        """Lleva el esquema a la versión actual; no ejecuta DDL si ya está al día"""
+        with self._conexion() as conn:
+            return migrar(conn)
 
     def execute_query(self, query, params=None, fetch=None):
         """Ejecuta una consulta SQL y opcionalmente devuelve resultados
@@ -107,14 +369,30 @@ class Database:
                 Args:
                     query (str): Consulta SQL a ejecutar
                     params (tuple, optional): Parámetros para la consulta
-                    fetch (str, optional): Tipo de fetch a realizar ('one', 'all', None)
+                    fetch (str, optional): Tipo de fetch a realizar ('one', 'all', None);
+                        'rowcount' confirma la escritura y devuelve las filas modificadas.
+                        Con 'one' o 'all' una escritura con RETURNING también se confirma
 
                 Returns:
                     Resultados de la consulta según el parámetro fetch
                 """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Para poder acceder por nombre de columna
+        return self._ejecutar_con_reintentos(query, params, fetch, query)
+
+    def _ejecutar_con_reintentos(self, query, params, fetch, etiqueta):
+        def ejecutar():
+            with self._conexion() as conn:
+                return self._ejecutar(conn, query, params, fetch, etiqueta)
+
+        return self._con_reintentos(ejecutar)
+
+    def _ejecutar(self, conn, query, params, fetch, etiqueta):
+        """Ejecuta la consulta sobre una conexión ya obtenida del pool
+
+        etiqueta es el nombre con el que se registra en las métricas (el
+        nombre de la consulta registrada o el propio texto SQL).
+        """
         cursor = conn.cursor()
+        inicio = time.perf_counter()
 
         try:
             if params:
@@ -123,15 +401,29 @@ class Database:
                 cursor.execute(query)
 
             result = None
-            if fetch == 'one':
+            if fetch in ('one', 'all') and _TABLA_ESCRITURA.match(query):
+                # Escritura con RETURNING: se leen todas las filas para terminar la sentencia antes del commit
+                result = cursor.fetchall()
+                filas = len(result)
+                self._confirmar(conn, query)
+                if fetch == 'one':
+                    result = result[0] if result else None
+            elif fetch == 'one':
                 result = cursor.fetchone()
+                filas = 0 if result is None else 1
             elif fetch == 'all':
                 result = cursor.fetchall()
+                filas = len(result)
             else:
-                conn.commit()
-                result = cursor.lastrowid  # Retornar el ID de la última fila insertada
+                self._confirmar(conn, query)
+                filas = max(cursor.rowcount, 0)
+                if fetch == 'rowcount':
+                    result = filas
+                else:
+                    result = cursor.lastrowid  # Retornar el ID de la última fila insertada
 
         except sqlite3.OperationalError as e:
+            self.metricas.contar("errores")
             if "no such column" in str(e):
                 print(f"Error de columna: {e}")
                 # Obtener la estructura de la tabla mencionada en el error
@@ -156,11 +448,105 @@ class Database:
                     for col in columnas:
                         print(f"- {col[1]} ({col[2]})")
             raise
-        finally:
-            conn.close()
+        except sqlite3.Error:
+            self.metricas.contar("errores")
+            raise
 
+        self.metricas.registrar(etiqueta, time.perf_counter() - inicio, filas)
         return result
 
+    def consulta(self, nombre, params=None, fetch=None):
+        """Ejecuta una consulta del registro db.consultas por su nombre
+
+        Args:
+            nombre (str): Nombre con el que se registró la consulta
+            params (tuple, optional): Parámetros para la consulta
+            fetch (str, optional): 'one', 'all', 'rowcount' o None, como en execute_query
+
+        Returns:
+            Lo mismo que execute_query
+
+        Raises:
+            ValueError: Si no hay ninguna consulta con ese nombre
+        """
+        return self._ejecutar_con_reintentos(sql(nombre), params, fetch, nombre)
+
+    def consulta_varias(self, nombre, params_list):
+        """Ejecuta una consulta del registro una vez por cada tupla de parámetros"""
+        self._ejecutar_varias(sql(nombre), params_list, nombre)
+
+    def explicar(self, query, params=None):
+        """Devuelve el plan de ejecución (EXPLAIN QUERY PLAN) de una consulta
+
+        Args:
+            query (str): Consulta SQL o nombre de una consulta registrada
+            params (tuple, optional): Parámetros; por defecto NULL en cada marcador ?
+
+        Returns:
+            list: Filas (id, parent, notused, detail) del plan
+        """
+        if query in CONSULTAS:
+            query = CONSULTAS[query].sql
+        if params is None:
+            # El plan no depende de los valores, sólo de que haya uno por marcador
+            params = (None,) * query.count("?")
+
+        with self._conexion() as conn:
+            return [tuple(fila) for fila in conn.execute("EXPLAIN QUERY PLAN " + query, params)]
+
+    def revisar_planes(self, consultas=None):
+        """Busca consultas registradas que recorren tablas completas
+
+        Se omiten las registradas con recorrido_completo, que leen toda la
+        tabla a propósito (listados completos y reportes).
+
+        Args:
+            consultas (dict, optional): nombre -> Consulta; por defecto todo el registro
+
+        Returns:
+            dict: nombre -> pasos SCAN del plan, sólo para las consultas que los tienen
+        """
+        problemas = {}
+        for nombre, consulta in (consultas or CONSULTAS).items():
+            if consulta.recorrido_completo:
+                continue
+            pasos = recorridos(self.explicar(consulta.sql))
+            if pasos:
+                problemas[nombre] = pasos
+        return problemas
+
+    def iter_query(self, query, params=None, size=1000):
+        """Recorre el resultado de una consulta en bloques sin cargarlo entero en memoria
+
+        La conexión queda reservada mientras se consume el iterador.
+
+        Args:
+            query (str): Consulta SQL a ejecutar
+            params (tuple, optional): Parámetros para la consulta
+            size (int): Filas pedidas a SQLite en cada fetchmany
+
+        Yields:
+            sqlite3.Row: Cada fila del resultado
+        """
+        # Sólo se mide el tiempo dentro de SQLite, no el de quien consume las filas
+        total = 0
+        inicio = time.perf_counter()
+        with self._conexion() as conn:
+            cursor = conn.execute(query, params or ())
+            segundos = time.perf_counter() - inicio
+            try:
+                while True:
+                    inicio = time.perf_counter()
+                    filas = cursor.fetchmany(size)
+                    segundos += time.perf_counter() - inicio
+                    if not filas:
+                        break
+                    total += len(filas)
+                    yield from filas
+            finally:
+                cursor.close()
+                self.metricas.registrar(query, segundos, total)
+
     def execute_many(self, query, params_list):
         """Ejecuta una consulta SQL múltiple veces con diferentes parámetros
 
@@ -168,52 +554,35 @@ class Database:
             query (str): Consulta SQL a ejecutar
             params_list (list): Lista de tuplas con parámetros
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.executemany(query, params_list)
-        conn.commit()
-
-        conn.close()
+        self._ejecutar_varias(query, params_list, query)
+
+    def _ejecutar_varias(self, query, params_list, etiqueta):
+        def ejecutar():
+            with self._conexion() as conn:
+                inicio = time.perf_counter()
+                try:
+                    cursor = conn.executemany(query, params_list)
+                    self._confirmar(conn, query)
+                except sqlite3.Error:
+                    self.metricas.contar("errores")
+                    raise
+                self.metricas.registrar(etiqueta, time.perf_counter() - inicio, max(cursor.rowcount, 0))
+
+        self._con_reintentos(ejecutar)
 
     def crear_semillero(self, semillero):
         """Crea un nuevo semillero en la base de datos
 
+            Se delega en SemilleroService para que el semillero y sus
+            investigadores se guarden en una única transacción.
+
             Args:
                 semillero (Semillero): Objeto Semillero a crear
 
             Returns:
-                int: ID del semillero creado o None si hay errores
-            """
-        # Validar que cumpla con los requisitos
-        errores = semillero.validar()
-        if errores:
-            return None, errores
-
-        # Insertar el semillero en la base de datos
-        # Incluimos la columna objetivos_especificos que existe en la tabla
-        query = """
-                INSERT INTO semilleros 
-                (nombre, objetivo_principal, objetivos_especificos, grupo_id, status) 
-                VALUES (?, ?, ?, ?, ?)
+                tuple: (ID del semillero creado o None, lista de errores)
             """
+        # Importación local: los servicios dependen de este módulo
+        from services.semillero_service import SemilleroService
 
-        params = (
-            semillero.nombre,
-            semillero.objetivo_principal,
-            semillero.objetivos_especificos,  # Añadido este campo que faltaba
-            semillero.grupo_id,
-            semillero.status
-        )
-
-        # Corregido: self.db debería ser self porque ya estamos en la clase Database
-        semillero_id = self.execute_query(query, params)
-
-        # Si se creó correctamente, añadir los investigadores
-        if semillero_id:
-            self._guardar_investigadores(semillero_id, semillero.estudiantes, "estudiante")
-            self._guardar_investigadores(semillero_id, semillero.tutores, "tutor")
-
-            return semillero_id, []
-
-        return None, ["Error al crear el semillero en la base de datos"]
+        return SemilleroService(self).crear_semillero(semillero)
@@ -0,0 +1,294 @@
+"""Instrumentación de las consultas a la base de datos
+
+Database registra en un objeto Metricas cada consulta que ejecuta: su
+latencia (en un histograma por consulta), las filas devueltas o
+modificadas, y contadores de conexiones abiertas, commits, rollbacks y
+reintentos por base ocupada. Las consultas más lentas que umbral_lenta se
+guardan además en un registro de consultas lentas.
+
+Una traza agrupa todas las consultas lanzadas por una misma operación
+(una opción del menú, una petición HTTP). Se propaga con contextvars, así
+que sigue a la operación a través de la fachada asyncio, y permite ver
+patrones N+1: la misma consulta repetida muchas veces en una sola acción.
+
+Las métricas se exportan como JSON o en el formato de texto de Prometheus.
+"""
+
+import contextvars
+import json
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+
+
+# Límites superiores (segundos) de los intervalos del histograma de latencia
+LIMITES_LATENCIA = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+CONTADORES = ("conexiones_abiertas", "commits", "rollbacks", "reintentos_ocupada", "errores", "consultas_lentas")
+
+_traza_actual = contextvars.ContextVar("traza_actual", default=None)
+
+_ESPACIOS = re.compile(r"\s+")
+# Las listas IN (?, ?, ...) de las cargas por lotes cuentan como una sola consulta
+_LISTA_IN = re.compile(r"IN \((?:\?, )*\?\)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def normalizar(query):
+    """Convierte el texto de una consulta en la etiqueta con la que se agrupa"""
+    return _LISTA_IN.sub("IN (?...)", _ESPACIOS.sub(" ", query).strip())
+
+
+def traza_actual():
+    """Devuelve la Traza activa en este contexto o None"""
+    return _traza_actual.get()
+
+
+class Traza:
+    """Consultas ejecutadas durante una operación"""
+
+    def __init__(self, operacion):
+        self.id = uuid.uuid4().hex[:16]
+        self.operacion = operacion
+        self.consultas = []  # (consulta, segundos, filas) en orden de ejecución
+        self._inicio = time.perf_counter()
+        self.duracion = None
+
+    def anotar(self, consulta, segundos, filas):
+        self.consultas.append((consulta, segundos, filas))
+
+    @property
+    def segundos_en_base(self):
+        """Tiempo total pasado dentro de SQLite"""
+        return sum(segundos for _, segundos, _ in self.consultas)
+
+    def repetidas(self, minimo=2):
+        """Consultas ejecutadas al menos minimo veces en la traza (posibles N+1)
+
+        Returns:
+            dict: consulta -> número de ejecuciones, de más a menos repetida
+        """
+        veces = {}
+        for consulta, _, _ in self.consultas:
+            veces[consulta] = veces.get(consulta, 0) + 1
+        return dict(sorted(((c, n) for c, n in veces.items() if n >= minimo), key=lambda par: -par[1]))
+
+    def resumen(self):
+        """Datos de la traza en tipos básicos, para exportar"""
+        return {
+            "id": self.id,
+            "operacion": self.operacion,
+            "duracion_ms": round((self.duracion or 0) * 1000, 3),
+            "base_ms": round(self.segundos_en_base * 1000, 3),
+            "consultas": len(self.consultas),
+            "filas": sum(filas for _, _, filas in self.consultas),
+            "repetidas": self.repetidas(),
+        }
+
+    def __str__(self):
+        texto = (f"[traza {self.id}] {self.operacion}: {len(self.consultas)} consultas, "
+                 f"{self.segundos_en_base * 1000:.1f} ms en la base de datos")
+        for consulta, veces in self.repetidas(3).items():
+            texto += f"\n  repetida {veces} veces: {consulta[:100]}"
+        return texto
+
+
+class Metricas:
+    """Contadores e histogramas de las consultas de una Database
+
+    Es seguro usarlo desde varios hilos.
+    """
+
+    # Consultas lentas y trazas recientes que se conservan en memoria
+    MAXIMO_LENTAS = 100
+    MAXIMO_TRAZAS = 50
+
+    def __init__(self, umbral_lenta=None, registro_lentas=None):
+        """
+        Args:
+            umbral_lenta (float, optional): Segundos a partir de los cuales una
+                consulta se anota como lenta
+            registro_lentas (str | file, optional): Archivo (ruta o flujo abierto)
+                al que añadir cada consulta lenta como una línea JSON
+        """
+        self.umbral_lenta = umbral_lenta
+        self.registro_lentas = registro_lentas
+        self._consultas = {}  # consulta -> [llamadas, segundos, filas, máximo, intervalos]
+        self._contadores = dict.fromkeys(CONTADORES, 0)
+        self.lentas = deque(maxlen=self.MAXIMO_LENTAS)
+        self.trazas = deque(maxlen=self.MAXIMO_TRAZAS)
+        self._lock = threading.Lock()
+
+    def registrar(self, consulta, segundos, filas=0):
+        """Anota una ejecución de una consulta
+
+        Args:
+            consulta (str): Nombre registrado o texto SQL de la consulta
+            segundos (float): Duración
+            filas (int): Filas devueltas o modificadas
+        """
+        consulta = normalizar(consulta)
+        intervalo = 0
+        while intervalo < len(LIMITES_LATENCIA) and segundos > LIMITES_LATENCIA[intervalo]:
+            intervalo += 1
+
+        with self._lock:
+            datos = self._consultas.get(consulta)
+            if datos is None:
+                datos = self._consultas[consulta] = [0, 0.0, 0, 0.0, [0] * (len(LIMITES_LATENCIA) + 1)]
+            datos[0] += 1
+            datos[1] += segundos
+            datos[2] += filas
+            datos[3] = max(datos[3], segundos)
+            datos[4][intervalo] += 1
+
+        traza = _traza_actual.get()
+        if traza is not None:
+            traza.anotar(consulta, segundos, filas)
+
+        if self.umbral_lenta is not None and segundos >= self.umbral_lenta:
+            self._anotar_lenta(consulta, segundos, filas, traza)
+
+    def _anotar_lenta(self, consulta, segundos, filas, traza):
+        entrada = {
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "consulta": consulta,
+            "ms": round(segundos * 1000, 3),
+            "filas": filas,
+            "traza": traza.id if traza else None,
+            "operacion": traza.operacion if traza else None,
+        }
+        with self._lock:
+            self._contadores["consultas_lentas"] += 1
+            self.lentas.append(entrada)
+            if self.registro_lentas is not None:
+                linea = json.dumps(entrada, ensure_ascii=False) + "\n"
+                if isinstance(self.registro_lentas, str):
+                    with open(self.registro_lentas, "a", encoding="utf-8") as archivo:
+                        archivo.write(linea)
+                else:
+                    self.registro_lentas.write(linea)
+                    self.registro_lentas.flush()
+
+    def contar(self, contador, cantidad=1):
+        """Incrementa uno de los contadores de CONTADORES"""
+        with self._lock:
+            self._contadores[contador] += cantidad
+
+    @contextmanager
+    def traza(self, operacion):
+        """Agrupa en una Traza las consultas ejecutadas dentro del bloque with
+
+        Una traza abierta dentro de otra se une a la exterior.
+
+        Ejemplo:
+            with db.metricas.traza("Ver semilleros") as traza:
+                ...
+            print(traza)
+        """
+        exterior = _traza_actual.get()
+        if exterior is not None:
+            yield exterior
+            return
+
+        traza = Traza(operacion)
+        token = _traza_actual.set(traza)
+        try:
+            yield traza
+        finally:
+            _traza_actual.reset(token)
+            traza.duracion = time.perf_counter() - traza._inicio
+            with self._lock:
+                self.trazas.append(traza)
+
+    def reiniciar(self):
+        """Pone a cero todas las métricas"""
+        with self._lock:
+            self._consultas.clear()
+            self._contadores = dict.fromkeys(CONTADORES, 0)
+            self.lentas.clear()
+            self.trazas.clear()
+
+    def instantanea(self):
+        """Devuelve todas las métricas en tipos básicos (apto para JSON)"""
+        with self._lock:
+            consultas = {
+                consulta: {
+                    "llamadas": llamadas,
+                    "total_ms": round(segundos * 1000, 3),
+                    "media_ms": round(segundos * 1000 / llamadas, 3),
+                    "maximo_ms": round(maximo * 1000, 3),
+                    "filas": filas,
+                    "histograma": dict(zip([str(limite) for limite in LIMITES_LATENCIA] + ["+Inf"], intervalos)),
+                }
+                for consulta, (llamadas, segundos, filas, maximo, intervalos) in self._consultas.items()
+            }
+            return {
+                "contadores": dict(self._contadores),
+                "consultas": consultas,
+                "lentas": list(self.lentas),
+                "trazas": [traza.resumen() for traza in self.trazas],
+            }
+
+    def a_json(self):
+        """Métricas como documento JSON"""
+        return json.dumps(self.instantanea(), ensure_ascii=False, indent=2)
+
+    def a_prometheus(self):
+        """Métricas en el formato de exposición de texto de Prometheus"""
+        with self._lock:
+            consultas = sorted((consulta, list(datos[:3]), list(datos[4]))
+                               for consulta, datos in self._consultas.items())
+            contadores = dict(self._contadores)
+
+        lineas = []
+        for contador in CONTADORES:
+            nombre = f"semilleros_{contador}_total"
+            lineas += [f"# TYPE {nombre} counter", f"{nombre} {contadores[contador]}"]
+
+        lineas += ["# HELP semilleros_consulta_segundos Latencia de las consultas SQL",
+                   "# TYPE semilleros_consulta_segundos histogram"]
+        for consulta, (llamadas, segundos, _), intervalos in consultas:
+            etiqueta = _etiqueta(consulta)
+            acumulado = 0
+            for limite, cantidad in zip(LIMITES_LATENCIA, intervalos):
+                acumulado += cantidad
+                lineas.append(f'semilleros_consulta_segundos_bucket{{consulta="{etiqueta}",le="{limite}"}} '
+                              f'{acumulado}')
+            lineas.append(f'semilleros_consulta_segundos_bucket{{consulta="{etiqueta}",le="+Inf"}} {llamadas}')
+            lineas.append(f'semilleros_consulta_segundos_sum{{consulta="{etiqueta}"}} {segundos:.6f}')
+            lineas.append(f'semilleros_consulta_segundos_count{{consulta="{etiqueta}"}} {llamadas}')
+
+        lineas += ["# HELP semilleros_consulta_filas_total Filas devueltas o modificadas por cada consulta",
+                   "# TYPE semilleros_consulta_filas_total counter"]
+        for consulta, (_, _, filas), _ in consultas:
+            lineas.append(f'semilleros_consulta_filas_total{{consulta="{_etiqueta(consulta)}"}} {filas}')
+
+        return "\n".join(lineas) + "\n"
+
+    def exportar(self, destino, formato=None):
+        """Escribe las métricas en un archivo
+
+        Args:
+            destino (str): Ruta del archivo
+            formato (str, optional): 'json' o 'prometheus'; por defecto según la
+                extensión (.json es JSON, cualquier otra Prometheus)
+        """
+        if formato is None:
+            formato = "json" if destino.lower().endswith(".json") else "prometheus"
+        if formato not in ("json", "prometheus"):
+            raise ValueError(f"Formato de métricas no válido: {formato}")
+
+        contenido = self.a_json() if formato == "json" else self.a_prometheus()
+        with open(destino, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+
+
+def _etiqueta(valor):
+    """Escapa un valor de etiqueta de Prometheus"""
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,713 @@
+"""Migraciones versionadas del esquema de la base de datos
+
+Cada migración es una función que recibe un cursor y lleva el esquema de
+la versión anterior a la siguiente. La versión aplicada se guarda en
+PRAGMA user_version, de modo que al arrancar sólo se ejecutan las
+migraciones pendientes y una base ya actualizada no ejecuta ningún DDL.
+
+Las migraciones ya publicadas no se modifican: cualquier cambio nuevo del
+esquema se añade como una función más al final de MIGRACIONES.
+"""
+
+import ast
+import json
+import warnings
+
+
+class AdvertenciaMigracion(UserWarning):
+    """Una migración ha tenido que apartar datos que el nuevo esquema no admite"""
+
+
+def _columnas(cursor, tabla):
+    """Devuelve los nombres de las columnas existentes en una tabla"""
+    cursor.execute(f"PRAGMA table_info({tabla})")
+    return {info[1] for info in cursor.fetchall()}
+
+
+def _agregar_columna(cursor, tabla, columna, definicion):
+    """Añade una columna sólo si la tabla todavía no la tiene"""
+    if columna not in _columnas(cursor, tabla):
+        cursor.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+
+
+def _v1_estructura_base(cursor):
+    """Tablas originales del sistema"""
+    # Tabla de grupos de investigación
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS grupos_investigacion (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        facultad TEXT,
+        area_conocimiento TEXT
+    )
+    ''')
+
+    # Tabla de semilleros
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS semilleros (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        objetivo_principal TEXT,
+        objetivos_especificos TEXT,
+        grupo_id INTEGER,
+        status TEXT DEFAULT 'pendiente',
+        FOREIGN KEY (grupo_id) REFERENCES grupos_investigacion(id)
+    )
+    ''')
+
+    # Tabla de investigadores
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS investigadores (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nombre TEXT NOT NULL,
+        tipo TEXT NOT NULL,
+        identificacion TEXT,
+        programa TEXT,
+        email TEXT
+    )
+    ''')
+
+    # Tabla de relación entre semilleros e investigadores
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS semillero_investigador (
+        semillero_id INTEGER,
+        investigador_id INTEGER,
+        rol TEXT,
+        PRIMARY KEY (semillero_id, investigador_id),
+        FOREIGN KEY (semillero_id) REFERENCES semilleros(id),
+        FOREIGN KEY (investigador_id) REFERENCES investigadores(id)
+    )
+    ''')
+
+    # Tabla de entregables
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS entregables (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        titulo TEXT NOT NULL,
+        descripcion TEXT,
+        tipo TEXT NOT NULL,
+        semillero_id INTEGER NOT NULL,
+        fecha_entrega TEXT,
+        estado TEXT DEFAULT 'pendiente',
+        FOREIGN KEY (semillero_id) REFERENCES semilleros(id)
+    )
+    ''')
+
+
+def _v2_columnas_servicios(cursor):
+    """Columnas que los servicios usan pero el DDL original no creaba"""
+    # Bases antiguas sin objetivo_principal en semilleros
+    _agregar_columna(cursor, "semilleros", "objetivo_principal", 'TEXT NOT NULL DEFAULT ""')
+
+    # GrupoService guarda campo, identificador y director de cada grupo
+    _agregar_columna(cursor, "grupos_investigacion", "campo", "TEXT")
+    _agregar_columna(cursor, "grupos_investigacion", "identificador", "TEXT")
+    _agregar_columna(cursor, "grupos_investigacion", "director", "TEXT")
+
+    # SemilleroService asocia cada investigador directamente a su semillero
+    _agregar_columna(cursor, "investigadores", "semillero_id", "INTEGER REFERENCES semilleros(id)")
+
+
+def _v3_indices_busqueda(cursor):
+    """Índices para las búsquedas por clave foránea y los listados ordenados"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_semilleros_grupo ON semilleros(grupo_id, nombre)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_semilleros_nombre ON semilleros(nombre)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_grupos_nombre ON grupos_investigacion(nombre)")
+    # Cubre el ORDER BY tipo, nombre de la carga de investigadores
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_investigadores_semillero ON investigadores(semillero_id, tipo, nombre)"
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_entregables_semillero ON entregables(semillero_id)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_semillero_investigador_investigador "
+        "ON semillero_investigador(investigador_id)"
+    )
+
+
+def _v4_importaciones(cursor):
+    """Progreso de las importaciones masivas para poder reanudarlas"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS importaciones (
+        archivo TEXT PRIMARY KEY,
+        registros INTEGER NOT NULL DEFAULT 0,
+        actualizado_en TEXT
+    )
+    ''')
+
+
+# Tablas cuya última modificación se registra en la columna actualizado_en
+TABLAS_CON_MARCA_TEMPORAL = ["grupos_investigacion", "semilleros", "investigadores", "entregables"]
+
+# Marca temporal UTC con milisegundos, comparable como texto
+AHORA_SQL = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+def _v5_marcas_temporales(cursor):
+    """Columna actualizado_en mantenida por triggers para exportaciones incrementales"""
+    for tabla in TABLAS_CON_MARCA_TEMPORAL:
+        _agregar_columna(cursor, tabla, "actualizado_en", "TEXT")
+        cursor.execute(f"UPDATE {tabla} SET actualizado_en = {AHORA_SQL} WHERE actualizado_en IS NULL")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{tabla}_actualizado ON {tabla}(actualizado_en)")
+
+        # Las inserciones que ya traen la marca (importación masiva) no pagan el UPDATE extra
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{tabla}_insert_actualizado
+        AFTER INSERT ON {tabla} WHEN NEW.actualizado_en IS NULL
+        BEGIN
+            UPDATE {tabla} SET actualizado_en = {AHORA_SQL} WHERE id = NEW.id;
+        END
+        ''')
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{tabla}_update_actualizado
+        AFTER UPDATE ON {tabla} WHEN NEW.actualizado_en IS OLD.actualizado_en
+        BEGIN
+            UPDATE {tabla} SET actualizado_en = {AHORA_SQL} WHERE id = NEW.id;
+        END
+        ''')
+
+
+# Texto indexado de un semillero: nombre, objetivos y sus investigadores
+_OBJETIVOS_FTS = """
+    COALESCE({fila}.objetivo_principal, '') || ' ' || COALESCE(CASE WHEN json_valid({fila}.objetivos_especificos)
+        THEN (SELECT group_concat(value, ' ') FROM json_each({fila}.objetivos_especificos))
+        ELSE {fila}.objetivos_especificos END, '')
+"""
+
+_INVESTIGADORES_FTS = """
+    COALESCE((SELECT group_concat(i.nombre || ' ' || COALESCE(i.email, ''), ' ')
+              FROM investigadores i WHERE i.semillero_id = {semillero_id}), '')
+"""
+
+
+def _v6_busqueda_texto(cursor):
+    """Índice FTS5 de semilleros sincronizado por triggers
+
+    Cada fila de semilleros_fts tiene como rowid el ID del semillero. La
+    columna investigadores concatena nombres y correos de sus estudiantes y
+    tutores para poder buscar un semillero por cualquiera de ellos.
+    """
+    # Bases muy antiguas pueden no tener la columna que indexan los triggers
+    _agregar_columna(cursor, "semilleros", "objetivos_especificos", "TEXT")
+
+    cursor.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS semilleros_fts USING fts5(
+        nombre, objetivos, investigadores,
+        tokenize = "unicode61 remove_diacritics 2",
+        prefix = '2 3'
+    )
+    ''')
+
+    cursor.execute(f'''
+    INSERT INTO semilleros_fts (rowid, nombre, objetivos, investigadores)
+    SELECT s.id, s.nombre, {_OBJETIVOS_FTS.format(fila="s")}, {_INVESTIGADORES_FTS.format(semillero_id="s.id")}
+    FROM semilleros s
+    ''')
+
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS trg_semilleros_insert_fts
+    AFTER INSERT ON semilleros
+    BEGIN
+        INSERT INTO semilleros_fts (rowid, nombre, objetivos, investigadores)
+        VALUES (NEW.id, NEW.nombre, {_OBJETIVOS_FTS.format(fila="NEW")},
+                {_INVESTIGADORES_FTS.format(semillero_id="NEW.id")});
+    END
+    ''')
+    # Sólo los cambios en columnas indexadas; cambiar el estado no toca el índice
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS trg_semilleros_update_fts
+    AFTER UPDATE OF nombre, objetivo_principal, objetivos_especificos ON semilleros
+    BEGIN
+        UPDATE semilleros_fts SET nombre = NEW.nombre, objetivos = {_OBJETIVOS_FTS.format(fila="NEW")}
+        WHERE rowid = NEW.id;
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_semilleros_delete_fts
+    AFTER DELETE ON semilleros
+    BEGIN
+        DELETE FROM semilleros_fts WHERE rowid = OLD.id;
+    END
+    ''')
+
+    # Al insertar basta con añadir el investigador al final, pero aun así se reescribe la fila del
+    # semillero por cada investigador. Las cargas masivas insertan los investigadores antes que su
+    # semillero: este trigger no encuentra fila y el de semilleros construye la lista una sola vez
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_investigadores_insert_fts
+    AFTER INSERT ON investigadores WHEN NEW.semillero_id IS NOT NULL
+    BEGIN
+        UPDATE semilleros_fts
+        SET investigadores = investigadores || ' ' || NEW.nombre || ' ' || COALESCE(NEW.email, '')
+        WHERE rowid = NEW.semillero_id;
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS trg_investigadores_update_fts
+    AFTER UPDATE OF nombre, email, semillero_id ON investigadores
+    BEGIN
+        UPDATE semilleros_fts SET investigadores = {_INVESTIGADORES_FTS.format(semillero_id="OLD.semillero_id")}
+        WHERE rowid = OLD.semillero_id;
+        UPDATE semilleros_fts SET investigadores = {_INVESTIGADORES_FTS.format(semillero_id="NEW.semillero_id")}
+        WHERE rowid = NEW.semillero_id AND NEW.semillero_id IS NOT OLD.semillero_id;
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS trg_investigadores_delete_fts
+    AFTER DELETE ON investigadores WHEN OLD.semillero_id IS NOT NULL
+    BEGIN
+        UPDATE semilleros_fts SET investigadores = {_INVESTIGADORES_FTS.format(semillero_id="OLD.semillero_id")}
+        WHERE rowid = OLD.semillero_id;
+    END
+    ''')
+
+_OBJETIVOS_TABLA_FTS = """
+    COALESCE({fila}.objetivo_principal, '') || ' ' ||
+    COALESCE((SELECT group_concat(o.objetivo, ' ') FROM semillero_objetivos o
+              WHERE o.semillero_id = {semillero_id}), '')
+"""
+
+
+def _lista_objetivos(valor):
+    """Interpreta el texto guardado en semilleros.objetivos_especificos
+
+    Además de JSON acepta la representación de una lista de Python que
+    escribía la versión antigua de Database.crear_semillero.
+    """
+    if not valor:
+        return []
+    try:
+        objetivos = json.loads(valor)
+    except ValueError:
+        try:
+            objetivos = ast.literal_eval(valor)
+        except (ValueError, SyntaxError):
+            objetivos = valor
+    if isinstance(objetivos, (list, tuple)):
+        return [str(objetivo) for objetivo in objetivos if str(objetivo).strip()]
+    return [str(objetivos)] if str(objetivos).strip() else []
+
+
+def _v7_tabla_objetivos(cursor):
+    """Objetivos específicos en su propia tabla en lugar de una lista JSON por semillero"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS semillero_objetivos (
+        semillero_id INTEGER NOT NULL,
+        orden INTEGER NOT NULL,
+        objetivo TEXT NOT NULL,
+        PRIMARY KEY (semillero_id, orden),
+        FOREIGN KEY (semillero_id) REFERENCES semilleros(id)
+    ) WITHOUT ROWID
+    ''')
+
+    # Los arrays JSON válidos se copian en SQL; el resto (listas de Python, texto suelto) en Python
+    cursor.execute('''
+    INSERT INTO semillero_objetivos (semillero_id, orden, objetivo)
+    SELECT s.id, j.key + 1, CAST(j.value AS TEXT)
+    FROM semilleros s, json_each(s.objetivos_especificos) j
+    WHERE json_valid(s.objetivos_especificos) AND json_type(s.objetivos_especificos) = 'array'
+      AND j.value IS NOT NULL AND TRIM(j.value) <> ''
+    ''')
+    restantes = cursor.execute('''
+    SELECT id, objetivos_especificos FROM semilleros
+    WHERE objetivos_especificos IS NOT NULL AND objetivos_especificos <> ''
+      AND NOT (json_valid(objetivos_especificos) AND json_type(objetivos_especificos) = 'array')
+    ''').fetchall()
+    cursor.executemany(
+        "INSERT INTO semillero_objetivos (semillero_id, orden, objetivo) VALUES (?, ?, ?)",
+        [(semillero_id, orden, objetivo)
+         for semillero_id, valor in restantes
+         for orden, objetivo in enumerate(_lista_objetivos(valor), 1)]
+    )
+
+    # Los triggers de búsqueda leen ahora la tabla; hay que quitarlos antes de borrar la columna
+    cursor.execute("DROP TRIGGER IF EXISTS trg_semilleros_insert_fts")
+    cursor.execute("DROP TRIGGER IF EXISTS trg_semilleros_update_fts")
+    cursor.execute("ALTER TABLE semilleros DROP COLUMN objetivos_especificos")
+
+    cursor.execute(f'''
+    CREATE TRIGGER trg_semilleros_insert_fts
+    AFTER INSERT ON semilleros
+    BEGIN
+        INSERT INTO semilleros_fts (rowid, nombre, objetivos, investigadores)
+        VALUES (NEW.id, NEW.nombre, {_OBJETIVOS_TABLA_FTS.format(fila="NEW", semillero_id="NEW.id")},
+                {_INVESTIGADORES_FTS.format(semillero_id="NEW.id")});
+    END
+    ''')
+    cursor.execute(f'''
+    CREATE TRIGGER trg_semilleros_update_fts
+    AFTER UPDATE OF nombre, objetivo_principal ON semilleros
+    BEGIN
+        UPDATE semilleros_fts
+        SET nombre = NEW.nombre, objetivos = {_OBJETIVOS_TABLA_FTS.format(fila="NEW", semillero_id="NEW.id")}
+        WHERE rowid = NEW.id;
+    END
+    ''')
+
+    # Un cambio en los objetivos actualiza el índice de búsqueda y la marca temporal del
+    # semillero, de la que depende la exportación incremental de esta tabla
+    cursor.execute(f'''
+    CREATE TRIGGER trg_semillero_objetivos_insert
+    AFTER INSERT ON semillero_objetivos
+    BEGIN
+        UPDATE semilleros_fts SET objetivos = objetivos || ' ' || NEW.objetivo WHERE rowid = NEW.semillero_id;
+        UPDATE semilleros SET actualizado_en = {AHORA_SQL} WHERE id = NEW.semillero_id;
+    END
+    ''')
+    for evento, fila in (("UPDATE", "NEW"), ("DELETE", "OLD")):
+        cursor.execute(f'''
+        CREATE TRIGGER trg_semillero_objetivos_{evento.lower()}
+        AFTER {evento} ON semillero_objetivos
+        BEGIN
+            UPDATE semilleros_fts
+            SET objetivos = (SELECT {_OBJETIVOS_TABLA_FTS.format(fila="s", semillero_id="s.id")}
+                             FROM semilleros s WHERE s.id = {fila}.semillero_id)
+            WHERE rowid = {fila}.semillero_id;
+            UPDATE semilleros SET actualizado_en = {AHORA_SQL} WHERE id = {fila}.semillero_id;
+        END
+        ''')
+
+# Cambios de estado permitidos a un entregable (desde, hacia)
+_TRANSICIONES_ENTREGABLE = [
+    ("pendiente", "aprobado"),
+    ("pendiente", "rechazado"),
+    ("aprobado", "pendiente"),
+    ("rechazado", "pendiente"),
+]
+
+
+def _v8_flujo_entregables(cursor):
+    """Transiciones de estado de entregables, un entregable por semillero y cola de revisión"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS transiciones_entregable (
+        desde TEXT NOT NULL,
+        hacia TEXT NOT NULL,
+        PRIMARY KEY (hacia, desde)
+    ) WITHOUT ROWID
+    ''')
+    cursor.executemany("INSERT OR IGNORE INTO transiciones_entregable (desde, hacia) VALUES (?, ?)",
+                       _TRANSICIONES_ENTREGABLE)
+
+    # Cualquier UPDATE, venga de donde venga, sólo puede hacer un cambio de estado permitido
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_entregables_transicion
+    BEFORE UPDATE OF estado ON entregables
+    WHEN NEW.estado IS NOT OLD.estado AND NOT EXISTS (
+        SELECT 1 FROM transiciones_entregable WHERE desde = OLD.estado AND hacia = NEW.estado
+    )
+    BEGIN
+        SELECT RAISE(ABORT, 'Cambio de estado de entregable no permitido');
+    END
+    ''')
+
+    # Un semillero tiene como mucho un entregable. Si alguna carrera dejó varios se
+    # conserva el primero, que es el que ya mostraban los listados, y los demás se
+    # guardan en entregables_duplicados para que se puedan revisar y recuperar
+    cursor.execute("CREATE TABLE IF NOT EXISTS entregables_duplicados AS SELECT * FROM entregables WHERE 0")
+    cursor.execute("""
+        INSERT INTO entregables_duplicados
+        SELECT * FROM entregables
+        WHERE id NOT IN (SELECT MIN(id) FROM entregables GROUP BY semillero_id)
+    """)
+    apartados = cursor.execute("""
+        DELETE FROM entregables
+        WHERE id NOT IN (SELECT MIN(id) FROM entregables GROUP BY semillero_id)
+        RETURNING id, semillero_id
+    """).fetchall()
+    if apartados:
+        detalle = ", ".join(f"{entregable_id} (semillero {semillero_id})"
+                            for entregable_id, semillero_id in sorted(apartados))
+        warnings.warn(f"Había semilleros con más de un entregable; se han movido a la tabla "
+                      f"entregables_duplicados los entregables {detalle}", AdvertenciaMigracion, stacklevel=2)
+    cursor.execute("DROP INDEX IF EXISTS idx_entregables_semillero")
+    cursor.execute("CREATE UNIQUE INDEX idx_entregables_semillero ON entregables(semillero_id)")
+
+    # Cola de revisión: sólo los pendientes, ya ordenados por fecha de entrega
+    # (sin fecha van primero) para paginar sin recorrer la tabla
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_entregables_pendientes
+    ON entregables(COALESCE(fecha_entrega, ''), id) WHERE estado = 'pendiente'
+    ''')
+
+
+def _v9_registro_actividad(cursor):
+    """Registro de actividad de solo inserción y control de sus archivos"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS actividades (
+        id INTEGER PRIMARY KEY,
+        fecha TEXT NOT NULL,
+        actor TEXT NOT NULL,
+        accion TEXT NOT NULL,
+        entidad TEXT NOT NULL,
+        entidad_id INTEGER,
+        semillero_id INTEGER,
+        detalle TEXT
+    )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_actividades_semillero ON actividades(semillero_id, fecha)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_actividades_actor ON actividades(actor, fecha)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_actividades_fecha ON actividades(fecha)")
+
+    # Cada archivo guarda todas las entradas con id <= hasta_id que quedaban en la tabla
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS actividades_archivadas (
+        id INTEGER PRIMARY KEY,
+        archivo TEXT NOT NULL,
+        desde_id INTEGER NOT NULL,
+        hasta_id INTEGER NOT NULL,
+        filas INTEGER NOT NULL,
+        creado_en TEXT NOT NULL
+    )
+    ''')
+
+    # Las entradas no se modifican nunca, y sólo se borran las que ya están en un archivo
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_actividades_sin_update
+    BEFORE UPDATE ON actividades
+    BEGIN
+        SELECT RAISE(ABORT, 'El registro de actividad no se puede modificar');
+    END
+    ''')
+    cursor.execute('''
+    CREATE TRIGGER IF NOT EXISTS trg_actividades_borrar_archivadas
+    BEFORE DELETE ON actividades
+    WHEN OLD.id > (SELECT COALESCE(MAX(hasta_id), 0) FROM actividades_archivadas)
+    BEGIN
+        SELECT RAISE(ABORT, 'Sólo se pueden borrar entradas de actividad ya archivadas');
+    END
+    ''')
+
+
+# Tablas cuyas escrituras se anotan en el registro de cambios
+TABLAS_CON_CAMBIOS = ["grupos_investigacion", "semilleros", "semillero_objetivos", "investigadores", "entregables"]
+
+
+def _objeto_json(fila, nombres):
+    return "json_object(" + ", ".join(f"'{nombre}', {fila}.{nombre}" for nombre in nombres) + ")"
+
+
+def _columnas_cambios(info):
+    """Columnas que forman la clave y los datos de una fila en el registro de cambios
+
+    Args:
+        info (list): Filas de PRAGMA table_info de la tabla
+
+    Returns:
+        tuple: (columnas de la clave, columnas de datos)
+    """
+    clave = sorted((col[5], col[1]) for col in info if col[5]) or [(1, "rowid")]
+    return [nombre for _, nombre in clave], [col[1] for col in info if col[1] != "actualizado_en"]
+
+
+# Mientras esta condición es falsa los triggers no anotan nada en cambios (ver anotar_inserciones)
+_CAPTURA_FILA_A_FILA = "NOT EXISTS (SELECT 1 FROM cambios_en_lote)"
+
+
+def _crear_triggers_cambios(cursor, tabla):
+    """(Re)crea los triggers que anotan en cambios cada INSERT, UPDATE y DELETE de tabla
+
+    La clave y los datos de la fila se guardan como objetos JSON con las
+    columnas que tenga la tabla en este momento: una migración que añada o
+    quite columnas de una de TABLAS_CON_CAMBIOS debe volver a llamar a esta
+    función.
+
+    La marca actualizado_en no forma parte de los datos: la ponen los
+    triggers de v5 con un UPDATE aparte después de cada inserción y de cada
+    cambio, y anotarla duplicaría cada escritura en el registro.
+    """
+    # Los triggers la consultan en cada fila; se crea aquí para que exista desde v10
+    cursor.execute("CREATE TABLE IF NOT EXISTS cambios_en_lote (id INTEGER PRIMARY KEY)")
+
+    claves, datos = _columnas_cambios(cursor.execute(f"PRAGMA table_info({tabla})").fetchall())
+    # Los UPDATE que no cambian ningún dato (sólo la marca temporal, o nada) no se anotan
+    modificada = " OR ".join(f"NEW.{nombre} IS NOT OLD.{nombre}" for nombre in datos)
+    for evento, fila, valores, condicion in (("INSERT", "NEW", _objeto_json("NEW", datos), _CAPTURA_FILA_A_FILA),
+                                             ("UPDATE", "NEW", _objeto_json("NEW", datos),
+                                              f"({modificada}) AND {_CAPTURA_FILA_A_FILA}"),
+                                             ("DELETE", "OLD", "NULL", _CAPTURA_FILA_A_FILA)):
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{tabla}_cambios_{evento.lower()}")
+        cursor.execute(f'''
+        CREATE TRIGGER trg_{tabla}_cambios_{evento.lower()}
+        AFTER {evento} ON {tabla} WHEN {condicion}
+        BEGIN
+            INSERT INTO cambios (tabla, operacion, clave, datos)
+            VALUES ('{tabla}', '{evento.lower()}', {_objeto_json(fila, claves)}, {valores});
+        END
+        ''')
+
+
+def anotar_inserciones(tabla, info, filtro):
+    """INSERT que anota en cambios, con una sola sentencia, la inserción de varias filas
+
+    Las cargas masivas insertan una fila en cambios_en_lote al empezar su
+    transacción, para que los triggers no anoten fila a fila, y la borran
+    antes de confirmar; entre medias anotan sus filas con esta sentencia.
+    Cada fila queda en el registro igual que si la hubiera anotado su trigger.
+
+    Args:
+        tabla (str): Una de TABLAS_CON_CAMBIOS
+        info (list): Filas de PRAGMA table_info de la tabla
+        filtro (str): Condición WHERE que selecciona las filas insertadas
+
+    Returns:
+        str: Sentencia INSERT ... SELECT, en orden de clave
+    """
+    claves, datos = _columnas_cambios(info)
+    return (f"INSERT INTO cambios (tabla, operacion, clave, datos) "
+            f"SELECT '{tabla}', 'insert', {_objeto_json(tabla, claves)}, {_objeto_json(tabla, datos)} "
+            f"FROM {tabla} WHERE {filtro} ORDER BY {', '.join(claves)}")
+
+
+def _v10_registro_cambios(cursor):
+    """Registro de cambios (CDC) con número de secuencia creciente, mantenido por triggers"""
+    # AUTOINCREMENT: un número de secuencia nunca se reutiliza, aunque la compactación borre filas
+    cursor.execute(f'''
+    CREATE TABLE IF NOT EXISTS cambios (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        tabla TEXT NOT NULL,
+        operacion TEXT NOT NULL CHECK (operacion IN ('insert', 'update', 'delete')),
+        clave TEXT NOT NULL,
+        datos TEXT,
+        fecha TEXT NOT NULL DEFAULT ({AHORA_SQL})
+    )
+    ''')
+    # Compactación: último cambio de cada fila
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_cambios_fila ON cambios(tabla, clave, seq)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_cambios_fecha ON cambios(fecha)")
+
+    for tabla in TABLAS_CON_CAMBIOS:
+        _crear_triggers_cambios(cursor, tabla)
+
+
+# Contadores mantenidos por triggers: tabla de contadores -> (tabla contada, columnas que la agrupan)
+CONTADORES = {
+    "contador_semilleros": ("semilleros", ("grupo_id", "status")),
+    "contador_entregables": ("entregables", ("tipo", "estado")),
+}
+
+# Las claves primarias de los contadores no admiten NULL: un semillero sin grupo cuenta en el
+# grupo 0 y un valor de texto nulo como ''
+_SIN_VALOR = {"grupo_id": "0"}
+
+
+def _clave_contador(fila, columnas):
+    return ", ".join(f"COALESCE({fila}.{columna}, {_SIN_VALOR.get(columna, repr(''))})" for columna in columnas)
+
+
+def recuento_contador(contador):
+    """SELECT que recalcula desde cero las filas (columnas..., total) de un contador"""
+    tabla, columnas = CONTADORES[contador]
+    return f"SELECT {_clave_contador(tabla, columnas)}, COUNT(*) FROM {tabla} GROUP BY {_clave_contador(tabla, columnas)}"
+
+
+def _v11_contadores(cursor):
+    """Contadores de semilleros por grupo y estado, y de entregables por tipo y estado"""
+    for contador, (tabla, columnas) in CONTADORES.items():
+        lista = ", ".join(columnas)
+        cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {contador} (
+            {", ".join(f"{columna} NOT NULL" for columna in columnas)},
+            total INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY ({lista})
+        ) WITHOUT ROWID
+        ''')
+        cursor.execute(f"DELETE FROM {contador}")
+        cursor.execute(f"INSERT INTO {contador} ({lista}, total) {recuento_contador(contador)}")
+
+        sumar = f'''
+            INSERT INTO {contador} ({lista}, total) VALUES ({_clave_contador("NEW", columnas)}, 1)
+            ON CONFLICT ({lista}) DO UPDATE SET total = total + 1;'''
+        restar = f'''
+            UPDATE {contador} SET total = total - 1
+            WHERE ({lista}) = ({_clave_contador("OLD", columnas)});
+            DELETE FROM {contador}
+            WHERE ({lista}) = ({_clave_contador("OLD", columnas)}) AND total <= 0;'''
+        cambio = " OR ".join(f"OLD.{columna} IS NOT NEW.{columna}" for columna in columnas)
+
+        for evento, condicion, cuerpo in (("INSERT", "", sumar),
+                                          (f"UPDATE OF {lista}", f"WHEN {cambio}", restar + sumar),
+                                          ("DELETE", "", restar)):
+            nombre = f"trg_{tabla}_{contador}_{evento.split()[0].lower()}"
+            cursor.execute(f"DROP TRIGGER IF EXISTS {nombre}")
+            cursor.execute(f'''
+            CREATE TRIGGER {nombre}
+            AFTER {evento} ON {tabla} {condicion}
+            BEGIN {cuerpo}
+            END
+            ''')
+
+
+def _v12_cambios_sin_marca_temporal(cursor):
+    """El registro de cambios deja de anotar los UPDATE que sólo ponen la marca actualizado_en"""
+    for tabla in TABLAS_CON_CAMBIOS:
+        _crear_triggers_cambios(cursor, tabla)
+
+
+def _v13_ultimo_cambio_por_tabla(cursor):
+    """Índice para leer el último seq de una tabla en el registro de cambios sin recorrerlo"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_cambios_tabla ON cambios(tabla, seq)")
+
+
+def _v14_cambios_por_lote(cursor):
+    """Las cargas masivas pueden anotar sus cambios por lotes en lugar de fila a fila"""
+    for tabla in TABLAS_CON_CAMBIOS:
+        _crear_triggers_cambios(cursor, tabla)
+
+
+MIGRACIONES = [
+    _v1_estructura_base,
+    _v2_columnas_servicios,
+    _v3_indices_busqueda,
+    _v4_importaciones,
+    _v5_marcas_temporales,
+    _v6_busqueda_texto,
+    _v7_tabla_objetivos,
+    _v8_flujo_entregables,
+    _v9_registro_actividad,
+    _v10_registro_cambios,
+    _v11_contadores,
+    _v12_cambios_sin_marca_temporal,
+    _v13_ultimo_cambio_por_tabla,
+    _v14_cambios_por_lote,
+]
+
+VERSION_ACTUAL = len(MIGRACIONES)
+
+
+def version_esquema(conn):
+    """Devuelve la versión del esquema guardada en la base de datos"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrar(conn):
+    """Aplica las migraciones pendientes, cada una en su propia transacción
+
+    Args:
+        conn (sqlite3.Connection): Conexión sobre la que migrar
+
+    Returns:
+        list: Números de versión aplicados (vacía si el esquema ya estaba al día)
+    """
+    if version_esquema(conn) >= VERSION_ACTUAL:
+        return []
+
+    aplicadas = []
+    while True:
+        # BEGIN IMMEDIATE bloquea a otros procesos que arranquen a la vez
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = version_esquema(conn)
+            if version >= VERSION_ACTUAL:
+                conn.rollback()
+                break
+
+            cursor = conn.cursor()
+            MIGRACIONES[version](cursor)
+            cursor.execute(f"PRAGMA user_version = {version + 1}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        aplicadas.append(version + 1)
+
+    return aplicadas
@@ -0,0 +1,60 @@
+"""Perfiles de configuración (PRAGMA) aplicados a cada conexión del pool
+
+Cada perfil es un diccionario PRAGMA -> valor. Database acepta el nombre de
+un perfil de PERFILES o un diccionario propio; los PRAGMA se ejecutan en
+orden al abrir cada conexión.
+"""
+
+# Varios usuarios sobre el mismo archivo: WAL permite que los lectores no
+# esperen nunca al escritor y synchronous=NORMAL evita un fsync por commit
+# (en WAL un corte de luz puede perder los últimos commits, no corromper la base)
+CONCURRENTE = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,              # ms esperando un bloqueo antes de SQLITE_BUSY
+    "cache_size": -16384,              # KiB (16 MiB) de caché de páginas por conexión
+    "mmap_size": 64 * 1024 * 1024,     # lecturas directamente del mapa de memoria
+    "temp_store": "MEMORY",
+    "wal_autocheckpoint": 1000,        # páginas de WAL antes de un checkpoint automático
+    "journal_size_limit": 64 * 1024 * 1024,  # tamaño al que se recorta el WAL tras reiniciarlo
+}
+
+# Como CONCURRENTE, pero con fsync en cada commit
+SEGURO = dict(CONCURRENTE, synchronous="FULL")
+
+# Configuración por defecto de SQLite (diario de rollback), para volúmenes
+# de red donde WAL no funciona
+COMPATIBLE = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "busy_timeout": 5000,
+}
+
+PERFILES = {
+    "concurrente": CONCURRENTE,
+    "seguro": SEGURO,
+    "compatible": COMPATIBLE,
+}
+
+PERFIL_POR_DEFECTO = "concurrente"
+
+
+def resolver_perfil(perfil):
+    """Devuelve el diccionario de PRAGMA de un perfil dado por nombre o ya como diccionario
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún perfil
+    """
+    if perfil is None:
+        perfil = PERFIL_POR_DEFECTO
+    if isinstance(perfil, str):
+        if perfil not in PERFILES:
+            raise ValueError(f"Perfil de base de datos desconocido: {perfil}")
+        return dict(PERFILES[perfil])
+    return dict(perfil)
+
+
+def aplicar_perfil(conn, pragmas):
+    """Ejecuta los PRAGMA del perfil sobre una conexión recién abierta"""
+    for nombre, valor in pragmas.items():
+        conn.execute(f"PRAGMA {nombre} = {valor}")
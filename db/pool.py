@@ -0,0 +1,163 @@
+import queue
+import sqlite3
+import threading
+import time
+
+from db.perfiles import aplicar_perfil
+
+
+class PoolConexiones:
+    """Pool de conexiones SQLite reutilizables entre consultas"""
+
+    # Segundos que una conexión puede estar libre antes de comprobarla al reutilizarla
+    INACTIVIDAD_MAXIMA = 30.0
+
+    def __init__(self, db_path, tamano=5, timeout=30.0, pragmas=None, sentencias_en_cache=128, metricas=None,
+                 inactividad_maxima=INACTIVIDAD_MAXIMA):
+        """Inicializa el pool sin abrir conexiones (se crean bajo demanda)
+
+        Args:
+            db_path (str): Ruta del archivo de la base de datos
+            tamano (int): Número máximo de conexiones abiertas a la vez
+            timeout (float): Segundos a esperar por una conexión libre
+            pragmas (dict, optional): PRAGMA a aplicar a cada conexión nueva (ver db.perfiles)
+            sentencias_en_cache (int): Sentencias compiladas que guarda cada conexión
+            metricas (Metricas, optional): Donde contar las conexiones abiertas
+            inactividad_maxima (float): Segundos libre tras los que una conexión se
+                comprueba con SELECT 1 antes de reutilizarla
+        """
+        if tamano < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1")
+
+        # Una base en memoria no se comparte entre conexiones distintas
+        if db_path == ":memory:":
+            tamano = 1
+
+        self.db_path = db_path
+        self.tamano = tamano
+        self.timeout = timeout
+        self.pragmas = pragmas or {}
+        self.sentencias_en_cache = sentencias_en_cache
+        self.metricas = metricas
+        self.inactividad_maxima = inactividad_maxima
+
+        # Conexiones libres como (conexión, momento en que se liberó, si falló su último uso)
+        self._disponibles = queue.LifoQueue()
+        self._conexiones = []
+        self._lock = threading.Lock()
+        self._cerrado = False
+
+    def _nueva_conexion(self):
+        """Abre una nueva conexión configurada para el resto de la aplicación"""
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False,
+                               cached_statements=self.sentencias_en_cache)
+        conn.row_factory = sqlite3.Row  # Para poder acceder por nombre de columna
+        try:
+            aplicar_perfil(conn, self.pragmas)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self._conexiones.append(conn)
+        if self.metricas is not None:
+            self.metricas.contar("conexiones_abiertas")
+        return conn
+
+    def _conexion_sana(self, conn, liberada_en, fallo):
+        """Comprueba que una conexión reutilizada siga respondiendo
+
+        Sólo se consulta la base de datos si la conexión falló en su último
+        uso o lleva más de inactividad_maxima segundos libre; en el caso
+        habitual reutilizarla no cuesta ninguna ida y vuelta a SQLite.
+        """
+        if not fallo and time.monotonic() - liberada_en <= self.inactividad_maxima:
+            return True
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _descartar(self, conn):
+        """Cierra una conexión y la retira del pool"""
+        with self._lock:
+            if conn in self._conexiones:
+                self._conexiones.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def obtener(self):
+        """Obtiene una conexión del pool, abriéndola si aún hay cupo
+
+        Returns:
+            sqlite3.Connection: Conexión lista para usar
+
+        Raises:
+            sqlite3.OperationalError: Si el pool está cerrado o agotado
+        """
+        if self._cerrado:
+            raise sqlite3.OperationalError("El pool de conexiones está cerrado")
+
+        try:
+            conn, liberada_en, fallo = self._disponibles.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._conexiones) < self.tamano:
+                    return self._nueva_conexion()
+            try:
+                conn, liberada_en, fallo = self._disponibles.get(timeout=self.timeout)
+            except queue.Empty:
+                raise sqlite3.OperationalError("No hay conexiones disponibles en el pool") from None
+
+        if not self._conexion_sana(conn, liberada_en, fallo):
+            self._descartar(conn)
+            with self._lock:
+                return self._nueva_conexion()
+
+        return conn
+
+    def liberar(self, conn, fallo=False):
+        """Devuelve una conexión al pool para que otra consulta la reutilice
+
+        Args:
+            conn (sqlite3.Connection): Conexión obtenida con obtener()
+            fallo (bool): Si su uso terminó con un error de SQLite; se
+                comprobará antes de volver a prestarla
+        """
+        if self._cerrado:
+            self._descartar(conn)
+            return
+
+        # Nunca devolver al pool una transacción a medio terminar
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._descartar(conn)
+            return
+
+        self._disponibles.put((conn, time.monotonic(), fallo))
+
+    def cerrar(self):
+        """Cierra todas las conexiones del pool"""
+        self._cerrado = True
+        with self._lock:
+            conexiones, self._conexiones = self._conexiones, []
+
+        for conn in conexiones:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+        while True:
+            try:
+                self._disponibles.get_nowait()
+            except queue.Empty:
+                break
+
+    @property
+    def abiertas(self):
+        """Número de conexiones abiertas actualmente"""
+        return len(self._conexiones)
@@ -1,31 +1,321 @@
-from db.database import Database
-from services.grupo_service import GrupoService
-from services.semillero_service import SemilleroService
-from ui.menu import Menu
-from services.entregable_service import EntregableService
+import argparse
+import sys
+import time
+from contextlib import contextmanager
 
+from db.perfiles import PERFIL_POR_DEFECTO, PERFILES
 
-def main():
+
+class PerfilArranque:
+    """Mide el tiempo de cada fase del arranque (--profile-startup)"""
+
+    def __init__(self, activo=False):
+        self.activo = activo
+        self.fases = []
+        self._inicio = time.perf_counter()
+
+    @contextmanager
+    def fase(self, nombre):
+        """Registra la duración del bloque with bajo el nombre indicado"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.fases.append((nombre, time.perf_counter() - inicio))
+
+    def imprimir(self):
+        """Muestra el tiempo empleado en cada fase si el perfil está activo"""
+        if not self.activo:
+            return
+
+        total = time.perf_counter() - self._inicio
+        print("\n=== TIEMPOS DE ARRANQUE ===")
+        for nombre, duracion in self.fases:
+            print(f"{nombre:<35} {duracion * 1000:>9.2f} ms")
+        print("-" * 47)
+        print(f"{'Total':<35} {total * 1000:>9.2f} ms")
+
+
+def _parsear_argumentos(argv=None):
+    """Lee las opciones de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Sistema de Gestión de Grupos y Semilleros de Investigación")
+    parser.add_argument("--db", metavar="ARCHIVO", default="db/semilleros.db",
+                        help="archivo de la base de datos (por defecto db/semilleros.db)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="muestra el tiempo empleado en cada fase del arranque")
+    parser.add_argument("--importar", metavar="ARCHIVO",
+                        help="importa semilleros desde un archivo CSV o JSON Lines y termina")
+    parser.add_argument("--no-reanudar", action="store_true",
+                        help="con --importar, empieza desde el principio aunque haya una importación previa")
+    parser.add_argument("--exportar", metavar="DIRECTORIO",
+                        help="exporta grupos, semilleros, objetivos, investigadores y entregables "
+                             "al directorio y termina")
+    parser.add_argument("--formato", choices=["csv", "jsonl", "columnar"], default="csv",
+                        help="formato de --exportar (por defecto csv)")
+    parser.add_argument("--since", metavar="FECHA",
+                        help="con --exportar, sólo filas modificadas después de esta fecha ISO 8601 "
+                             "(AAAA-MM-DD o AAAA-MM-DD HH:MM:SS; UTC si no lleva zona horaria)")
+    parser.add_argument("--servidor", metavar="PUERTO", type=int, nargs="?", const=8000,
+                        help="inicia la API HTTP/JSON en el puerto indicado (por defecto 8000) en lugar del menú")
+    parser.add_argument("--ttl-cache", metavar="SEGUNDOS", type=float,
+                        help="con --servidor, segundos máximos que una respuesta se sirve desde la caché "
+                             "(por defecto 5)")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="con --servidor o --feed-cambios, dirección en la que escuchar (por defecto 127.0.0.1)")
+    parser.add_argument("--perfil-db", choices=sorted(PERFILES), default=PERFIL_POR_DEFECTO,
+                        help="configuración de SQLite: concurrente (WAL, por defecto), seguro (WAL con fsync "
+                             "en cada commit) o compatible (sin WAL, para carpetas de red)")
+    parser.add_argument("--depurar-consultas", action="store_true",
+                        help="revisa al arrancar el plan de cada consulta registrada y avisa de las que "
+                             "recorren tablas completas")
+    parser.add_argument("--metricas", metavar="ARCHIVO",
+                        help="al salir, guarda las métricas de las consultas en el archivo "
+                             "(JSON si termina en .json, si no formato de texto de Prometheus)")
+    parser.add_argument("--consultas-lentas", metavar="MS", type=float,
+                        help="anota las consultas que tarden al menos MS milisegundos")
+    parser.add_argument("--registro-lentas", metavar="ARCHIVO",
+                        help="con --consultas-lentas, archivo JSON Lines donde anotarlas (por defecto la salida "
+                             "de errores)")
+    parser.add_argument("--trazas", action="store_true",
+                        help="muestra tras cada acción del menú las consultas que ha lanzado")
+    parser.add_argument("--usuario", metavar="NOMBRE",
+                        help="nombre con el que se anotan las acciones en el registro de actividad "
+                             "(por defecto el usuario del sistema)")
+    parser.add_argument("--archivar-actividad", metavar="DIAS", type=int,
+                        help="guarda en db/archivo_actividad la actividad con más de DIAS días, la borra "
+                             "de la base de datos y termina")
+    parser.add_argument("--feed-cambios", metavar="PUERTO", type=int, nargs="?", const=8001,
+                        help="emite el registro de cambios por un socket TCP local en el puerto indicado "
+                             "(por defecto 8001) en lugar del menú")
+    parser.add_argument("--exportar-cambios", metavar="DIRECTORIO",
+                        help="escribe en el directorio, como JSON Lines, los cambios posteriores a los ya "
+                             "exportados allí y termina")
+    parser.add_argument("--compactar-cambios", metavar="DIAS", type=int,
+                        help="deja sólo el último cambio de cada fila entre los de más de DIAS días y termina")
+    parser.add_argument("--reconstruir-contadores", action="store_true",
+                        help="compara los contadores de semilleros y entregables con un recuento completo, "
+                             "los vuelve a calcular y termina")
+    parser.add_argument("--compactar-cada", metavar="HORAS", type=float,
+                        help="con --servidor o --feed-cambios, compacta el registro de cambios cada HORAS horas")
+    args = parser.parse_args(argv)
+    if args.compactar_cada and args.servidor is None and args.feed_cambios is None:
+        parser.error("--compactar-cada sólo se puede usar con --servidor o --feed-cambios")
+    return args
+
+
+def _importar(db, args):
+    """Ejecuta la importación masiva pedida con --importar"""
+    import sqlite3
+    from services.importacion_service import ImportacionService
+
+    def progreso(resultado):
+        print(f"\r{resultado}", end="", flush=True)
+
+    try:
+        resultado = ImportacionService(db).importar(args.importar, reanudar=not args.no_reanudar,
+                                                    progreso=progreso)
+    except (OSError, ValueError, sqlite3.Error) as e:
+        # Los lotes ya confirmados se conservan; la siguiente ejecución continúa desde ahí
+        print(f"\nError al importar: {e}")
+        return 1
+
+    print(f"\nImportación terminada. {resultado}")
+    if resultado.omitidos:
+        print(f"Se omitieron {resultado.omitidos} registros ya importados anteriormente.")
+    if resultado.rechazados:
+        print(f"Registros rechazados guardados en: {args.importar}.rechazados.jsonl")
+    return 0
+
+
+def _exportar(db, args):
+    """Ejecuta la exportación pedida con --exportar"""
+    from services.exportacion_service import ExportacionService
+
+    try:
+        totales = ExportacionService(db).exportar(args.exportar, formato=args.formato, desde=args.since)
+    except (OSError, ValueError) as e:
+        print(f"Error al exportar: {e}")
+        return 1
+
+    for tabla, filas in totales.items():
+        print(f"{tabla}: {filas} filas exportadas")
+    return 0
+
+
+def _archivar_actividad(db, args):
+    """Ejecuta el archivado pedido con --archivar-actividad"""
+    from services.actividad_service import ActividadService
+
+    try:
+        ruta = ActividadService.compartido(db).archivar_dias(args.archivar_actividad)
+    except OSError as e:
+        print(f"Error al archivar la actividad: {e}")
+        return 1
+
+    print(f"Actividad archivada en: {ruta}" if ruta else "No hay actividad tan antigua que archivar.")
+    return 0
+
+
+def _cambios(db, args):
+    """Ejecuta la exportación o la compactación del registro de cambios"""
+    from services.cambios_service import CambiosService
+
+    cambios = CambiosService(db)
+    if args.compactar_cambios is not None:
+        print(f"{cambios.compactar(args.compactar_cambios)} cambios eliminados al compactar.")
+        return 0
+
+    try:
+        archivos = cambios.exportar_jsonl(args.exportar_cambios)
+    except OSError as e:
+        print(f"Error al exportar los cambios: {e}")
+        return 1
+    for ruta in archivos:
+        print(f"Cambios exportados en: {ruta}")
+    if not archivos:
+        print("No hay cambios nuevos que exportar.")
+    return 0
+
+
+def _reconstruir_contadores(db):
+    """Ejecuta la reconstrucción pedida con --reconstruir-contadores"""
+    from services.reports import ReporteService
+
+    diferencias = ReporteService(db).reconstruir_contadores()
+    for diferencia in diferencias:
+        print(f"{diferencia.contador} {diferencia.clave}: guardado {diferencia.guardado}, "
+              f"recuento {diferencia.recuento}")
+    print(f"Contadores reconstruidos. {len(diferencias)} diferencias corregidas.")
+    return 0
+
+
+def _compactar_periodicamente(db, args):
+    """Arranca la compactación en segundo plano pedida con --compactar-cada"""
+    if args.compactar_cada:
+        from services.cambios_service import CambiosService
+        CambiosService(db).compactar_cada(args.compactar_cada * 3600)
+
+
+def _cerrar(db, args):
+    """Guarda las métricas pedidas con --metricas y cierra la base de datos"""
+    try:
+        if args.metricas:
+            db.metricas.exportar(args.metricas)
+    except OSError as e:
+        print(f"No se pudieron guardar las métricas: {e}")
+    finally:
+        db.close()
+
+
+def main(argv=None):
     """Función principal del programa"""
+    args = _parsear_argumentos(argv)
+    perfil = PerfilArranque(args.profile_startup)
+
     print("Bienvenido al Sistema de Gestión de Grupos y Semilleros de Investigación - Universidad EAN")
 
-    # Inicializar la base de datos y servicios
-    db = Database()
-    grupo_service = GrupoService(db)
-    semillero_service = SemilleroService(db)
-    entregable_service = EntregableService(db)
+    # Los módulos se importan en el momento en que se necesitan para no pagar su carga por adelantado
+    with perfil.fase("Importar base de datos"):
+        from db.database import Database
+        from db.metricas import Metricas
+
+    metricas = Metricas(
+        umbral_lenta=args.consultas_lentas / 1000 if args.consultas_lentas is not None else None,
+        registro_lentas=args.registro_lentas or sys.stderr
+    )
+
+    # Inicializar la base de datos (sólo migra si el esquema no está en la versión actual)
+    with perfil.fase("Abrir base de datos"):
+        db = Database(args.db, perfil=args.perfil_db, depurar_consultas=args.depurar_consultas, metricas=metricas)
+
+    with perfil.fase("Importar servicios"):
+        from services.grupo_service import GrupoService
+        from services.semillero_service import SemilleroService
+        from services.entregable_service import EntregableService
+        from services.reports import ReporteService
+
+    with perfil.fase("Crear servicios"):
+        grupo_service = GrupoService(db)
+        entregable_service = EntregableService(db)
+        semillero_service = SemilleroService(db, grupo_service, entregable_service)
+        reporte_service = ReporteService(db)
+
+    # Los grupos iniciales sólo pueden faltar si el esquema se acaba de crear o actualizar
+    with perfil.fase("Cargar datos iniciales"):
+        grupos_cargados = 0
+        if db.migraciones_aplicadas:
+            grupos_cargados = grupo_service.cargar_datos_iniciales()
 
-    # Cargar datos iniciales de grupos
-    grupos_cargados = grupo_service.cargar_datos_iniciales()
     if grupos_cargados > 0:
         print(f"Se han cargado {grupos_cargados} grupos de investigación.")
     else:
         print("Los datos de grupos ya están cargados en la base de datos.")
 
+    if args.archivar_actividad is not None:
+        try:
+            return _archivar_actividad(db, args)
+        finally:
+            _cerrar(db, args)
+
+    if args.reconstruir_contadores:
+        try:
+            return _reconstruir_contadores(db)
+        finally:
+            _cerrar(db, args)
+
+    if args.exportar_cambios or args.compactar_cambios is not None:
+        try:
+            return _cambios(db, args)
+        finally:
+            _cerrar(db, args)
+
+    if args.feed_cambios is not None:
+        from api.feed_cambios import servir_cambios
+
+        _compactar_periodicamente(db, args)
+        perfil.imprimir()
+        try:
+            servir_cambios(db, args.host, args.feed_cambios)
+        finally:
+            _cerrar(db, args)
+        return 0
+
+    if args.importar or args.exportar:
+        try:
+            return _importar(db, args) if args.importar else _exportar(db, args)
+        finally:
+            _cerrar(db, args)
+
+    if args.servidor is not None:
+        with perfil.fase("Importar servidor"):
+            from api.servidor import TTL_RESPUESTAS, servir
+
+        _compactar_periodicamente(db, args)
+        perfil.imprimir()
+        try:
+            servir(db, args.host, args.servidor, TTL_RESPUESTAS if args.ttl_cache is None else args.ttl_cache)
+        finally:
+            _cerrar(db, args)
+        return 0
+
+    with perfil.fase("Importar interfaz"):
+        from ui.menu import Menu
+        from services.actividad_service import como_actor
+
+    perfil.imprimir()
+
     # Iniciar la interfaz de usuario
-    menu = Menu(grupo_service, semillero_service, entregable_service)
-    menu.mostrar_menu()
+    menu = Menu(grupo_service, semillero_service, entregable_service, reporte_service,
+                metricas=db.metricas if args.trazas else None)
+    try:
+        if args.usuario:
+            with como_actor(args.usuario):
+                menu.mostrar_menu()
+        else:
+            menu.mostrar_menu()
+    finally:
+        _cerrar(db, args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,40 @@
+class Actividad:
+    """Modelo para representar una entrada del registro de actividad
+
+    Cada entrada indica quién (actor) hizo qué (accion) sobre qué registro
+    (entidad, entidad_id) y cuándo. semillero_id es el semillero afectado,
+    también cuando la entidad es su entregable, para poder consultar toda la
+    actividad de un semillero.
+    """
+
+    CREAR_SEMILLERO = "crear_semillero"
+    CAMBIAR_STATUS = "cambiar_status"
+    CREAR_ENTREGABLE = "crear_entregable"
+    CAMBIAR_ESTADO_ENTREGABLE = "cambiar_estado_entregable"
+
+    DESCRIPCIONES = {
+        CREAR_SEMILLERO: "creó el semillero",
+        CAMBIAR_STATUS: "cambió el estado del semillero",
+        CREAR_ENTREGABLE: "asignó un entregable al semillero",
+        CAMBIAR_ESTADO_ENTREGABLE: "cambió el estado del entregable del semillero",
+    }
+
+    __slots__ = ("id", "fecha", "actor", "accion", "entidad", "entidad_id", "semillero_id", "detalle")
+
+    def __init__(self, id=None, fecha=None, actor="", accion="", entidad="", entidad_id=None,
+                 semillero_id=None, detalle=None):
+        self.id = id
+        self.fecha = fecha  # UTC, "AAAA-MM-DD HH:MM:SS.mmm"
+        self.actor = actor
+        self.accion = accion
+        self.entidad = entidad  # "semillero" o "entregable"
+        self.entidad_id = entidad_id
+        self.semillero_id = semillero_id
+        self.detalle = detalle or {}
+
+    def __str__(self):
+        descripcion = self.DESCRIPCIONES.get(self.accion, self.accion)
+        texto = f"{self.fecha[:19] if self.fecha else ''} {self.actor} {descripcion} {self.semillero_id or ''}".strip()
+        if self.detalle:
+            texto += " (" + ", ".join(f"{clave}: {valor}" for clave, valor in self.detalle.items()) + ")"
+        return texto
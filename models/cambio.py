@@ -0,0 +1,18 @@
+from collections import namedtuple
+
+
+class Cambio(namedtuple("Cambio", ["seq", "tabla", "operacion", "clave", "datos", "fecha"])):
+    """Entrada del registro de cambios (change data capture)
+
+    seq crece con cada escritura confirmada. clave identifica la fila con
+    las columnas de su clave primaria (por ejemplo {"id": 3}); datos tiene
+    la fila completa tras un insert o update y es None en un delete. Un
+    consumidor reproduce el estado aplicando los cambios en orden de seq:
+    guardar datos bajo (tabla, clave), o borrar la fila si es un delete.
+    """
+
+    __slots__ = ()
+
+    def a_dict(self):
+        """Cambio en tipos básicos, para JSON"""
+        return self._asdict()
@@ -11,6 +11,9 @@ class Entregable:
 
     ESTADOS = ["pendiente", "aprobado", "rechazado"]
 
+    __slots__ = ("id", "titulo", "descripcion", "tipo", "semillero_id", "fecha_entrega", "estado",
+                 "semillero_nombre")
+
     def __init__(self, id=None, titulo="", descripcion="", tipo="",
                  semillero_id=None, fecha_entrega=None, estado="pendiente"):
         self.id = id
@@ -1,6 +1,8 @@
 class Grupo:
     """Modelo para representar un Grupo de Investigación"""
 
+    __slots__ = ("id", "nombre", "campo", "identificador", "director", "semillero_id")
+
     def __init__(self, id=None, nombre="", campo="", identificador="", director="", semillero_id=None):
         self.id = id
         self.nombre = nombre
@@ -1,6 +1,9 @@
 class Investigador:
     """Modelo para representar un Investigador (estudiante o tutor)"""
 
+    # __weakref__ permite guardarlo en el mapa de identidad de SemilleroService
+    __slots__ = ("id", "nombre", "tipo", "email", "semillero_id", "__weakref__")
+
     def __init__(self, id=None, nombre="", tipo="estudiante", email="", semillero_id=None):
         self.id = id
         self.nombre = nombre
@@ -0,0 +1,72 @@
+from array import array
+from collections import namedtuple
+
+
+class ConjuntoResultados:
+    """Conjunto de filas guardado por columnas que crea los modelos al acceder
+
+    En lugar de mantener un objeto por fila, los valores de cada columna se
+    guardan en una lista (o en un array compacto para columnas enteras sin
+    nulos) y el modelo de una fila sólo se construye cuando se accede a ella.
+    Se comporta como una secuencia de sólo lectura: admite len(), índices,
+    iteración y comprobación de vacío.
+    """
+
+    __slots__ = ("columnas", "_datos", "_fabrica")
+
+    def __init__(self, columnas, fabrica, tipos=None):
+        """
+        Args:
+            columnas (list): Nombres de las columnas en orden
+            fabrica (callable): Recibe los valores de una fila (en el orden de
+                las columnas) y devuelve el modelo correspondiente
+            tipos (dict, optional): Columna -> código de tipo de array.array
+                (por ejemplo 'q' para IDs enteros que nunca son nulos)
+        """
+        tipos = tipos or {}
+        self.columnas = list(columnas)
+        self._fabrica = fabrica
+        self._datos = [array(tipos[columna]) if columna in tipos else [] for columna in self.columnas]
+
+    @classmethod
+    def desde_filas(cls, columnas, filas, fabrica, tipos=None):
+        """Construye el conjunto a partir de filas de la base de datos"""
+        conjunto = cls(columnas, fabrica, tipos)
+        for fila in filas:
+            conjunto.agregar(fila)
+        return conjunto
+
+    def agregar(self, fila):
+        """Añade una fila (secuencia de valores en el orden de las columnas)"""
+        for destino, valor in zip(self._datos, fila):
+            destino.append(valor)
+
+    def columna(self, nombre):
+        """Devuelve todos los valores de una columna sin construir modelos"""
+        return self._datos[self.columnas.index(nombre)]
+
+    def __len__(self):
+        return len(self._datos[0]) if self._datos else 0
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        return self._fabrica(*(datos[indice] for datos in self._datos))
+
+    def __iter__(self):
+        for valores in zip(*self._datos):
+            yield self._fabrica(*valores)
+
+    def __repr__(self):
+        return f"<ConjuntoResultados {len(self)} filas: {', '.join(self.columnas)}>"
+
+
+class Pagina(namedtuple("Pagina", ["elementos", "anterior", "siguiente"])):
+    """Página de un listado paginado por clave (keyset)
+
+    anterior y siguiente son los cursores a pasar como antes= o despues=
+    para pedir la página contigua, o None si no hay más elementos en esa
+    dirección.
+    """
+
+    __slots__ = ()
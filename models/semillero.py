@@ -1,20 +1,119 @@
+from collections import namedtuple
+
+
+# Marca de una relación que todavía no se ha consultado
+_NO_CARGADO = object()
+
+
 class Semillero:
-    """Modelo para representar un Semillero de Investigación"""
+    """Modelo para representar un Semillero de Investigación
+
+    Las relaciones (objetivos específicos, estudiantes, tutores, grupo y
+    entregable) se consultan la primera vez que se accede a ellas a través
+    del cargador que asigna SemilleroService. Un semillero creado a mano no
+    tiene cargador y sus relaciones empiezan vacías.
+    """
+
+    __slots__ = ("id", "nombre", "objetivo_principal", "grupo_id", "status", "grupo_nombre",
+                 "_objetivos", "_estudiantes", "_tutores", "_grupo", "_entregable", "_cargador")
 
     def __init__(self, id=None, nombre="", objetivo_principal="", objetivos_especificos=None,
                  grupo_id=None, status="pendiente"):
         self.id = id
         self.nombre = nombre
         self.objetivo_principal = objetivo_principal
-        self.objetivos_especificos = objetivos_especificos or []
         self.grupo_id = grupo_id
         self.status = status  # "activo" o "pendiente"
 
-        # Relaciones
-        self.estudiantes = []
-        self.tutores = []
+        # Relaciones (se cargan o se crean al primer acceso)
+        self._objetivos = objetivos_especificos
+        self._estudiantes = None
+        self._tutores = None
+        self._grupo = _NO_CARGADO
+        self._entregable = _NO_CARGADO
+        self._cargador = None
         self.grupo_nombre = None  # Para mostrar el nombre del grupo asociado
 
+    def _cargar(self, relacion):
+        """Pide al cargador la relación indicada, si el semillero tiene uno"""
+        if self._cargador is not None:
+            self._cargador.cargar(relacion)
+
+    @property
+    def objetivos_especificos(self):
+        """Objetivos específicos en orden (tabla semillero_objetivos)"""
+        if self._objetivos is None:
+            self._cargar("objetivos")
+            if self._objetivos is None:
+                self._objetivos = []
+        return self._objetivos
+
+    @objetivos_especificos.setter
+    def objetivos_especificos(self, valor):
+        self._objetivos = valor
+
+    @property
+    def estudiantes(self):
+        if self._estudiantes is None:
+            self._cargar("investigadores")
+            if self._estudiantes is None:
+                self._estudiantes = []
+        return self._estudiantes
+
+    @estudiantes.setter
+    def estudiantes(self, valor):
+        self._estudiantes = valor
+
+    @property
+    def tutores(self):
+        if self._tutores is None:
+            self._cargar("investigadores")
+            if self._tutores is None:
+                self._tutores = []
+        return self._tutores
+
+    @tutores.setter
+    def tutores(self, valor):
+        self._tutores = valor
+
+    @property
+    def grupo(self):
+        """Grupo de investigación al que está adscrito el semillero"""
+        if self._grupo is _NO_CARGADO:
+            self._cargar("grupo")
+            if self._grupo is _NO_CARGADO:
+                self._grupo = None
+        return self._grupo
+
+    @grupo.setter
+    def grupo(self, valor):
+        self._grupo = valor
+
+    @property
+    def entregable(self):
+        """Entregable asignado al semillero, o None si no tiene"""
+        if self._entregable is _NO_CARGADO:
+            self._cargar("entregable")
+            if self._entregable is _NO_CARGADO:
+                self._entregable = None
+        return self._entregable
+
+    @entregable.setter
+    def entregable(self, valor):
+        self._entregable = valor
+
+    def relacion_cargada(self, relacion):
+        """Indica si una relación ya está en memoria (no dispara ninguna consulta)"""
+        if relacion == "objetivos":
+            return self._objetivos is not None
+        if relacion == "investigadores":
+            return self._estudiantes is not None and self._tutores is not None
+        if relacion == "grupo":
+            return self._grupo is not _NO_CARGADO
+        if relacion == "entregable":
+            return self._entregable is not _NO_CARGADO
+        raise ValueError(f"Relación desconocida: {relacion}")
+
     def __str__(self):
         return f"{self.nombre} - {self.status.upper()}"
 
@@ -68,3 +167,12 @@ class Semillero:
             detalles.append(f"  - {tutor}")
 
         return "\n".join(detalles)
+
+
+class SemilleroResumen(namedtuple("SemilleroResumen", ["id", "nombre", "status", "grupo_nombre"])):
+    """Proyección ligera de un semillero para pantallas de listado"""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return f"{self.nombre} - {self.status.upper()}"
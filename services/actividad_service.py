@@ -0,0 +1,267 @@
+import contextvars
+import getpass
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from models.actividad import Actividad
+
+
+# Actor de las acciones registradas en este contexto (usuario del menú, cliente de la API)
+_actor = contextvars.ContextVar("actor", default=None)
+
+# Límite superior de fecha que queda por encima de cualquier fecha registrada
+_SIN_LIMITE = "9999"
+
+
+def _usuario_sistema():
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "desconocido"
+
+
+def actor_actual():
+    """Actor al que se atribuyen las acciones: el de como_actor() o el usuario del sistema"""
+    return _actor.get() or _usuario_sistema()
+
+
+@contextmanager
+def como_actor(actor):
+    """Atribuye a actor las acciones registradas dentro del bloque with
+
+    Se propaga con contextvars, así que sigue a la operación a través de la
+    fachada asyncio.
+    """
+    token = _actor.set(actor)
+    try:
+        yield
+    finally:
+        _actor.reset(token)
+
+
+def _fecha(momento=None):
+    """Fecha UTC con milisegundos en el formato de la columna fecha"""
+    return (momento or datetime.now(timezone.utc)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+
+class ActividadService:
+    """Registro de actividad de solo inserción
+
+    Las acciones se anotan en memoria y se escriben por lotes con un único
+    executemany y un único commit, cuando el lote se llena o, como mucho,
+    intervalo segundos después de la primera acción pendiente. Así registrar
+    una acción no añade un commit a cada operación del usuario. Las consultas
+    de este servicio escriben antes lo pendiente, y Database.close() lo
+    escribe al cerrar. Un lote que se llena dentro de una transacción se
+    escribe cuando ésta se confirma.
+
+    La tabla actividades no admite UPDATE, y sólo se pueden borrar entradas
+    ya guardadas en un archivo con archivar().
+    """
+
+    TAMANO_LOTE = 200
+    INTERVALO = 1.0  # segundos
+
+    # Instancia compartida por cada Database, para que todos los servicios usen el mismo búfer
+    _compartidos = weakref.WeakKeyDictionary()
+    _compartidos_lock = threading.Lock()
+
+    def __init__(self, db, tamano_lote=TAMANO_LOTE, intervalo=INTERVALO):
+        """
+        Args:
+            db (Database): Base de datos
+            tamano_lote (int): Acciones pendientes que provocan una escritura inmediata
+            intervalo (float): Segundos máximos que una acción espera a escribirse
+        """
+        self.db = db
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self._pendientes = []
+        self._lock = threading.Lock()
+        # Un solo lote se escribe a la vez, para que los IDs sigan el orden de registro
+        self._escritura = threading.Lock()
+        self._temporizador = None
+        self._cerrado = False
+
+    @classmethod
+    def compartido(cls, db):
+        """Devuelve el ActividadService compartido de db, que se vacía al cerrar db"""
+        with cls._compartidos_lock:
+            servicio = cls._compartidos.get(db)
+            if servicio is None:
+                servicio = cls._compartidos[db] = cls(db)
+                db.al_cerrar(servicio.cerrar)
+            return servicio
+
+    def registrar(self, accion, entidad, entidad_id, semillero_id=None, detalle=None):
+        """Anota una acción del actor actual; se escribe en la base de datos más tarde
+
+        Args:
+            accion (str): Una de las acciones de Actividad (por ejemplo Actividad.CAMBIAR_STATUS)
+            entidad (str): 'semillero' o 'entregable'
+            entidad_id (int): ID del registro afectado
+            semillero_id (int, optional): Semillero afectado
+            detalle (dict, optional): Datos adicionales (por ejemplo el nuevo estado)
+        """
+        fila = (_fecha(), actor_actual(), accion, entidad, entidad_id, semillero_id,
+                json.dumps(detalle, ensure_ascii=False, separators=(",", ":")) if detalle else None)
+
+        # Dentro de una transacción el lote se uniría a ella y se perdería con un rollback:
+        # se escribe al confirmarla, y si se deshace queda el temporizador
+        en_transaccion = self.db._transaccion_actual() is not None
+        with self._lock:
+            self._pendientes.append(fila)
+            lleno = len(self._pendientes) >= self.tamano_lote
+            if (not lleno or en_transaccion) and self._temporizador is None and not self._cerrado:
+                self._temporizador = threading.Timer(self.intervalo, self._vaciar_programado)
+                self._temporizador.daemon = True
+                self._temporizador.start()
+
+        if lleno:
+            if en_transaccion:
+                self.db.al_confirmar(self._vaciar_programado)
+            else:
+                self.vaciar()
+
+    @property
+    def pendientes(self):
+        """Acciones anotadas que aún no se han escrito"""
+        with self._lock:
+            return len(self._pendientes)
+
+    def _vaciar_programado(self):
+        with self._lock:
+            self._temporizador = None
+        try:
+            self.vaciar()
+        except sqlite3.Error:
+            # Las acciones siguen pendientes y se reintentan en el siguiente lote
+            pass
+
+    def vaciar(self):
+        """Escribe todas las acciones pendientes con un único commit
+
+        Returns:
+            int: Acciones escritas
+
+        Raises:
+            sqlite3.Error: Si la escritura falla; las acciones siguen pendientes
+        """
+        with self._escritura:
+            with self._lock:
+                filas, self._pendientes = self._pendientes, []
+                if self._temporizador is not None:
+                    self._temporizador.cancel()
+                    self._temporizador = None
+            if not filas:
+                return 0
+
+            try:
+                self.db.consulta_varias("actividades.insertar", filas)
+            except sqlite3.Error:
+                with self._lock:
+                    self._pendientes[:0] = filas
+                raise
+            return len(filas)
+
+    def cerrar(self):
+        """Escribe lo pendiente y deja de programar escrituras en segundo plano"""
+        with self._lock:
+            self._cerrado = True
+        self.vaciar()
+
+    def por_semillero(self, semillero_id, desde=None, hasta=None, limite=100):
+        """Actividad de un semillero, de la más reciente a la más antigua
+
+        Args:
+            semillero_id (int): ID del semillero
+            desde (str, optional): Fecha UTC mínima (incluida), 'AAAA-MM-DD[ HH:MM:SS]'
+            hasta (str, optional): Fecha UTC máxima (excluida)
+            limite (int): Número máximo de entradas
+
+        Returns:
+            list: Lista de objetos Actividad
+        """
+        return self._consultar("actividades.por_semillero", (semillero_id,), desde, hasta, limite)
+
+    def por_actor(self, actor, desde=None, hasta=None, limite=100):
+        """Actividad de un actor, de la más reciente a la más antigua"""
+        return self._consultar("actividades.por_actor", (actor,), desde, hasta, limite)
+
+    def entre_fechas(self, desde=None, hasta=None, limite=100):
+        """Toda la actividad en [desde, hasta), de la más reciente a la más antigua"""
+        return self._consultar("actividades.entre_fechas", (), desde, hasta, limite)
+
+    def _consultar(self, nombre, params, desde, hasta, limite):
+        self.vaciar()
+        filas = self.db.consulta(nombre, params + (desde or "", hasta or _SIN_LIMITE, limite), fetch='all')
+        return [self._desde_fila(fila) for fila in filas]
+
+    @staticmethod
+    def _desde_fila(fila):
+        detalle = fila['detalle']
+        return Actividad(id=fila['id'], fecha=fila['fecha'], actor=fila['actor'], accion=fila['accion'],
+                         entidad=fila['entidad'], entidad_id=fila['entidad_id'],
+                         semillero_id=fila['semillero_id'], detalle=json.loads(detalle) if detalle else None)
+
+    def archivar(self, antes_de, directorio="db/archivo_actividad"):
+        """Pasa a un archivo JSONL comprimido la actividad anterior a una fecha y la borra de la tabla
+
+        Se archivan todas las entradas hasta la última con fecha anterior a
+        antes_de. El archivo se escribe completo antes de borrar nada, y el
+        borrado y su anotación en actividades_archivadas van en una sola
+        transacción.
+
+        Args:
+            antes_de (str | datetime): Fecha UTC límite (excluida)
+            directorio (str): Carpeta donde dejar el archivo
+
+        Returns:
+            str: Ruta del archivo creado, o None si no había nada que archivar
+        """
+        if isinstance(antes_de, datetime):
+            antes_de = _fecha(antes_de.astimezone(timezone.utc))
+
+        self.vaciar()
+        ultima = self.db.consulta("actividades.ultima_antes_de", (antes_de,), fetch='one')
+        if ultima is None:
+            return None
+        hasta_id = ultima['id']
+
+        os.makedirs(directorio, exist_ok=True)
+        temporal = os.path.join(directorio, f".actividad-{hasta_id}.tmp")
+        desde_id, filas = None, 0
+        with gzip.open(temporal, "wt", encoding="utf-8") as archivo:
+            for fila in self.db.iter_query("SELECT * FROM actividades WHERE id <= ? ORDER BY id", (hasta_id,)):
+                desde_id = fila['id'] if desde_id is None else desde_id
+                archivo.write(json.dumps(dict(fila), ensure_ascii=False, separators=(",", ":")) + "\n")
+                filas += 1
+
+        ruta = os.path.join(directorio, f"actividad-{desde_id:08d}-{hasta_id:08d}.jsonl.gz")
+        os.replace(temporal, ruta)
+
+        with self.db.transaction():
+            self.db.consulta("actividades_archivadas.insertar", (ruta, desde_id, hasta_id, filas, _fecha()))
+            self.db.consulta("actividades.archivar", (hasta_id,))
+        return ruta
+
+    def archivar_dias(self, dias, directorio="db/archivo_actividad"):
+        """Archiva la actividad con más de dias días de antigüedad"""
+        return self.archivar(datetime.now(timezone.utc) - timedelta(days=dias), directorio)
+
+    @classmethod
+    def leer_archivo(cls, ruta):
+        """Recorre las entradas de un archivo creado por archivar()
+
+        Yields:
+            Actividad: Cada entrada, en el orden en que se registraron
+        """
+        with gzip.open(ruta, "rt", encoding="utf-8") as archivo:
+            for linea in archivo:
+                yield cls._desde_fila(json.loads(linea))
@@ -0,0 +1,158 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.paginacion import TAMANO_PAGINA
+from services.semillero_service import SemilleroService
+
+# Métodos públicos de los servicios síncronos que las fachadas no exponen, y por qué
+OMITIDOS = {
+    "GrupoService.cargar_datos_iniciales": "se ejecuta una vez al arrancar, fuera del bucle de eventos",
+    "GrupoService.estadisticas_cache": "sólo lee contadores en memoria, sin acceder a la base de datos",
+    "SemilleroService.precargar": "las fachadas ya devuelven los semilleros con sus relaciones cargadas",
+}
+
+
+class _FachadaAsincrona:
+    """Base de las fachadas asyncio sobre los servicios síncronos
+
+    Cada llamada se ejecuta en el ejecutor de base de datos para no bloquear
+    el bucle de eventos mientras SQLite lee o escribe. Se copia el contexto
+    (contextvars) del llamador, de modo que los valores asociados a la
+    petición siguen disponibles dentro del hilo.
+    """
+
+    def __init__(self, servicio, ejecutor):
+        self.servicio = servicio
+        self.ejecutor = ejecutor
+
+    async def _ejecutar(self, funcion, *args, **kwargs):
+        contexto = contextvars.copy_context()
+        llamada = functools.partial(contexto.run, funcion, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.ejecutor, llamada)
+
+
+class GrupoServiceAsincrono(_FachadaAsincrona):
+    """Versión asyncio de GrupoService"""
+
+    async def crear_grupo(self, grupo):
+        return await self._ejecutar(self.servicio.crear_grupo, grupo)
+
+    async def obtener_todos(self):
+        return await self._ejecutar(self.servicio.obtener_todos)
+
+    async def obtener_por_id(self, grupo_id):
+        return await self._ejecutar(self.servicio.obtener_por_id, grupo_id)
+
+    async def listar_pagina(self, tamano=TAMANO_PAGINA, despues=None, antes=None):
+        return await self._ejecutar(self.servicio.listar_pagina, tamano, despues, antes)
+
+    async def obtener_lineas_investigacion(self, grupo_id):
+        return await self._ejecutar(self.servicio.obtener_lineas_investigacion, grupo_id)
+
+
+class SemilleroServiceAsincrono(_FachadaAsincrona):
+    """Versión asyncio de SemilleroService
+
+    Los semilleros devueltos traen todas sus relaciones ya cargadas (salvo
+    que se indique otro prefetch): acceder después a una relación diferida
+    haría una consulta síncrona dentro del bucle de eventos.
+    """
+
+    async def crear_semillero(self, semillero):
+        return await self._ejecutar(self.servicio.crear_semillero, semillero)
+
+    async def obtener_todos(self, prefetch=None):
+        return await self._ejecutar(self.servicio.obtener_todos, self._prefetch(prefetch))
+
+    async def obtener_por_id(self, semillero_id, prefetch=None):
+        return await self._ejecutar(self.servicio.obtener_por_id, semillero_id, self._prefetch(prefetch))
+
+    async def obtener_por_grupo(self, grupo_id, prefetch=None):
+        return await self._ejecutar(self.servicio.obtener_por_grupo, grupo_id, self._prefetch(prefetch))
+
+    async def listar_resumen(self, grupo_id=None):
+        return await self._ejecutar(self.servicio.listar_resumen, grupo_id)
+
+    async def listar_pagina(self, tamano=TAMANO_PAGINA, despues=None, antes=None, grupo_id=None, status=None):
+        return await self._ejecutar(self.servicio.listar_pagina, tamano, despues, antes, grupo_id, status)
+
+    async def buscar(self, texto, limit=20):
+        return await self._ejecutar(self.servicio.buscar, texto, limit)
+
+    async def cambiar_status(self, semillero_id, nuevo_status):
+        return await self._ejecutar(self.servicio.cambiar_status, semillero_id, nuevo_status)
+
+    def _prefetch(self, prefetch):
+        return self.servicio.RELACIONES if prefetch is None else prefetch
+
+
+class EntregableServiceAsincrono(_FachadaAsincrona):
+    """Versión asyncio de EntregableService"""
+
+    async def crear_entregable(self, entregable):
+        return await self._ejecutar(self.servicio.crear_entregable, entregable)
+
+    async def obtener_por_semillero(self, semillero_id):
+        return await self._ejecutar(self.servicio.obtener_por_semillero, semillero_id)
+
+    async def obtener_por_semilleros(self, semillero_ids):
+        return await self._ejecutar(self.servicio.obtener_por_semilleros, semillero_ids)
+
+    async def transiciones(self):
+        return await self._ejecutar(self.servicio.transiciones)
+
+    async def cambiar_estado(self, entregable_id, nuevo_estado):
+        return await self._ejecutar(self.servicio.cambiar_estado, entregable_id, nuevo_estado)
+
+    async def cambiar_estado_lote(self, nuevo_estado, ids=None, grupo_id=None, tipo=None, entregado_hasta=None):
+        return await self._ejecutar(self.servicio.cambiar_estado_lote, nuevo_estado, ids, grupo_id, tipo,
+                                    entregado_hasta)
+
+    async def cola_revision(self, tamano=TAMANO_PAGINA, despues=None):
+        return await self._ejecutar(self.servicio.cola_revision, tamano, despues)
+
+
+class ServiciosAsincronos:
+    """Fachadas asyncio de los servicios sobre un mismo ejecutor de base de datos
+
+    El ejecutor tiene tantos hilos como conexiones el pool de la base de
+    datos, así que nunca hay hilos esperando una conexión libre: las
+    peticiones que no caben esperan en la cola del ejecutor sin ocupar el
+    bucle de eventos. Se usa como contexto asíncrono:
+
+        async with ServiciosAsincronos(db) as servicios:
+            semillero = await servicios.semilleros.obtener_por_id(1)
+    """
+
+    def __init__(self, db, hilos=None, grupo_service=None, semillero_service=None, entregable_service=None):
+        """
+        Args:
+            db (Database): Base de datos compartida por los servicios
+            hilos (int, optional): Hilos del ejecutor; por defecto el tamaño del pool
+            grupo_service, semillero_service, entregable_service (optional):
+                Servicios síncronos ya creados; si no se pasan se crean aquí
+        """
+        grupo_service = grupo_service or GrupoService(db)
+        entregable_service = entregable_service or EntregableService(db)
+        semillero_service = semillero_service or SemilleroService(db, grupo_service, entregable_service)
+
+        self.ejecutor = ThreadPoolExecutor(max_workers=hilos or db.pool.tamano,
+                                           thread_name_prefix="semilleros-db")
+        self.grupos = GrupoServiceAsincrono(grupo_service, self.ejecutor)
+        self.semilleros = SemilleroServiceAsincrono(semillero_service, self.ejecutor)
+        self.entregables = EntregableServiceAsincrono(entregable_service, self.ejecutor)
+
+    def cerrar(self):
+        """Espera a las llamadas en curso y detiene los hilos del ejecutor"""
+        self.ejecutor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # shutdown(wait=True) bloquearía el bucle: se espera desde otro hilo
+        await asyncio.get_running_loop().run_in_executor(None, self.cerrar)
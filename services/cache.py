@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class CacheConsultas:
+    """Caché en memoria de resultados de consultas
+
+    Cada entrada guarda la versión de las tablas de las que depende
+    (Database.version_tablas). Si alguna de esas tablas recibe una escritura
+    la entrada deja de ser válida y se vuelve a calcular en el siguiente
+    acceso; para las tablas del registro de cambios esto incluye las
+    escrituras de otras conexiones y otros procesos, que se comprueban una
+    vez por operación (traza). El TTL opcional limita
+    además la antigüedad de los resultados de las demás tablas, y maximo
+    limita el número de entradas descartando las usadas hace más tiempo.
+    """
+
+    def __init__(self, db, ttl=None, maximo=None):
+        """
+        Args:
+            db (Database): Base de datos de la que se leen las versiones de tabla
+            ttl (float, optional): Segundos máximos que una entrada se considera válida
+            maximo (int, optional): Número máximo de entradas guardadas
+        """
+        self.db = db
+        self.ttl = ttl
+        self.maximo = maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, clave, tablas, calcular):
+        """Devuelve el resultado guardado o lo calcula si no es válido
+
+        Args:
+            clave (hashable): Identificador del resultado
+            tablas (tuple): Tablas de las que depende el resultado
+            calcular (callable): Función sin argumentos que produce el resultado
+
+        Returns:
+            El resultado de calcular(), posiblemente de una llamada anterior
+        """
+        # La versión se lee antes de calcular: una escritura concurrente invalida el resultado
+        versiones = self.db.version_tablas(tablas)
+        ahora = time.monotonic()
+
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                versiones_guardadas, creado, valor = entrada
+                if versiones_guardadas == versiones and (self.ttl is None or ahora - creado < self.ttl):
+                    self.aciertos += 1
+                    self._entradas.move_to_end(clave)
+                    return valor
+            self.fallos += 1
+
+        valor = calcular()
+
+        with self._lock:
+            self._entradas[clave] = (versiones, ahora, valor)
+            self._entradas.move_to_end(clave)
+            if self.maximo is not None and len(self._entradas) > self.maximo:
+                self._entradas.popitem(last=False)
+
+        return valor
+
+    def invalidar(self, clave=None):
+        """Descarta una entrada concreta o, sin clave, todas las entradas"""
+        with self._lock:
+            if clave is None:
+                self._entradas.clear()
+            else:
+                self._entradas.pop(clave, None)
+
+    def estadisticas(self):
+        """Devuelve los contadores de aciertos y fallos de la caché"""
+        with self._lock:
+            return {"aciertos": self.aciertos, "fallos": self.fallos, "entradas": len(self._entradas)}
@@ -0,0 +1,139 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from models.cambio import Cambio
+
+
+# Archivos que escribe exportar_jsonl: cambios-<primer seq>-<último seq>.jsonl
+_ARCHIVO_CAMBIOS = re.compile(r"^cambios-(\d+)-(\d+)\.jsonl$")
+
+
+class CambiosService:
+    """Lectura, exportación y compactación del registro de cambios
+
+    Los triggers de la migración v10 anotan en la tabla cambios cada
+    INSERT, UPDATE y DELETE de las tablas de TABLAS_CON_CAMBIOS, hechos por
+    esta aplicación o por cualquier otro proceso que escriba en el archivo.
+    Los consumidores piden sólo lo posterior al último seq que procesaron en
+    lugar de comparar tablas enteras.
+    """
+
+    LIMITE = 1000
+    DIAS_SIN_COMPACTAR = 7
+
+    def __init__(self, db):
+        self.db = db
+        self._compactacion = None
+
+    def cambios_desde(self, seq=0, limite=LIMITE):
+        """Cambios posteriores a seq, en orden
+
+        Args:
+            seq (int): Último seq ya procesado por el consumidor (0 para empezar desde el principio)
+            limite (int): Número máximo de cambios a devolver
+
+        Returns:
+            list: Objetos Cambio; el seq del último es el que hay que pasar en la siguiente llamada
+        """
+        if limite < 1:
+            raise ValueError("El límite debe ser al menos 1")
+
+        filas = self.db.consulta("cambios.desde", (seq, limite), fetch='all')
+        return [Cambio(fila['seq'], fila['tabla'], fila['operacion'], json.loads(fila['clave']),
+                       json.loads(fila['datos']) if fila['datos'] is not None else None, fila['fecha'])
+                for fila in filas]
+
+    def ultimo_seq(self):
+        """Número de secuencia del cambio más reciente (0 si no hay ninguno)"""
+        return self.db.consulta("cambios.ultimo", fetch='one')[0]
+
+    def seguir(self, seq=0, intervalo=0.5, limite=LIMITE, detener=None):
+        """Recorre los cambios posteriores a seq y espera a los nuevos a medida que se confirman
+
+        Args:
+            seq (int): Último seq ya procesado
+            intervalo (float): Segundos entre consultas cuando no hay cambios nuevos
+            limite (int): Cambios leídos por consulta
+            detener (threading.Event, optional): Termina el recorrido cuando se activa
+
+        Yields:
+            Cambio: Cada cambio, en orden de seq
+        """
+        detener = detener or threading.Event()
+        while not detener.is_set():
+            cambios = self.cambios_desde(seq, limite)
+            yield from cambios
+            if cambios:
+                seq = cambios[-1].seq
+            if len(cambios) < limite:
+                detener.wait(intervalo)
+
+    def exportar_jsonl(self, directorio, limite_por_archivo=10000):
+        """Escribe en archivos JSON Lines los cambios aún no exportados al directorio
+
+        Continúa a partir del último seq de los archivos cambios-<desde>-<hasta>.jsonl
+        que ya haya en el directorio. Cada archivo se escribe con otro nombre y
+        se renombra al terminar, así que un consumidor nunca ve uno a medias.
+
+        Returns:
+            list: Rutas de los archivos creados
+        """
+        os.makedirs(directorio, exist_ok=True)
+        seq = max((int(m.group(2)) for m in map(_ARCHIVO_CAMBIOS.match, os.listdir(directorio)) if m), default=0)
+
+        creados = []
+        while True:
+            cambios = self.cambios_desde(seq, limite_por_archivo)
+            if not cambios:
+                return creados
+
+            ruta = os.path.join(directorio, f"cambios-{cambios[0].seq:012d}-{cambios[-1].seq:012d}.jsonl")
+            temporal = ruta + ".tmp"
+            with open(temporal, "w", encoding="utf-8") as archivo:
+                for cambio in cambios:
+                    archivo.write(json.dumps(cambio.a_dict(), ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(temporal, ruta)
+            creados.append(ruta)
+            seq = cambios[-1].seq
+
+    def compactar(self, dias=DIAS_SIN_COMPACTAR):
+        """Deja sólo el último cambio de cada fila entre los de más de dias días
+
+        Un consumidor que aplique el registro compactado, desde cualquier seq,
+        llega al mismo estado final; sólo pierde los estados intermedios. Los
+        delete se conservan para que sepa qué filas borrar.
+
+        Returns:
+            int: Cambios eliminados
+        """
+        limite = (datetime.now(timezone.utc) - timedelta(days=dias)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        ultimo = self.db.consulta("cambios.ultimo_antes_de", (limite,), fetch='one')
+        if ultimo is None:
+            return 0
+        return self.db.consulta("cambios.compactar", (ultimo['seq'], ultimo['seq']), fetch='rowcount')
+
+    def compactar_cada(self, segundos, dias=DIAS_SIN_COMPACTAR):
+        """Compacta el registro en segundo plano cada tantos segundos hasta que se cierre la base de datos"""
+        if self._compactacion is not None:
+            return
+        self._compactacion = threading.Event()
+        detener = self._compactacion
+        self.db.al_cerrar(detener.set)
+
+        def compactar_periodicamente():
+            while not detener.wait(segundos):
+                inicio = time.perf_counter()
+                try:
+                    eliminados = self.compactar(dias)
+                except Exception as e:
+                    print(f"Error compactando el registro de cambios: {e}")
+                    continue
+                if eliminados:
+                    print(f"Registro de cambios compactado: {eliminados} cambios eliminados "
+                          f"en {time.perf_counter() - inicio:.2f} s")
+
+        threading.Thread(target=compactar_periodicamente, name="compactar-cambios", daemon=True).start()
@@ -1,34 +1,45 @@
+import sqlite3
 from datetime import datetime
+from models.actividad import Actividad
 from models.entregable import Entregable
+from models.resultados import Pagina
+from services.cache import CacheConsultas
+from services.paginacion import TAMANO_PAGINA
 
 
 class EntregableService:
-    """Servicio para gestionar entregables de semilleros"""
+    """Servicio para gestionar entregables de semilleros
 
-    def __init__(self, db):
+    Los cambios de estado siguen la tabla transiciones_entregable (por
+    ejemplo, un entregable aprobado debe volver a pendiente antes de poder
+    rechazarse). Un trigger impide en la propia base de datos cualquier otro
+    cambio, y cada semillero puede tener como mucho un entregable gracias a un
+    índice único sobre semillero_id.
+    """
+
+    # IDs por sentencia en los cambios de estado por lotes
+    TAMANO_LOTE = 500
+
+    def __init__(self, db, actividad_service=None):
         self.db = db
+        self.cache = CacheConsultas(db)
+        self._actividad_service = actividad_service
+
+    @property
+    def actividad_service(self):
+        """ActividadService en el que se anotan las acciones (el compartido de la base de datos)"""
+        if self._actividad_service is None:
+            from services.actividad_service import ActividadService
+            self._actividad_service = ActividadService.compartido(self.db)
+        return self._actividad_service
 
     def crear_entregable(self, entregable):
         """Crea un nuevo entregable en la base de datos"""
-        # Verificar si el semillero ya tiene un entregable
-        query_check = """
-            SELECT COUNT(*) as total FROM entregables 
-            WHERE semillero_id = ?
-        """
-        result = self.db.execute_query(query_check, (entregable.semillero_id,), fetch='one')
-
-        if result and result['total'] > 0:
-            return False, "Este semillero ya tiene un entregable asignado"
-
         # Guardar la fecha actual si no se proporcionó una
         if not entregable.fecha_entrega:
             entregable.fecha_entrega = datetime.now().strftime("%Y-%m-%d")
 
         # Insertar el entregable
-        query = """
-            INSERT INTO entregables (titulo, descripcion, tipo, semillero_id, fecha_entrega, estado)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """
         params = (
             entregable.titulo,
             entregable.descripcion,
@@ -38,23 +49,59 @@ class EntregableService:
             entregable.estado
         )
 
-        entregable.id = self.db.execute_query(query, params)
+        # El índice único resuelve sin carreras que dos usuarios asignen entregable a la vez
+        try:
+            entregable.id = self.db.consulta("entregables.insertar", params)
+        except sqlite3.IntegrityError as e:
+            if "entregables.semillero_id" not in str(e):
+                raise
+            return False, "Este semillero ya tiene un entregable asignado"
+
+        self.actividad_service.registrar(Actividad.CREAR_ENTREGABLE, "entregable", entregable.id,
+                                         entregable.semillero_id, {"titulo": entregable.titulo,
+                                                                   "estado": entregable.estado})
         return True, "Entregable creado correctamente"
 
     def obtener_por_semillero(self, semillero_id):
         """Obtiene el entregable asociado a un semillero"""
-        query = """
-            SELECT e.*, s.nombre as semillero_nombre
-            FROM entregables e
-            LEFT JOIN semilleros s ON e.semillero_id = s.id
-            WHERE e.semillero_id = ?
-        """
-
-        result = self.db.execute_query(query, (semillero_id,), fetch='one')
+        result = self.db.consulta("entregables.por_semillero", (semillero_id,), fetch='one')
 
         if not result:
             return None
 
+        return self._desde_fila(result)
+
+    def obtener_por_semilleros(self, semillero_ids, tamano_lote=500):
+        """Obtiene los entregables de varios semilleros con consultas IN (...) por lotes
+
+        Args:
+            semillero_ids (list): IDs de los semilleros
+            tamano_lote (int): IDs por consulta
+
+        Returns:
+            dict: semillero_id -> Entregable (sólo los semilleros que tienen uno)
+        """
+        ids = list(semillero_ids)
+        entregables = {}
+
+        for inicio in range(0, len(ids), tamano_lote):
+            lote = ids[inicio:inicio + tamano_lote]
+            marcadores = ", ".join("?" * len(lote))
+            query = f"""
+                SELECT e.*, s.nombre as semillero_nombre
+                FROM entregables e
+                LEFT JOIN semilleros s ON e.semillero_id = s.id
+                WHERE e.semillero_id IN ({marcadores})
+                ORDER BY e.id
+            """
+
+            for result in self.db.execute_query(query, tuple(lote), fetch='all'):
+                entregables.setdefault(result['semillero_id'], self._desde_fila(result))
+
+        return entregables
+
+    def _desde_fila(self, result):
+        """Construye un Entregable a partir de una fila con semillero_nombre"""
         entregable = Entregable(
             id=result['id'],
             titulo=result['titulo'],
@@ -68,12 +115,122 @@ class EntregableService:
         entregable.semillero_nombre = result['semillero_nombre']
         return entregable
 
+    def transiciones(self):
+        """Cambios de estado permitidos
+
+        Returns:
+            dict: estado -> lista de estados a los que puede pasar
+        """
+        def cargar():
+            permitidas = {}
+            for fila in self.db.consulta("entregables.transiciones", fetch='all'):
+                permitidas.setdefault(fila['desde'], []).append(fila['hacia'])
+            return permitidas
+
+        return self.cache.obtener("transiciones", ("transiciones_entregable",), cargar)
+
     def cambiar_estado(self, entregable_id, nuevo_estado):
-        """Cambia el estado de un entregable (pendiente, aprobado, rechazado)"""
+        """Cambia el estado de un entregable (pendiente, aprobado, rechazado)
+
+        El estado sólo cambia si la transición desde el estado actual está
+        permitida; la comprobación y el cambio son una sola sentencia.
+        """
         if nuevo_estado not in Entregable.ESTADOS:
             return False, f"Estado no válido. Debe ser uno de: {', '.join(Entregable.ESTADOS)}"
 
-        query = "UPDATE entregables SET estado = ? WHERE id = ?"
-        self.db.execute_query(query, (nuevo_estado, entregable_id))
+        cambiado = self.db.consulta("entregables.transicion", (nuevo_estado, entregable_id, nuevo_estado), fetch='one')
+        if cambiado:
+            self.actividad_service.registrar(Actividad.CAMBIAR_ESTADO_ENTREGABLE, "entregable", entregable_id,
+                                             cambiado['semillero_id'], {"estado": nuevo_estado})
+            return True, f"Estado del entregable actualizado a: {nuevo_estado}"
+
+        fila = self.db.consulta("entregables.estado", (entregable_id,), fetch='one')
+        if not fila:
+            return False, f"No existe el entregable {entregable_id}"
+        if fila['estado'] == nuevo_estado:
+            return True, f"El entregable ya está en estado: {nuevo_estado}"
+        return False, f"No se puede pasar un entregable {fila['estado']} a {nuevo_estado}"
+
+    def cambiar_estado_lote(self, nuevo_estado, ids=None, grupo_id=None, tipo=None, entregado_hasta=None):
+        """Cambia a la vez el estado de todos los entregables que cumplen los filtros
+
+        Sólo se modifican los entregables desde cuyo estado actual se permite
+        pasar a nuevo_estado; el resto se deja como está. Sin ids el cambio es
+        un único UPDATE; con ids, uno por cada TAMANO_LOTE IDs dentro de una
+        transacción.
+
+        Args:
+            nuevo_estado (str): Estado de destino ('aprobado', 'rechazado' o 'pendiente')
+            ids (iterable, optional): Limitar a estos entregables
+            grupo_id (int, optional): Limitar a los semilleros de un grupo
+            tipo (str, optional): Limitar a un tipo de entregable
+            entregado_hasta (str, optional): Limitar a fecha_entrega <= esta fecha (AAAA-MM-DD)
+
+        Returns:
+            int: Número de entregables cambiados
+
+        Raises:
+            ValueError: Si el estado no existe
+        """
+        if nuevo_estado not in Entregable.ESTADOS:
+            raise ValueError(f"Estado no válido. Debe ser uno de: {', '.join(Entregable.ESTADOS)}")
+
+        query = """
+            UPDATE entregables SET estado = ?
+            WHERE estado IN (SELECT desde FROM transiciones_entregable WHERE hacia = ?)
+        """
+        params = [nuevo_estado, nuevo_estado]
+
+        if grupo_id is not None:
+            query += " AND semillero_id IN (SELECT id FROM semilleros WHERE grupo_id = ?)"
+            params.append(grupo_id)
+        if tipo is not None:
+            query += " AND tipo = ?"
+            params.append(tipo)
+        if entregado_hasta is not None:
+            query += " AND fecha_entrega <= ?"
+            params.append(entregado_hasta)
+
+        if ids is None:
+            cambiados = self.db.execute_query(query + " RETURNING id, semillero_id", tuple(params), fetch='all')
+        else:
+            ids = list(ids)
+            cambiados = []
+            with self.db.transaction():
+                for inicio in range(0, len(ids), self.TAMANO_LOTE):
+                    lote = ids[inicio:inicio + self.TAMANO_LOTE]
+                    marcadores = ", ".join("?" * len(lote))
+                    cambiados += self.db.execute_query(query + f" AND id IN ({marcadores}) RETURNING id, semillero_id",
+                                                       tuple(params + lote), fetch='all')
+
+        for fila in cambiados:
+            self.actividad_service.registrar(Actividad.CAMBIAR_ESTADO_ENTREGABLE, "entregable", fila['id'],
+                                             fila['semillero_id'], {"estado": nuevo_estado, "lote": True})
+        return len(cambiados)
+
+    def cola_revision(self, tamano=TAMANO_PAGINA, despues=None):
+        """Obtiene una página de entregables pendientes, de la fecha de entrega más antigua a la más reciente
+
+        Se lee del índice parcial de pendientes a partir del cursor, sin
+        recorrer los entregables ya revisados ni las páginas anteriores.
+
+        Args:
+            tamano (int): Entregables por página
+            despues (tuple, optional): Cursor Pagina.siguiente de la página anterior
+
+        Returns:
+            Pagina: Entregables pendientes y cursor (fecha_entrega, id) de la página siguiente
+                (la cola sólo se recorre hacia delante: anterior es siempre None)
+        """
+        if tamano < 1:
+            raise ValueError("El tamaño de página debe ser al menos 1")
+
+        fecha, ultimo_id = despues if despues is not None else ("", 0)
+        filas = self.db.consulta("entregables.pendientes", (fecha, fecha, ultimo_id, tamano + 1), fetch='all')
+
+        siguiente = None
+        if len(filas) > tamano:
+            filas = filas[:tamano]
+            siguiente = (filas[-1]['fecha_entrega'] or "", filas[-1]['id'])
 
-        return True, f"Estado del entregable actualizado a: {nuevo_estado}"
+        return Pagina([self._desde_fila(fila) for fila in filas], None, siguiente)
@@ -0,0 +1,200 @@
+import csv
+import json
+import os
+import struct
+import zlib
+from datetime import datetime, timezone
+
+
+# Cabecera de los archivos en formato columnar
+FIRMA_COLUMNAR = b"SEMCOL1\n"
+
+_ENTERO = struct.Struct("<I")
+
+
+class EscritorColumnar:
+    """Escribe filas en un formato binario columnar compacto
+
+    El archivo contiene la firma, una cabecera JSON con la tabla y sus
+    columnas, y a continuación bloques de filas. En cada bloque los valores
+    de cada columna se guardan juntos como una lista JSON comprimida con
+    zlib, de modo que un análisis puede leer sólo las columnas que necesita.
+    Un bloque con cero filas marca el final del archivo.
+    """
+
+    def __init__(self, archivo, tabla, columnas):
+        self.archivo = archivo
+        self.columnas = columnas
+
+        cabecera = json.dumps({"tabla": tabla, "columnas": columnas}).encode("utf-8")
+        archivo.write(FIRMA_COLUMNAR)
+        archivo.write(_ENTERO.pack(len(cabecera)))
+        archivo.write(cabecera)
+
+    def escribir_bloque(self, filas):
+        """Escribe un bloque de filas (lista de tuplas en el orden de las columnas)"""
+        if not filas:
+            return
+
+        self.archivo.write(_ENTERO.pack(len(filas)))
+        for indice in range(len(self.columnas)):
+            valores = json.dumps([fila[indice] for fila in filas], ensure_ascii=False).encode("utf-8")
+            comprimido = zlib.compress(valores)
+            self.archivo.write(_ENTERO.pack(len(comprimido)))
+            self.archivo.write(comprimido)
+
+    def cerrar(self):
+        """Escribe la marca de fin de archivo"""
+        self.archivo.write(_ENTERO.pack(0))
+
+
+def leer_columnar(ruta):
+    """Lee un archivo columnar bloque a bloque
+
+    Args:
+        ruta (str): Archivo generado por EscritorColumnar
+
+    Yields:
+        dict: Columna -> lista de valores de cada bloque
+    """
+    with open(ruta, "rb") as archivo:
+        if archivo.read(len(FIRMA_COLUMNAR)) != FIRMA_COLUMNAR:
+            raise ValueError(f"{ruta} no es un archivo columnar válido")
+
+        def entero():
+            return _ENTERO.unpack(archivo.read(_ENTERO.size))[0]
+
+        cabecera = json.loads(archivo.read(entero()))
+        columnas = cabecera["columnas"]
+
+        while True:
+            filas = entero()
+            if filas == 0:
+                break
+            yield {columna: json.loads(zlib.decompress(archivo.read(entero()))) for columna in columnas}
+
+
+class ExportacionService:
+    """Exportación en streaming de las tablas principales a CSV, JSON Lines o formato columnar"""
+
+    TABLAS = ["grupos_investigacion", "semilleros", "semillero_objetivos", "investigadores", "entregables"]
+
+    # Tablas sin columna id ni marca temporal propia: orden de recorrido y filtro de --since.
+    # Los objetivos se exportan cuando su semillero ha cambiado (los triggers lo marcan)
+    ORDEN = {"semillero_objetivos": "semillero_id, orden"}
+    FILTRO_DESDE = {
+        "semillero_objetivos": "semillero_id IN (SELECT id FROM semilleros WHERE actualizado_en > ?)",
+    }
+
+    FORMATOS = {"csv": ".csv", "jsonl": ".jsonl", "columnar": ".col"}
+
+    # Filas pedidas a SQLite en cada fetchmany; la memoria usada no depende del tamaño de la tabla
+    TAMANO_BLOQUE = 1000
+
+    def __init__(self, db):
+        self.db = db
+
+    def exportar(self, directorio, formato="csv", desde=None, tablas=None):
+        """Exporta cada tabla a un archivo dentro del directorio indicado
+
+        Args:
+            directorio (str): Directorio de destino (se crea si no existe)
+            formato (str): 'csv', 'jsonl' o 'columnar'
+            desde (str, optional): Exportar sólo las filas modificadas después de
+                esta fecha ISO 8601 ('AAAA-MM-DD', 'AAAA-MM-DD HH:MM:SS', ...);
+                sin zona horaria se toma como UTC
+            tablas (list, optional): Tablas a exportar; por defecto todas
+
+        Returns:
+            dict: Tabla -> número de filas exportadas
+
+        Raises:
+            ValueError: Si el formato o alguna tabla no están soportados, o desde no es una fecha válida
+        """
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato de exportación no soportado: {formato}")
+
+        tablas = tablas or self.TABLAS
+        for tabla in tablas:
+            if tabla not in self.TABLAS:
+                raise ValueError(f"Tabla no exportable: {tabla}")
+
+        if desde:
+            desde = self._normalizar_desde(desde)
+
+        os.makedirs(directorio, exist_ok=True)
+
+        totales = {}
+        for tabla in tablas:
+            ruta = os.path.join(directorio, tabla + self.FORMATOS[formato])
+            totales[tabla] = self._exportar_tabla(tabla, ruta, formato, desde)
+
+        return totales
+
+    def _columnas(self, tabla):
+        """Columnas de la tabla en el orden en que están definidas"""
+        return [fila['name'] for fila in self.db.execute_query(f"PRAGMA table_info({tabla})", fetch='all')]
+
+    @staticmethod
+    def _normalizar_desde(desde):
+        """Convierte una fecha ISO 8601 al formato de las columnas actualizado_en
+
+        Las marcas se comparan como texto, así que '2024-1-5' o una fecha
+        con otro separador darían un filtro equivocado sin ningún error.
+        """
+        try:
+            fecha = datetime.fromisoformat(desde)
+        except ValueError:
+            raise ValueError(f"Fecha no válida: {desde!r} (se espera AAAA-MM-DD[ HH:MM:SS])") from None
+
+        if fecha.tzinfo is not None:
+            fecha = fecha.astimezone(timezone.utc).replace(tzinfo=None)
+        return fecha.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+    def _bloques(self, tabla, columnas, desde):
+        """Recorre la tabla ordenada por clave devolviendo listas de tuplas"""
+        query = f"SELECT {', '.join(columnas)} FROM {tabla}"
+        params = None
+        if desde:
+            query += " WHERE " + self.FILTRO_DESDE.get(tabla, "actualizado_en > ?")
+            params = (desde,)
+        query += " ORDER BY " + self.ORDEN.get(tabla, "id")
+
+        bloque = []
+        for fila in self.db.iter_query(query, params, size=self.TAMANO_BLOQUE):
+            bloque.append(tuple(fila))
+            if len(bloque) >= self.TAMANO_BLOQUE:
+                yield bloque
+                bloque = []
+
+        if bloque:
+            yield bloque
+
+    def _exportar_tabla(self, tabla, ruta, formato, desde):
+        """Escribe una tabla en el archivo indicado y devuelve las filas exportadas"""
+        columnas = self._columnas(tabla)
+        total = 0
+
+        if formato == "columnar":
+            with open(ruta, "wb") as archivo:
+                escritor = EscritorColumnar(archivo, tabla, columnas)
+                for bloque in self._bloques(tabla, columnas, desde):
+                    escritor.escribir_bloque(bloque)
+                    total += len(bloque)
+                escritor.cerrar()
+            return total
+
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            if formato == "csv":
+                escritor = csv.writer(archivo)
+                escritor.writerow(columnas)
+                for bloque in self._bloques(tabla, columnas, desde):
+                    escritor.writerows(bloque)
+                    total += len(bloque)
+            else:
+                for bloque in self._bloques(tabla, columnas, desde):
+                    for fila in bloque:
+                        archivo.write(json.dumps(dict(zip(columnas, fila)), ensure_ascii=False) + "\n")
+                    total += len(bloque)
+
+        return total
@@ -1,67 +1,101 @@
 from models.grupo import Grupo
 from db.database import Database
+from services.cache import CacheConsultas
+from services.paginacion import TAMANO_PAGINA, paginar
+
+
+# Datos ficticios para las líneas de investigación de cada grupo
+LINEAS_POR_GRUPO = {
+    1: ["Emprendimiento sostenible", "Gestión de la innovación", "Desarrollo empresarial"],
+    2: ["Construcción sostenible", "Energías renovables", "Gestión ambiental"],
+    3: ["Optimización de procesos", "Ingeniería de materiales", "Biotecnología"],
+    4: ["Inteligencia artificial", "Desarrollo de software", "Seguridad informática"],
+    5: ["Pedagogía virtual", "Aprendizaje basado en proyectos", "Competencias digitales"],
+    6: ["Estudios culturales", "Responsabilidad social", "Impacto comunitario"],
+    7: ["Lingüística aplicada", "Comunicación organizacional", "Análisis del discurso"],
+    8: ["Gestión del conocimiento", "Sistemas de información", "Aprendizaje organizacional"]
+}
+
+SIN_LINEAS = ["No hay líneas de investigación registradas"]
 
 
 class GrupoService:
-    """Lógica de negocio para grupos de investigación"""
+    """Lógica de negocio para grupos de investigación
+
+    Los grupos casi nunca cambian, así que se leen una sola vez y se sirven
+    desde una caché en memoria. La caché se invalida al crear un grupo (o
+    ante cualquier escritura en grupos_investigacion hecha por este proceso)
+    y, si se indica ttl, también pasado ese número de segundos.
+    """
 
-    def __init__(self, database=None):
+    def __init__(self, database=None, ttl=None):
         self.db = database or Database()
+        self.cache = CacheConsultas(self.db, ttl)
 
     def crear_grupo(self, grupo):
         """Crea un nuevo grupo de investigación en la base de datos"""
-        query = """
-            INSERT INTO grupos_investigacion 
-            (nombre, campo, identificador, director) 
-            VALUES (?, ?, ?, ?)
-        """
         params = (grupo.nombre, grupo.campo, grupo.identificador, grupo.director)
 
-        return self.db.execute_query(query, params)
+        grupo_id = self.db.consulta("grupos.insertar", params)
+        self.cache.invalidar()
+        return grupo_id
+
+    def _grupos_por_id(self):
+        """Devuelve los grupos indexados por ID, ordenados por nombre, desde la caché"""
+        def cargar():
+            resultados = self.db.consulta("grupos.todos", fetch='all')
+
+            grupos = {}
+            for resultado in resultados:
+                grupos[resultado['id']] = Grupo(
+                    id=resultado['id'],
+                    nombre=resultado['nombre'],
+                    campo=resultado['campo'],
+                    identificador=resultado['identificador'],
+                    director=resultado['director']
+                )
+            return grupos
+
+        return self.cache.obtener("grupos", ("grupos_investigacion",), cargar)
 
     def obtener_todos(self):
         """Obtiene todos los grupos de investigación"""
-        query = "SELECT id, nombre, campo, identificador, director FROM grupos_investigacion ORDER BY nombre"
-        resultados = self.db.execute_query(query, fetch='all')
-
-        grupos = []
-        for resultado in resultados:
-            grupo = Grupo(
-                id=resultado['id'],
-                nombre=resultado['nombre'],
-                campo=resultado['campo'],
-                identificador=resultado['identificador'],
-                director=resultado['director']
-            )
-            grupos.append(grupo)
-
-        return grupos
+        return list(self._grupos_por_id().values())
 
     def obtener_por_id(self, grupo_id):
         """Obtiene un grupo de investigación por su ID"""
-        query = """
-            SELECT g.id, g.nombre, g.campo, g.identificador, g.director
-            FROM grupos_investigacion g
-            WHERE g.id = ?
+        if isinstance(grupo_id, str) and grupo_id.isdigit():
+            grupo_id = int(grupo_id)
+
+        return self._grupos_por_id().get(grupo_id)
+
+    def listar_pagina(self, tamano=TAMANO_PAGINA, despues=None, antes=None):
+        """Obtiene una página de grupos ordenados por nombre
+
+        Args:
+            tamano (int): Grupos por página
+            despues (tuple, optional): Cursor Pagina.siguiente de la página anterior
+            antes (tuple, optional): Cursor Pagina.anterior de la página siguiente
+
+        Returns:
+            Pagina: Grupos de la página y cursores de navegación
         """
-        resultado = self.db.execute_query(query, (grupo_id,), fetch='one')
+        select = "SELECT id, nombre, campo, identificador, director FROM grupos_investigacion g"
 
-        if resultado:
-            grupo = Grupo(
-                id=resultado['id'],
-                nombre=resultado['nombre'],
-                campo=resultado['campo'],
-                identificador=resultado['identificador'],
-                director=resultado['director']
-            )
-            return grupo
+        def construir(fila):
+            return Grupo(id=fila['id'], nombre=fila['nombre'], campo=fila['campo'],
+                         identificador=fila['identificador'], director=fila['director'])
 
-        return None
+        return paginar(self.db, select, "g", [], [], construir, tamano, despues, antes)
+
+    def estadisticas_cache(self):
+        """Devuelve los aciertos y fallos de la caché de grupos"""
+        return self.cache.estadisticas()
 
     def cargar_datos_iniciales(self):
         """Carga los datos iniciales de grupos de investigación si no existen"""
         # Verificar si ya existen datos
-        count = self.db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')[0]
+        count = self.db.consulta("grupos.contar", fetch='one')[0]
 
         if count == 0:
             # Datos obtenidos de https://universidadean.edu.co/investigacion/grupos-de-investigacion
@@ -80,12 +114,7 @@ class GrupoService:
             ]
 
             # Insertar datos en la base de datos
-            query = """
-                INSERT INTO grupos_investigacion 
-                (nombre, campo, identificador, director) 
-                VALUES (?, ?, ?, ?)
-            """
-            self.db.execute_many(query, grupos)
+            self.db.consulta_varias("grupos.insertar", grupos)
             return len(grupos)
 
         return 0
@@ -95,20 +124,8 @@ class GrupoService:
         Esta función podría consultar una tabla adicional o una API externa
         Por ahora, retornamos datos ficticios para cada grupo
         """
-        # Datos ficticios para las líneas de investigación de cada grupo
-        lineas_por_grupo = {
-            1: ["Emprendimiento sostenible", "Gestión de la innovación", "Desarrollo empresarial"],
-            2: ["Construcción sostenible", "Energías renovables", "Gestión ambiental"],
-            3: ["Optimización de procesos", "Ingeniería de materiales", "Biotecnología"],
-            4: ["Inteligencia artificial", "Desarrollo de software", "Seguridad informática"],
-            5: ["Pedagogía virtual", "Aprendizaje basado en proyectos", "Competencias digitales"],
-            6: ["Estudios culturales", "Responsabilidad social", "Impacto comunitario"],
-            7: ["Lingüística aplicada", "Comunicación organizacional", "Análisis del discurso"],
-            8: ["Gestión del conocimiento", "Sistemas de información", "Aprendizaje organizacional"]
-        }
-
         # Convertir grupo_id a entero si es necesario
         if isinstance(grupo_id, str) and grupo_id.isdigit():
             grupo_id = int(grupo_id)
 
-        return lineas_por_grupo.get(grupo_id, ["No hay líneas de investigación registradas"])
+        return LINEAS_POR_GRUPO.get(grupo_id, SIN_LINEAS)
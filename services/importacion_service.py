@@ -0,0 +1,392 @@
+import csv
+import json
+import os
+from datetime import datetime, timezone
+
+from db.migraciones import anotar_inserciones
+from models.entregable import Entregable
+from models.semillero import Semillero
+
+
+class ResultadoImportacion:
+    """Contadores de una importación masiva"""
+
+    def __init__(self, omitidos=0):
+        self.omitidos = omitidos  # Registros ya importados en una ejecución anterior
+        self.procesados = 0
+        self.importados = 0
+        self.rechazados = 0
+        self.investigadores = 0
+        self.entregables = 0
+
+    def __str__(self):
+        return (f"{self.procesados} registros procesados: {self.importados} semilleros importados, "
+                f"{self.investigadores} investigadores, {self.entregables} entregables, "
+                f"{self.rechazados} rechazados")
+
+
+class ImportacionService:
+    """Importación masiva de semilleros, investigadores y entregables desde CSV o JSON Lines
+
+    Formato JSON Lines (un objeto por línea):
+        {"nombre": "...", "objetivo_principal": "...", "objetivos_especificos": ["..."],
+         "grupo_id": 1, "status": "pendiente",
+         "estudiantes": [{"nombre": "...", "email": "..."}], "tutores": [...],
+         "entregable": {"titulo": "...", "descripcion": "...", "tipo": "...", "fecha_entrega": "..."}}
+
+    Formato CSV (una fila por semillero): las mismas columnas de primer nivel;
+    las listas se separan con "|" y cada investigador se escribe "Nombre, email"
+    como en el formulario interactivo. El entregable opcional usa las columnas
+    entregable_titulo, entregable_descripcion, entregable_tipo y
+    entregable_fecha_entrega.
+    """
+
+    # Semilleros por transacción: cada lote se confirma con un único commit
+    TAMANO_LOTE = 2000
+
+    FORMATOS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+    STATUS_VALIDOS = ["activo", "pendiente"]
+
+    # Tablas cuyas filas inserta cada lote, en el orden en que se anotan en el registro de cambios,
+    # y cómo se seleccionan las de un rango de IDs de semillero
+    FILTRO_LOTE = {
+        "semilleros": "id BETWEEN ? AND ?",
+        "semillero_objetivos": "semillero_id BETWEEN ? AND ?",
+        "investigadores": "semillero_id BETWEEN ? AND ?",
+        "entregables": "semillero_id BETWEEN ? AND ?",
+    }
+
+    def __init__(self, db):
+        self.db = db
+        self._anotar_cambios = None
+
+    def importar(self, ruta, formato=None, reanudar=True, tamano_lote=None, progreso=None):
+        """Importa un archivo leyéndolo en streaming y guardándolo por lotes
+
+        El número de registros confirmados se guarda en la tabla importaciones
+        dentro de la misma transacción que los datos, así que tras una caída
+        la siguiente ejecución continúa exactamente donde se quedó.
+
+        Args:
+            ruta (str): Archivo CSV o JSON Lines a importar
+            formato (str, optional): 'csv' o 'jsonl'; por defecto según la extensión
+            reanudar (bool): Continuar una importación previa del mismo archivo
+            tamano_lote (int, optional): Semilleros por transacción
+            progreso (callable, optional): Función llamada con el ResultadoImportacion
+                tras confirmar cada lote
+
+        Returns:
+            ResultadoImportacion: Contadores de la importación
+
+        Raises:
+            ValueError: Si el formato del archivo no está soportado
+        """
+        formato = formato or self.FORMATOS.get(os.path.splitext(ruta)[1].lower())
+        if formato not in ("csv", "jsonl"):
+            raise ValueError(f"Formato de importación no soportado: {ruta}")
+
+        archivo = os.path.abspath(ruta)
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+
+        omitidos = self._registros_confirmados(archivo) if reanudar else 0
+        resultado = ResultadoImportacion(omitidos)
+        grupos = {fila['id'] for fila in self.db.execute_query("SELECT id FROM grupos_investigacion", fetch='all')}
+
+        ruta_rechazados = f"{ruta}.rechazados.jsonl"
+        modo = "a" if omitidos else "w"
+
+        with open(ruta_rechazados, modo, encoding="utf-8") as rechazados:
+            lote = []
+            for numero, registro in self._leer_registros(ruta, formato):
+                if numero <= omitidos:
+                    continue
+
+                lote.append((numero, registro))
+                if len(lote) >= tamano_lote:
+                    self._importar_lote(archivo, lote, grupos, resultado, rechazados)
+                    lote = []
+                    if progreso:
+                        progreso(resultado)
+
+            if lote:
+                self._importar_lote(archivo, lote, grupos, resultado, rechazados)
+                if progreso:
+                    progreso(resultado)
+
+        return resultado
+
+    def _registros_confirmados(self, archivo):
+        """Devuelve cuántos registros del archivo se confirmaron en ejecuciones anteriores"""
+        fila = self.db.execute_query("SELECT registros FROM importaciones WHERE archivo = ?",
+                                     (archivo,), fetch='one')
+        return fila['registros'] if fila else 0
+
+    def _leer_registros(self, ruta, formato):
+        """Lee el archivo registro a registro sin cargarlo entero en memoria
+
+        Yields:
+            tuple: (número de registro empezando en 1, diccionario normalizado)
+        """
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            if formato == "csv":
+                for numero, fila in enumerate(csv.DictReader(archivo), 1):
+                    yield numero, self._normalizar_csv(fila)
+            else:
+                numero = 0
+                for linea in archivo:
+                    if not linea.strip():
+                        continue
+                    numero += 1
+                    try:
+                        yield numero, json.loads(linea)
+                    except ValueError as e:
+                        yield numero, {"_error": f"JSON inválido: {e}", "_linea": linea.rstrip("\n")}
+
+    def _normalizar_csv(self, fila):
+        """Convierte una fila CSV plana al mismo formato que un registro JSON"""
+        def lista(columna):
+            return [valor.strip() for valor in (fila.get(columna) or "").split("|") if valor.strip()]
+
+        def investigadores(columna):
+            personas = []
+            for valor in lista(columna):
+                partes = valor.split(",")
+                personas.append({"nombre": partes[0].strip(),
+                                 "email": partes[1].strip() if len(partes) > 1 else ""})
+            return personas
+
+        registro = {
+            "nombre": fila.get("nombre", ""),
+            "objetivo_principal": fila.get("objetivo_principal", ""),
+            "objetivos_especificos": lista("objetivos_especificos"),
+            "grupo_id": fila.get("grupo_id"),
+            "status": fila.get("status") or "pendiente",
+            "estudiantes": investigadores("estudiantes"),
+            "tutores": investigadores("tutores"),
+        }
+
+        if fila.get("entregable_titulo"):
+            registro["entregable"] = {
+                "titulo": fila.get("entregable_titulo", ""),
+                "descripcion": fila.get("entregable_descripcion", ""),
+                "tipo": fila.get("entregable_tipo", ""),
+                "fecha_entrega": fila.get("entregable_fecha_entrega") or None,
+            }
+
+        return registro
+
+    def _validar(self, registro, semillero_id, grupos):
+        """Construye y valida el semillero y el entregable de un registro
+
+        Returns:
+            tuple: (Semillero, Entregable o None, lista de errores)
+        """
+        if not isinstance(registro, dict):
+            return None, None, ["El registro debe ser un objeto JSON"]
+        if "_error" in registro:
+            return None, None, [registro["_error"]]
+
+        errores = self._errores_de_tipo(registro)
+        if errores:
+            return None, None, errores
+
+        try:
+            grupo_id = int(registro.get("grupo_id")) if registro.get("grupo_id") not in (None, "") else None
+        except (TypeError, ValueError):
+            return None, None, [f"grupo_id inválido: {registro.get('grupo_id')}"]
+
+        semillero = Semillero(
+            id=semillero_id,
+            nombre=registro.get("nombre", ""),
+            objetivo_principal=registro.get("objetivo_principal", ""),
+            objetivos_especificos=registro.get("objetivos_especificos") or [],
+            grupo_id=grupo_id,
+            status=registro.get("status") or "pendiente"
+        )
+        semillero.estudiantes = registro.get("estudiantes") or []
+        semillero.tutores = registro.get("tutores") or []
+
+        errores = semillero.validar()
+        if grupo_id and grupo_id not in grupos:
+            errores.append(f"El grupo con ID {grupo_id} no existe")
+        if semillero.status not in self.STATUS_VALIDOS:
+            errores.append(f"Estado no válido: {semillero.status}")
+
+        entregable = None
+        if registro.get("entregable"):
+            datos = registro["entregable"]
+            entregable = Entregable(
+                titulo=datos.get("titulo", ""),
+                descripcion=datos.get("descripcion", ""),
+                tipo=datos.get("tipo", ""),
+                semillero_id=semillero_id,
+                fecha_entrega=datos.get("fecha_entrega") or datetime.now().strftime("%Y-%m-%d"),
+                estado=datos.get("estado") or "pendiente"
+            )
+            errores.extend(entregable.validar())
+            if entregable.estado not in Entregable.ESTADOS:
+                errores.append(f"Estado de entregable no válido: {entregable.estado}")
+
+        return semillero, entregable, errores
+
+    def _errores_de_tipo(self, registro):
+        """Comprueba que cada campo del registro tenga el tipo que espera la base de datos
+
+        Un valor de otro tipo (un nombre nulo, objetivos como texto en lugar
+        de lista) no debe llegar al INSERT, donde haría fallar el lote entero.
+
+        Returns:
+            list: Errores encontrados
+        """
+        errores = []
+
+        def texto(datos, campo, prefijo=""):
+            if datos.get(campo) is not None and not isinstance(datos[campo], str):
+                errores.append(f"{prefijo}{campo} debe ser texto")
+
+        for campo in ("nombre", "objetivo_principal", "status"):
+            texto(registro, campo)
+
+        objetivos = registro.get("objetivos_especificos")
+        if objetivos is not None and (not isinstance(objetivos, list)
+                                      or not all(isinstance(objetivo, str) for objetivo in objetivos)):
+            errores.append("objetivos_especificos debe ser una lista de textos")
+
+        for campo in ("estudiantes", "tutores"):
+            personas = registro.get(campo)
+            if personas is None:
+                continue
+            if not isinstance(personas, list):
+                errores.append(f"{campo} debe ser una lista")
+                continue
+            for posicion, persona in enumerate(personas, 1):
+                if isinstance(persona, str):
+                    continue
+                if not isinstance(persona, dict) or not isinstance(persona.get("nombre"), str) \
+                        or not persona["nombre"].strip():
+                    errores.append(f"{campo}[{posicion}] debe tener un nombre de texto")
+                else:
+                    texto(persona, "email", f"{campo}[{posicion}].")
+
+        entregable = registro.get("entregable")
+        if entregable is not None and entregable != "":
+            if not isinstance(entregable, dict):
+                errores.append("entregable debe ser un objeto")
+            else:
+                for campo in ("titulo", "descripcion", "tipo", "fecha_entrega", "estado"):
+                    texto(entregable, campo, "entregable.")
+
+        return errores
+
+    def _consultas_anotar_cambios(self):
+        """Sentencias que anotan en el registro de cambios las filas de un lote, una por tabla"""
+        if self._anotar_cambios is None:
+            self._anotar_cambios = [
+                anotar_inserciones(tabla, self.db.execute_query(f"PRAGMA table_info({tabla})", fetch='all'), filtro)
+                for tabla, filtro in self.FILTRO_LOTE.items()
+            ]
+        return self._anotar_cambios
+
+    def _datos_persona(self, persona):
+        """Devuelve (nombre, email) de un investigador dado como diccionario o texto"""
+        if isinstance(persona, dict):
+            return persona.get("nombre", ""), persona.get("email", "")
+        return str(persona), ""
+
+    def _siguiente_id(self):
+        """Primer ID libre de semilleros respetando el AUTOINCREMENT de la tabla"""
+        fila = self.db.execute_query("""
+            SELECT MAX(COALESCE((SELECT MAX(id) FROM semilleros), 0),
+                       COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'semilleros'), 0))
+        """, fetch='one')
+        return fila[0] + 1
+
+    def _importar_lote(self, archivo, lote, grupos, resultado, rechazados):
+        """Valida e inserta un lote de registros en una única transacción"""
+        semilleros = []
+        objetivos = []
+        investigadores = []
+        entregables = []
+        errores_lote = []
+
+        # La marca de modificación se fija aquí para que los triggers no tengan que actualizar cada fila
+        actualizado_en = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+
+        with self.db.transaction():
+            # Dentro de la transacción (BEGIN IMMEDIATE) nadie más puede reservar estos IDs
+            siguiente_id = self._siguiente_id()
+            primer_id = siguiente_id
+            # Los triggers no anotan fila a fila: el lote se anota al final con una sentencia por tabla
+            self.db.execute_query("INSERT INTO cambios_en_lote DEFAULT VALUES")
+
+            for numero, registro in lote:
+                semillero, entregable, errores = self._validar(registro, siguiente_id, grupos)
+                if errores:
+                    errores_lote.append({"registro": numero, "errores": errores, "datos": registro})
+                    continue
+
+                semilleros.append((
+                    siguiente_id,
+                    semillero.nombre,
+                    semillero.objetivo_principal,
+                    semillero.grupo_id,
+                    semillero.status,
+                    actualizado_en
+                ))
+                for orden, objetivo in enumerate(semillero.objetivos_especificos, 1):
+                    objetivos.append((siguiente_id, orden, str(objetivo)))
+                for tipo, personas in (("estudiante", semillero.estudiantes), ("tutor", semillero.tutores)):
+                    for persona in personas:
+                        nombre, email = self._datos_persona(persona)
+                        investigadores.append((nombre, tipo, email, siguiente_id, actualizado_en))
+                if entregable:
+                    entregables.append((entregable.titulo, entregable.descripcion, entregable.tipo,
+                                        siguiente_id, entregable.fecha_entrega, entregable.estado,
+                                        actualizado_en))
+
+                siguiente_id += 1
+
+            # Objetivos e investigadores van antes que sus semilleros (los IDs ya están
+            # reservados): así el índice de búsqueda los recoge a todos al insertar cada
+            # semillero en vez de reescribir su fila por cada objetivo o investigador
+            self.db.execute_many("""
+                INSERT INTO semillero_objetivos (semillero_id, orden, objetivo)
+                VALUES (?, ?, ?)
+            """, objetivos)
+            self.db.execute_many("""
+                INSERT INTO investigadores (nombre, tipo, email, semillero_id, actualizado_en)
+                VALUES (?, ?, ?, ?, ?)
+            """, investigadores)
+            self.db.execute_many("""
+                INSERT INTO semilleros
+                (id, nombre, objetivo_principal, grupo_id, status, actualizado_en)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, semilleros)
+            self.db.execute_many("""
+                INSERT INTO entregables
+                (titulo, descripcion, tipo, semillero_id, fecha_entrega, estado, actualizado_en)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, entregables)
+
+            if semilleros:
+                for consulta in self._consultas_anotar_cambios():
+                    self.db.execute_query(consulta, (primer_id, siguiente_id - 1))
+            self.db.execute_query("DELETE FROM cambios_en_lote")
+
+            # El avance se confirma junto con los datos para poder reanudar sin duplicados
+            self.db.execute_query("""
+                INSERT INTO importaciones (archivo, registros, actualizado_en) VALUES (?, ?, ?)
+                ON CONFLICT(archivo) DO UPDATE SET registros = excluded.registros,
+                                                   actualizado_en = excluded.actualizado_en
+            """, (archivo, lote[-1][0], datetime.now().isoformat(timespec="seconds")))
+
+        for rechazo in errores_lote:
+            rechazados.write(json.dumps(rechazo, ensure_ascii=False) + "\n")
+        rechazados.flush()
+
+        resultado.procesados += len(lote)
+        resultado.importados += len(semilleros)
+        resultado.rechazados += len(errores_lote)
+        resultado.investigadores += len(investigadores)
+        resultado.entregables += len(entregables)
@@ -0,0 +1,70 @@
+from models.resultados import Pagina
+
+
+# Tamaño de página por defecto de los listados
+TAMANO_PAGINA = 20
+
+
+def paginar(db, select, alias, condiciones, params, construir, tamano=TAMANO_PAGINA, despues=None, antes=None):
+    """Obtiene una página de un listado ordenado por (nombre, id) sin usar OFFSET
+
+    La posición se indica con el cursor (nombre, id) del último elemento de
+    la página anterior (despues) o del primero de la siguiente (antes), de
+    modo que SQLite salta directamente a esa posición del índice por nombre
+    y el coste no crece con el número de página.
+
+    Args:
+        db (Database): Base de datos
+        select (str): SELECT ... FROM ... [JOIN ...] sin WHERE ni ORDER BY
+        alias (str): Alias de la tabla paginada dentro de select
+        condiciones (list): Condiciones adicionales para el WHERE
+        params (list): Parámetros de esas condiciones
+        construir (callable): Convierte una fila en el elemento de la página
+        tamano (int): Elementos por página
+        despues (tuple, optional): Cursor (nombre, id) tras el que empezar
+        antes (tuple, optional): Cursor (nombre, id) antes del que terminar
+
+    Returns:
+        Pagina: Elementos y cursores para navegar a las páginas contiguas
+    """
+    if tamano < 1:
+        raise ValueError("El tamaño de página debe ser al menos 1")
+
+    condiciones = list(condiciones)
+    params = list(params)
+    hacia_atras = antes is not None and despues is None
+
+    if hacia_atras:
+        condiciones.append(f"({alias}.nombre, {alias}.id) < (?, ?)")
+        params.extend(antes)
+        orden = f"{alias}.nombre DESC, {alias}.id DESC"
+    else:
+        if despues is not None:
+            condiciones.append(f"({alias}.nombre, {alias}.id) > (?, ?)")
+            params.extend(despues)
+        orden = f"{alias}.nombre, {alias}.id"
+
+    query = select
+    if condiciones:
+        query += " WHERE " + " AND ".join(condiciones)
+    # Una fila de más indica si hay otra página en la misma dirección
+    query += f" ORDER BY {orden} LIMIT ?"
+    params.append(tamano + 1)
+
+    filas = db.execute_query(query, tuple(params), fetch='all')
+    hay_mas = len(filas) > tamano
+    filas = filas[:tamano]
+
+    if hacia_atras:
+        filas.reverse()
+        hay_anterior, hay_siguiente = hay_mas, True
+    else:
+        hay_anterior, hay_siguiente = despues is not None, hay_mas
+
+    if not filas:
+        return Pagina([], None, None)
+
+    anterior = (filas[0]['nombre'], filas[0]['id']) if hay_anterior else None
+    siguiente = (filas[-1]['nombre'], filas[-1]['id']) if hay_siguiente else None
+
+    return Pagina([construir(fila) for fila in filas], anterior, siguiente)
@@ -0,0 +1,147 @@
+from collections import namedtuple
+
+from db.migraciones import CONTADORES, recuento_contador
+from services.cache import CacheConsultas
+
+
+class TablaReporte(namedtuple("TablaReporte", ["titulo", "columnas", "filas"])):
+    """Resultado compacto de un reporte: nombres de columna y filas como tuplas"""
+
+    __slots__ = ()
+
+    def formatear(self):
+        """Devuelve el reporte como texto tabulado para mostrar en consola"""
+        anchos = [len(columna) for columna in self.columnas]
+        for fila in self.filas:
+            for i, valor in enumerate(fila):
+                anchos[i] = max(anchos[i], len(str(valor)))
+
+        lineas = [f"=== {self.titulo.upper()} ===",
+                  "  ".join(f"{columna.upper():<{ancho}}" for columna, ancho in zip(self.columnas, anchos)),
+                  "-" * (sum(anchos) + 2 * (len(anchos) - 1))]
+        for fila in self.filas:
+            lineas.append("  ".join(f"{str(valor):<{ancho}}" for valor, ancho in zip(fila, anchos)))
+
+        return "\n".join(lineas)
+
+
+class DiferenciaContador(namedtuple("DiferenciaContador", ["contador", "clave", "guardado", "recuento"])):
+    """Fila de un contador cuyo total no coincide con el recuento de la tabla"""
+
+    __slots__ = ()
+
+
+class ReporteService:
+    """Reportes agregados calculados en SQLite con GROUP BY
+
+    Los recuentos de semilleros (por grupo y estado) y de entregables (por
+    tipo y estado) se leen de las tablas de contadores que los triggers
+    actualizan en cada inserción, cambio o borrado, así que no dependen del
+    número de filas. Los resultados se guardan en una CacheConsultas que se
+    invalida cuando cambian las tablas de las que depende cada reporte.
+    """
+
+    def __init__(self, db, ttl=None):
+        self.db = db
+        self.cache = CacheConsultas(db, ttl)
+
+    def _reporte(self, titulo, tablas, nombre, params=None):
+        """Ejecuta (o recupera de la caché) una consulta agregada del registro db.consultas"""
+        def calcular():
+            filas = self.db.consulta(nombre, params, fetch='all')
+            columnas = list(filas[0].keys()) if filas else []
+            return TablaReporte(titulo, columnas, [tuple(fila) for fila in filas])
+
+        return self.cache.obtener((nombre, params), tablas, calcular)
+
+    def semilleros_por_grupo(self):
+        """Número de semilleros de cada grupo, separando activos y pendientes"""
+        return self._reporte("Semilleros por grupo", ("grupos_investigacion", "semilleros", "contador_semilleros"),
+                             "reportes.semilleros_por_grupo")
+
+    def semilleros_por_status(self):
+        """Número de semilleros en cada estado"""
+        return self._reporte("Semilleros por estado", ("semilleros", "contador_semilleros"),
+                             "reportes.semilleros_por_status")
+
+    def proporcion_activos_pendientes(self):
+        """Semilleros activos frente a pendientes y la proporción entre ambos"""
+        return self._reporte("Proporción activos / pendientes", ("semilleros", "contador_semilleros"),
+                             "reportes.proporcion_activos_pendientes")
+
+    def entregables_por_tipo_y_estado(self):
+        """Número de entregables por tipo y estado de aprobación"""
+        return self._reporte("Entregables por tipo y estado", ("entregables", "contador_entregables"),
+                             "reportes.entregables_por_tipo_y_estado")
+
+    def entregables_por_estado(self):
+        """Número de entregables en cada estado de aprobación"""
+        return self._reporte("Entregables por estado", ("entregables", "contador_entregables"),
+                             "reportes.entregables_por_estado")
+
+    def investigadores_por_semillero(self, limite=None):
+        """Estudiantes y tutores de cada semillero
+
+        Args:
+            limite (int, optional): Número máximo de semilleros a incluir
+        """
+        return self._reporte("Investigadores por semillero", ("semilleros", "investigadores"),
+                             "reportes.investigadores_por_semillero", (-1 if limite is None else limite,))
+
+    def total_semilleros(self, grupo_id=None, status=None):
+        """Número de semilleros, opcionalmente de un grupo y/o en un estado, leído de los contadores"""
+        return self.db.consulta("contadores.semilleros", (grupo_id, grupo_id, status, status), fetch='one')[0]
+
+    def total_entregables(self, tipo=None, estado=None):
+        """Número de entregables, opcionalmente de un tipo y/o en un estado, leído de los contadores"""
+        return self.db.consulta("contadores.entregables", (tipo, tipo, estado, estado), fetch='one')[0]
+
+    def verificar_contadores(self):
+        """Compara las tablas de contadores con un recuento completo de las tablas contadas
+
+        Returns:
+            list: DiferenciaContador por cada fila que no coincide (vacía si todo cuadra)
+        """
+        # Los contadores y el recuento se leen de la misma instantánea, sin bloquear a los escritores
+        with self.db.lectura():
+            return self._diferencias()
+
+    def reconstruir_contadores(self):
+        """Vuelve a calcular todos los contadores desde cero
+
+        Returns:
+            list: DiferenciaContador encontradas antes de reconstruir
+        """
+        with self.db.transaction():
+            diferencias = self._diferencias()
+            for contador, (_, columnas) in CONTADORES.items():
+                self.db.execute_query(f"DELETE FROM {contador}")
+                self.db.execute_query(f"INSERT INTO {contador} ({', '.join(columnas)}, total) "
+                                      f"{recuento_contador(contador)}")
+        return diferencias
+
+    def _diferencias(self):
+        diferencias = []
+        for contador, (_, columnas) in CONTADORES.items():
+            guardados = {tuple(fila[:-1]): fila[-1] for fila in self.db.execute_query(
+                f"SELECT {', '.join(columnas)}, total FROM {contador} WHERE total <> 0", fetch='all')}
+            recuento = {tuple(fila[:-1]): fila[-1]
+                        for fila in self.db.execute_query(recuento_contador(contador), fetch='all')}
+            for clave in sorted(guardados.keys() | recuento.keys(), key=repr):
+                if guardados.get(clave, 0) != recuento.get(clave, 0):
+                    diferencias.append(DiferenciaContador(contador, clave, guardados.get(clave, 0),
+                                                          recuento.get(clave, 0)))
+        return diferencias
+
+    def reportes_estandar(self):
+        """Devuelve el conjunto de reportes habituales para la dirección
+
+        Returns:
+            list: Lista de TablaReporte
+        """
+        return [
+            self.semilleros_por_grupo(),
+            self.proporcion_activos_pendientes(),
+            self.entregables_por_tipo_y_estado(),
+            self.investigadores_por_semillero(),
+        ]
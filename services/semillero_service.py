@@ -1,13 +1,71 @@
-import json
-from models.semillero import Semillero
+import re
+import weakref
+from models.actividad import Actividad
+from models.resultados import ConjuntoResultados
+from models.semillero import Semillero, SemilleroResumen
 from models.investigador import Investigador
+from services.paginacion import TAMANO_PAGINA, paginar
+
+
+class CargadorRelaciones:
+    """Carga bajo demanda las relaciones de los semilleros de un mismo resultado
+
+    Cuando se accede a una relación de cualquiera de los semilleros, se carga
+    para todos los del resultado que aún no la tienen, con consultas por
+    lotes. Así recorrer una lista y leer sus estudiantes no vuelve a generar
+    una consulta por semillero.
+    """
+
+    def __init__(self, service, semilleros):
+        self.service = service
+        self.semilleros = semilleros
+
+    def cargar(self, relacion):
+        pendientes = [s for s in self.semilleros if not s.relacion_cargada(relacion)]
+        self.service.precargar(pendientes, [relacion])
 
 
 class SemilleroService:
     """Lógica de negocio para semilleros de investigación"""
 
-    def __init__(self, database):
+    # IDs por cada consulta IN (...); SQLite limita el número de parámetros (999 en versiones antiguas)
+    TAMANO_LOTE = 500
+
+    RELACIONES = ("objetivos", "investigadores", "grupo", "entregable")
+
+    STATUS_VALIDOS = ["activo", "pendiente"]
+
+    def __init__(self, database, grupo_service=None, entregable_service=None, actividad_service=None):
         self.db = database
+        self._grupo_service = grupo_service
+        self._entregable_service = entregable_service
+        self._actividad_service = actividad_service
+        # Mapa de identidad: una misma fila de investigadores se representa con un único objeto
+        self._investigadores = weakref.WeakValueDictionary()
+
+    @property
+    def grupo_service(self):
+        """GrupoService usado para resolver semillero.grupo (se crea si no se pasó uno)"""
+        if self._grupo_service is None:
+            from services.grupo_service import GrupoService
+            self._grupo_service = GrupoService(self.db)
+        return self._grupo_service
+
+    @property
+    def entregable_service(self):
+        """EntregableService usado para resolver semillero.entregable"""
+        if self._entregable_service is None:
+            from services.entregable_service import EntregableService
+            self._entregable_service = EntregableService(self.db, self._actividad_service)
+        return self._entregable_service
+
+    @property
+    def actividad_service(self):
+        """ActividadService en el que se anotan las acciones (el compartido de la base de datos)"""
+        if self._actividad_service is None:
+            from services.actividad_service import ActividadService
+            self._actividad_service = ActividadService.compartido(self.db)
+        return self._actividad_service
 
     def crear_semillero(self, semillero):
         """Crea un nuevo semillero en la base de datos
@@ -24,53 +82,42 @@ class SemilleroService:
             return None, errores
 
         # Insertar el semillero en la base de datos
-        query = """
-            INSERT INTO semilleros 
-            (nombre, objetivo_principal, objetivos_especificos, grupo_id, status) 
-            VALUES (?, ?, ?, ?, ?)
-        """
-
-        # Convertir lista de objetivos a JSON para almacenar
-        objetivos_json = json.dumps(semillero.objetivos_especificos)
-
         params = (
             semillero.nombre,
             semillero.objetivo_principal,
-            objetivos_json,
             semillero.grupo_id,
             semillero.status
         )
 
-        semillero_id = self.db.execute_query(query, params)
+        # El semillero, sus objetivos y todos sus investigadores se guardan con un único commit
+        with self.db.transaction():
+            semillero_id = self.db.consulta("semilleros.insertar", params)
 
-        # Si se creó correctamente, añadir los investigadores
-        if semillero_id:
-            self._guardar_investigadores(semillero_id, semillero.estudiantes, "estudiante")
-            self._guardar_investigadores(semillero_id, semillero.tutores, "tutor")
+            # Si se creó correctamente, añadir los objetivos y los investigadores
+            if semillero_id:
+                self._guardar_objetivos(semillero_id, semillero.objetivos_especificos)
+                self._guardar_investigadores(semillero_id, semillero)
 
+        if semillero_id:
+            self.actividad_service.registrar(Actividad.CREAR_SEMILLERO, "semillero", semillero_id, semillero_id,
+                                             {"nombre": semillero.nombre, "status": semillero.status})
             return semillero_id, []
 
         return None, ["Error al crear el semillero en la base de datos"]
 
-    def _guardar_investigadores(self, semillero_id, investigadores, tipo):
-        """Guarda los investigadores asociados a un semillero
+    def _parametros_investigadores(self, semillero_id, investigadores, tipo):
+        """Convierte investigadores en tuplas para el INSERT en la tabla investigadores
 
         Args:
             semillero_id (int): ID del semillero
-            investigadores (list): Lista de nombres o objetos Investigador
+            investigadores (list): Lista de nombres, diccionarios u objetos Investigador
             tipo (str): Tipo de investigador ('estudiante' o 'tutor')
-        """
-        if not investigadores:
-            return
 
-        query = """
-            INSERT INTO investigadores 
-            (nombre, tipo, email, semillero_id) 
-            VALUES (?, ?, ?, ?)
+        Returns:
+            list: Tuplas (nombre, tipo, email, semillero_id)
         """
-
         params_list = []
-        for inv in investigadores:
+        for inv in investigadores or []:
             # Si es un objeto Investigador
             if isinstance(inv, Investigador):
                 params_list.append((inv.nombre, tipo, inv.email, semillero_id))
@@ -86,125 +133,293 @@ class SemilleroService:
             else:
                 params_list.append((str(inv), tipo, "", semillero_id))
 
+        return params_list
+
+    def _guardar_objetivos(self, semillero_id, objetivos):
+        """Guarda los objetivos específicos de un semillero en semillero_objetivos
+
+        Args:
+            semillero_id (int): ID del semillero
+            objetivos (list): Objetivos en el orden en que se muestran
+        """
+        params_list = [(semillero_id, orden, objetivo) for orden, objetivo in enumerate(objetivos, 1)]
+        if params_list:
+            self.db.consulta_varias("semillero_objetivos.insertar", params_list)
+
+    def _guardar_investigadores(self, semillero_id, semillero):
+        """Guarda estudiantes y tutores de un semillero con un solo executemany
+
+        Args:
+            semillero_id (int): ID del semillero
+            semillero (Semillero): Semillero con las listas de estudiantes y tutores
+        """
+        params_list = (self._parametros_investigadores(semillero_id, semillero.estudiantes, "estudiante")
+                       + self._parametros_investigadores(semillero_id, semillero.tutores, "tutor"))
+
         if params_list:
-            self.db.execute_many(query, params_list)
+            self.db.consulta_varias("investigadores.insertar", params_list)
 
-    def obtener_todos(self):
+    def obtener_todos(self, prefetch=None):
         """Obtiene todos los semilleros de investigación
 
+            Args:
+                prefetch (iterable, optional): Relaciones a cargar de antemano
+                    ('objetivos', 'investigadores', 'grupo', 'entregable'); el resto se
+                    consulta al primer acceso
+
             Returns:
                 list: Lista de objetos Semillero
             """
-        # Primero verificamos la estructura de la tabla
-        query_estructura = """
-                PRAGMA table_info(semilleros)
-            """
-        estructura = self.db.execute_query(query_estructura, fetch='all')
+        resultados = self.db.consulta("semilleros.todos", fetch='all')
+
+        return self._construir_semilleros(resultados, prefetch)
+
+    def listar_resumen(self, grupo_id=None):
+        """Obtiene los datos mínimos para listar semilleros en una sola consulta
+
+        No carga investigadores ni objetivos específicos.
 
-        # Basado en la estructura, ajustamos la consulta
-        # Suponiendo que la columna se llama 'objetivos' en lugar de 'objetivos_especificos'
+        Args:
+            grupo_id (int, optional): Limitar el listado a un grupo de investigación
+
+        Returns:
+            ConjuntoResultados: Secuencia de SemilleroResumen ordenados por nombre,
+                guardada por columnas
+        """
         query = """
-                SELECT s.id, s.nombre, s.objetivo_principal, s.objetivos_especificos, 
-                s.grupo_id, g.nombre as grupo_nombre, s.status
-                FROM semilleros s
-                LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
-                ORDER BY s.nombre
-            """
+            SELECT s.id, s.nombre, s.status, g.nombre as grupo_nombre
+            FROM semilleros s
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+        """
+        params = None
 
-        resultados = self.db.execute_query(query, fetch='all')
+        if grupo_id is not None:
+            query += " WHERE s.grupo_id = ?"
+            params = (grupo_id,)
 
-        semilleros = []
-        for row in resultados:
-            # Convertir el JSON a lista (ajustamos el nombre de la columna)
-            objetivos = json.loads(row['objetivos_especificos'])
+        query += " ORDER BY s.nombre"
+
+        resultados = self.db.iter_query(query, params)
+
+        return ConjuntoResultados.desde_filas(SemilleroResumen._fields, resultados, SemilleroResumen,
+                                              tipos={"id": "q"})
+
+    def listar_pagina(self, tamano=TAMANO_PAGINA, despues=None, antes=None, grupo_id=None, status=None):
+        """Obtiene una página del listado de semilleros ordenado por nombre
+
+        La paginación es por clave: cada página continúa a partir del cursor
+        (nombre, id) de la anterior, así que pedir la página 500 cuesta lo
+        mismo que pedir la primera.
+
+        Args:
+            tamano (int): Semilleros por página
+            despues (tuple, optional): Cursor Pagina.siguiente de la página anterior
+            antes (tuple, optional): Cursor Pagina.anterior de la página siguiente
+            grupo_id (int, optional): Limitar el listado a un grupo de investigación
+            status (str, optional): Limitar el listado a un estado
+
+        Returns:
+            Pagina: SemilleroResumen de la página y cursores de navegación
+        """
+        select = """
+            SELECT s.id, s.nombre, s.status, g.nombre as grupo_nombre
+            FROM semilleros s
+            LEFT JOIN grupos_investigacion g ON s.grupo_id = g.id
+        """
+        condiciones = []
+        params = []
+
+        if grupo_id is not None:
+            condiciones.append("s.grupo_id = ?")
+            params.append(grupo_id)
+        if status is not None:
+            condiciones.append("s.status = ?")
+            params.append(status)
+
+        def construir(fila):
+            return SemilleroResumen(fila['id'], fila['nombre'], fila['status'], fila['grupo_nombre'])
+
+        return paginar(self.db, select, "s", condiciones, params, construir, tamano, despues, antes)
+
+    def buscar(self, texto, limit=20):
+        """Busca semilleros por palabras de su nombre, objetivos o investigadores
+
+        Usa el índice FTS5 semilleros_fts. Cada palabra se busca como prefijo
+        ("robot" encuentra "robótica") sin distinguir mayúsculas ni tildes, y
+        todas deben aparecer. Los resultados se ordenan por relevancia (bm25),
+        pesando más una coincidencia en el nombre que en los objetivos, y en
+        éstos más que en los investigadores.
+
+        Args:
+            texto (str): Palabras a buscar
+            limit (int): Número máximo de resultados
+
+        Returns:
+            list: SemilleroResumen ordenados de más a menos relevante
+        """
+        # Cada palabra va entre comillas para que la sintaxis de FTS5 no se interprete
+        palabras = re.findall(r"\w+", texto)
+        if not palabras:
+            return []
+        consulta = " ".join(f'"{palabra}"*' for palabra in palabras)
+
+        resultados = self.db.consulta("semilleros.buscar", (consulta, limit), fetch='all')
+
+        return [SemilleroResumen(r['id'], r['nombre'], r['status'], r['grupo_nombre']) for r in resultados]
+
+    def obtener_por_id(self, semillero_id, prefetch=None):
+        """Obtiene un semillero por su ID
+
+        Args:
+            semillero_id (int): ID del semillero
+            prefetch (iterable, optional): Relaciones a cargar de antemano
+
+        Returns:
+            Semillero: Objeto Semillero o None si no existe
+        """
+        row = self.db.consulta("semilleros.por_id", (semillero_id,), fetch='one')
+
+        if not row:
+            return None
+
+        return self._construir_semilleros([row], prefetch)[0]
 
+    def _construir_semilleros(self, filas, prefetch=None):
+        """Convierte filas de la tabla semilleros en objetos con relaciones diferidas
+
+        Args:
+            filas (list): Filas con las columnas de semilleros y grupo_nombre
+            prefetch (iterable, optional): Relaciones a cargar ahora para todo el resultado
+
+        Returns:
+            list: Lista de objetos Semillero en el mismo orden que las filas
+        """
+        semilleros = []
+        for row in filas:
             semillero = Semillero(
                 id=row['id'],
                 nombre=row['nombre'],
                 objetivo_principal=row['objetivo_principal'],
-                objetivos_especificos=objetivos,  # Mantenemos el nombre del atributo del objeto
                 grupo_id=row['grupo_id'],
                 status=row['status']
             )
 
             semillero.grupo_nombre = row['grupo_nombre']
+            semilleros.append(semillero)
 
-            # Cargar investigadores asociados
-            self._cargar_investigadores(semillero)
+        # Las relaciones no pedidas se cargarán, para todo el resultado, al primer acceso
+        cargador = CargadorRelaciones(self, semilleros)
+        for semillero in semilleros:
+            semillero._cargador = cargador
 
-            semilleros.append(semillero)
+        if prefetch:
+            self.precargar(semilleros, prefetch)
 
         return semilleros
 
-    def obtener_por_id(self, semillero_id):
-        """Obtiene un semillero por su ID
+    def precargar(self, semilleros, relaciones):
+        """Carga de una vez las relaciones indicadas de varios semilleros
 
         Args:
-            semillero_id (int): ID del semillero
+            semilleros (list): Objetos Semillero
+            relaciones (iterable): 'objetivos', 'investigadores', 'grupo' y/o 'entregable'
 
-        Returns:
-            Semillero: Objeto Semillero o None si no existe
+        Raises:
+            ValueError: Si alguna relación no existe
         """
-        query = """
-            SELECT s.id, s.nombre, s.objetivo_principal, s.objetivos_especificos, 
-                   s.grupo_id, s.status, g.nombre as grupo_nombre
-            FROM semilleros s
-            JOIN grupos_investigacion g ON s.grupo_id = g.id
-            WHERE s.id = ?
-        """
-
-        row = self.db.execute_query(query, (semillero_id,), fetch='one')
+        if isinstance(relaciones, str):
+            relaciones = (relaciones,)
 
-        if not row:
-            return None
+        for relacion in relaciones:
+            if relacion not in self.RELACIONES:
+                raise ValueError(f"Relación desconocida: {relacion}")
 
-        # Convertir el JSON a lista
-        objetivos = json.loads(row['objetivos_especificos'])
+        if not semilleros:
+            return
 
-        semillero = Semillero(
-            id=row['id'],
-            nombre=row['nombre'],
-            objetivo_principal=row['objetivo_principal'],
-            objetivos_especificos=objetivos,
-            grupo_id=row['grupo_id'],
-            status=row['status']
-        )
+        if "objetivos" in relaciones:
+            self._cargar_objetivos_lote(semilleros)
 
-        semillero.grupo_nombre = row['grupo_nombre']
+        if "investigadores" in relaciones:
+            self._cargar_investigadores_lote(semilleros)
 
-        # Cargar investigadores asociados
-        self._cargar_investigadores(semillero)
+        if "grupo" in relaciones:
+            # Un único acceso a la caché de grupos para todo el resultado
+            grupos = self.grupo_service._grupos_por_id()
+            for semillero in semilleros:
+                semillero.grupo = grupos.get(semillero.grupo_id)
 
-        return semillero
+        if "entregable" in relaciones:
+            entregables = self.entregable_service.obtener_por_semilleros([s.id for s in semilleros])
+            for semillero in semilleros:
+                semillero.entregable = entregables.get(semillero.id)
 
-    def _cargar_investigadores(self, semillero):
-        """Carga los investigadores asociados a un semillero
+    def _cargar_objetivos_lote(self, semilleros):
+        """Carga los objetivos específicos de varios semilleros con consultas IN (...) por lotes
 
         Args:
-            semillero (Semillero): Objeto Semillero al que cargar los investigadores
+            semilleros (list): Objetos Semillero a los que cargar los objetivos
         """
-        query = """
-            SELECT id, nombre, tipo, email
-            FROM investigadores
-            WHERE semillero_id = ?
-            ORDER BY tipo, nombre
+        por_id = {semillero.id: semillero for semillero in semilleros}
+        ids = list(por_id)
+
+        for semillero in semilleros:
+            semillero.objetivos_especificos = []
+
+        for inicio in range(0, len(ids), self.TAMANO_LOTE):
+            lote = ids[inicio:inicio + self.TAMANO_LOTE]
+            marcadores = ", ".join("?" * len(lote))
+            query = f"""
+                SELECT semillero_id, objetivo
+                FROM semillero_objetivos
+                WHERE semillero_id IN ({marcadores})
+                ORDER BY semillero_id, orden
+            """
+            for row in self.db.execute_query(query, tuple(lote), fetch='all'):
+                por_id[row['semillero_id']].objetivos_especificos.append(row['objetivo'])
+
+    def _cargar_investigadores_lote(self, semilleros):
+        """Carga los investigadores de varios semilleros con consultas IN (...) por lotes
+
+        Args:
+            semilleros (list): Objetos Semillero a los que cargar los investigadores
         """
+        por_id = {semillero.id: semillero for semillero in semilleros}
+        ids = list(por_id)
+
+        # Listas vacías desde el principio: los semilleros sin investigadores quedan cargados
+        for semillero in semilleros:
+            semillero.estudiantes = []
+            semillero.tutores = []
+
+        for inicio in range(0, len(ids), self.TAMANO_LOTE):
+            lote = ids[inicio:inicio + self.TAMANO_LOTE]
+            marcadores = ", ".join("?" * len(lote))
+            query = f"""
+                SELECT id, nombre, tipo, email, semillero_id
+                FROM investigadores
+                WHERE semillero_id IN ({marcadores})
+                ORDER BY semillero_id, tipo, nombre
+            """
 
-        resultados = self.db.execute_query(query, (semillero.id,), fetch='all')
+            resultados = self.db.execute_query(query, tuple(lote), fetch='all')
 
-        for row in resultados:
-            investigador = Investigador(
-                id=row['id'],
-                nombre=row['nombre'],
-                tipo=row['tipo'],
-                email=row['email'],
-                semillero_id=semillero.id
-            )
+            for row in resultados:
+                semillero = por_id[row['semillero_id']]
+                investigador = self._investigadores.get(row['id'])
+                if investigador is None:
+                    investigador = Investigador(id=row['id'])
+                    self._investigadores[row['id']] = investigador
+
+                investigador.nombre = row['nombre']
+                investigador.tipo = row['tipo']
+                investigador.email = row['email']
+                investigador.semillero_id = semillero.id
 
-            if row['tipo'] == 'estudiante':
-                semillero.estudiantes.append(investigador)
-            elif row['tipo'] == 'tutor':
-                semillero.tutores.append(investigador)
+                if row['tipo'] == 'estudiante':
+                    semillero.estudiantes.append(investigador)
+                elif row['tipo'] == 'tutor':
+                    semillero.tutores.append(investigador)
 
     def cambiar_status(self, semillero_id, nuevo_status):
         """Cambia el estado de un semillero
@@ -214,51 +429,31 @@ class SemilleroService:
             nuevo_status (str): Nuevo estado ('activo' o 'pendiente')
 
         Returns:
-            bool: True si se cambió correctamente, False en caso contrario
+            bool: True si el semillero queda con el nuevo estado (también si ya lo tenía),
+                False si el estado no es válido o el semillero no existe
         """
-        if nuevo_status not in ['activo', 'pendiente']:
+        if nuevo_status not in self.STATUS_VALIDOS:
             return False
 
-        query = "UPDATE semilleros SET status = ? WHERE id = ?"
-        self.db.execute_query(query, (nuevo_status, semillero_id))
+        if self.db.consulta("semilleros.cambiar_status", (nuevo_status, semillero_id, nuevo_status),
+                            fetch='rowcount'):
+            self.actividad_service.registrar(Actividad.CAMBIAR_STATUS, "semillero", semillero_id, semillero_id,
+                                             {"status": nuevo_status})
+            return True
 
-        return True
+        # Ninguna fila cambiada: o ya tenía ese estado o no existe
+        return self.db.consulta("semilleros.existe", (semillero_id,), fetch='one') is not None
 
-    def obtener_por_grupo(self, grupo_id):
+    def obtener_por_grupo(self, grupo_id, prefetch=None):
         """Obtiene los semilleros asociados a un grupo de investigación
 
         Args:
             grupo_id (int): ID del grupo de investigación
+            prefetch (iterable, optional): Relaciones a cargar de antemano
 
         Returns:
             list: Lista de objetos Semillero
         """
-        query = """
-            SELECT s.id, s.nombre, s.objetivo_principal, s.objetivos_especificos, 
-                   s.grupo_id, s.status, g.nombre as grupo_nombre
-            FROM semilleros s
-            JOIN grupos_investigacion g ON s.grupo_id = g.id
-            WHERE s.grupo_id = ?
-            ORDER BY s.nombre
-        """
-
-        resultados = self.db.execute_query(query, (grupo_id,), fetch='all')
-
-        semilleros = []
-        for row in resultados:
-            # Convertir el JSON a lista
-            objetivos = json.loads(row['objetivos_especificos'])
-
-            semillero = Semillero(
-                id=row['id'],
-                nombre=row['nombre'],
-                objetivo_principal=row['objetivo_principal'],
-                objetivos_especificos=objetivos,
-                grupo_id=row['grupo_id'],
-                status=row['status']
-            )
+        resultados = self.db.consulta("semilleros.por_grupo", (grupo_id,), fetch='all')
 
-            semillero.grupo_nombre = row['grupo_nombre']
-            semilleros.append(semillero)
-
-        return semilleros
+        return self._construir_semilleros(resultados, prefetch)
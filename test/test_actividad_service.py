@@ -0,0 +1,183 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from db.consultas import CONSULTAS
+from db.database import Database
+from models.actividad import Actividad
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.actividad_service import ActividadService, actor_actual, como_actor
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+
+class TestActividadService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.actividad = ActividadService(self.db, tamano_lote=50, intervalo=60)
+        self.entregables = EntregableService(self.db, self.actividad)
+        self.semilleros = SemilleroService(self.db, entregable_service=self.entregables,
+                                           actividad_service=self.actividad)
+
+    def tearDown(self):
+        self.actividad.cerrar()
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _crear_semillero(self, nombre="Semillero IA"):
+        semillero = Semillero(nombre=nombre, objetivo_principal="Investigar", objetivos_especificos=["Uno"],
+                              grupo_id=1, status="pendiente")
+        semillero.estudiantes = ["Ana", "Luis", "Eva"]
+        semillero.tutores = ["Tutor"]
+        semillero_id, errores = self.semilleros.crear_semillero(semillero)
+        self.assertEqual(errores, [])
+        return semillero_id
+
+    def _filas(self):
+        return self.db.execute_query("SELECT COUNT(*) FROM actividades", fetch='one')[0]
+
+    def test_registra_acciones_de_los_servicios(self):
+        with como_actor("directora"):
+            semillero_id = self._crear_semillero()
+            self.semilleros.cambiar_status(semillero_id, "activo")
+            self.semilleros.cambiar_status(semillero_id, "activo")  # sin cambio: no se anota
+            entregable = Entregable(titulo="Informe", descripcion="D", tipo="Prototipo", semillero_id=semillero_id)
+            self.entregables.crear_entregable(entregable)
+            self.entregables.cambiar_estado(entregable.id, "aprobado")
+            self.entregables.cambiar_estado(entregable.id, "rechazado")  # transición no permitida
+
+        actividades = self.actividad.por_semillero(semillero_id)
+        self.assertEqual([a.accion for a in actividades], [
+            Actividad.CAMBIAR_ESTADO_ENTREGABLE, Actividad.CREAR_ENTREGABLE,
+            Actividad.CAMBIAR_STATUS, Actividad.CREAR_SEMILLERO,
+        ])
+        self.assertEqual({a.actor for a in actividades}, {"directora"})
+        self.assertEqual(actividades[0].entidad_id, entregable.id)
+        self.assertEqual(actividades[0].detalle, {"estado": "aprobado"})
+        self.assertIn("directora creó el semillero", str(actividades[-1]))
+
+    def test_escribe_por_lotes(self):
+        semillero_id = self._crear_semillero()
+        commits = self.db.metricas.instantanea()["contadores"]["commits"]
+
+        for _ in range(9):
+            self.semilleros.cambiar_status(semillero_id, "activo")
+            self.semilleros.cambiar_status(semillero_id, "pendiente")
+
+        # Las anotaciones esperan en memoria: sólo los 18 UPDATE hacen commit
+        self.assertEqual(self.actividad.pendientes, 19)
+        self.assertEqual(self._filas(), 0)
+        self.assertEqual(self.db.metricas.instantanea()["contadores"]["commits"], commits + 18)
+
+        self.assertEqual(self.actividad.vaciar(), 19)
+        self.assertEqual(self._filas(), 19)
+        self.assertEqual(self.db.metricas.instantanea()["contadores"]["commits"], commits + 19)
+
+    def test_lote_lleno_y_temporizador(self):
+        actividad = ActividadService(self.db, tamano_lote=3, intervalo=0.05)
+        for entidad_id in range(1, 5):
+            actividad.registrar(Actividad.CAMBIAR_STATUS, "semillero", entidad_id, entidad_id)
+        self.assertEqual(self._filas(), 3)
+        self.assertEqual(actividad.pendientes, 1)
+
+        limite = time.monotonic() + 5
+        while actividad.pendientes and time.monotonic() < limite:
+            time.sleep(0.01)
+        self.assertEqual(self._filas(), 4)
+        actividad.cerrar()
+
+    def test_lote_lleno_dentro_de_una_transaccion(self):
+        actividad = ActividadService(self.db, tamano_lote=3, intervalo=60)
+        with self.db.transaction():
+            for entidad_id in range(1, 5):
+                actividad.registrar(Actividad.CAMBIAR_STATUS, "semillero", entidad_id, entidad_id)
+            self.assertEqual(actividad.pendientes, 4)
+        # El lote lleno se escribe al confirmar la transacción, no al cabo del intervalo
+        self.assertEqual(self._filas(), 4)
+        self.assertEqual(actividad.pendientes, 0)
+
+        actividad.intervalo = 0.05
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                for entidad_id in range(1, 4):
+                    actividad.registrar(Actividad.CAMBIAR_STATUS, "semillero", entidad_id, entidad_id)
+                raise RuntimeError("deshacer")
+        # Si la transacción se deshace, el temporizador escribe el lote
+        limite = time.monotonic() + 5
+        while actividad.pendientes and time.monotonic() < limite:
+            time.sleep(0.01)
+        self.assertEqual(self._filas(), 7)
+        actividad.cerrar()
+
+    def test_cambio_de_estado_por_lotes(self):
+        ids = []
+        for i in range(3):
+            semillero_id = self._crear_semillero(f"S{i}")
+            entregable = Entregable(titulo=f"E{i}", descripcion="D", tipo="Prototipo", semillero_id=semillero_id)
+            self.entregables.crear_entregable(entregable)
+            ids.append(entregable.id)
+
+        self.assertEqual(self.entregables.cambiar_estado_lote("aprobado", ids=ids[:2]), 2)
+        self.assertEqual(self.entregables.cambiar_estado_lote("rechazado"), 1)
+
+        cambios = [a for a in self.actividad.entre_fechas() if a.accion == Actividad.CAMBIAR_ESTADO_ENTREGABLE]
+        self.assertEqual(sorted((a.entidad_id, a.detalle["estado"]) for a in cambios),
+                         [(ids[0], "aprobado"), (ids[1], "aprobado"), (ids[2], "rechazado")])
+
+    def test_consultas_por_actor_y_fechas(self):
+        with como_actor("ana"):
+            self._crear_semillero("S1")
+        with como_actor("luis"):
+            self._crear_semillero("S2")
+        self.assertIsNotNone(actor_actual())
+
+        self.assertEqual([a.detalle["nombre"] for a in self.actividad.por_actor("luis")], ["S2"])
+        self.assertEqual(len(self.actividad.entre_fechas(desde="2000-01-01")), 2)
+        self.assertEqual(self.actividad.entre_fechas(hasta="2000-01-01"), [])
+        self.assertEqual(len(self.actividad.entre_fechas(limite=1)), 1)
+
+        consultas = {nombre: consulta for nombre, consulta in CONSULTAS.items() if nombre.startswith("actividades.")}
+        self.assertEqual(self.db.revisar_planes(consultas), {})
+
+    def test_solo_insercion(self):
+        self._crear_semillero()
+        self.actividad.vaciar()
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.execute_query("UPDATE actividades SET actor = 'otro'")
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.execute_query("DELETE FROM actividades")
+
+    def test_archivar(self):
+        for i in range(3):
+            self._crear_semillero(f"S{i}")
+        self.actividad.vaciar()
+        self.db.execute_query("DROP TRIGGER trg_actividades_sin_update")
+        self.db.execute_query("UPDATE actividades SET fecha = '2020-01-01 00:00:00.000' WHERE id <= 2")
+
+        directorio = os.path.join(self.directorio.name, "archivo")
+        ruta = self.actividad.archivar("2021-01-01", directorio)
+        self.assertTrue(ruta.endswith("actividad-00000001-00000002.jsonl.gz"))
+        self.assertEqual([a.detalle["nombre"] for a in ActividadService.leer_archivo(ruta)], ["S0", "S1"])
+        self.assertEqual(self._filas(), 1)
+        self.assertEqual(os.listdir(directorio), [os.path.basename(ruta)])
+
+        self.assertIsNone(self.actividad.archivar("2021-01-01", directorio))
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.execute_query("DELETE FROM actividades")
+
+    def test_compartido_se_vacia_al_cerrar(self):
+        with Database(self.db.db_path) as db:
+            compartido = ActividadService.compartido(db)
+            self.assertIs(ActividadService.compartido(db), compartido)
+            compartido.registrar(Actividad.CAMBIAR_STATUS, "semillero", 1, 1)
+        self.assertEqual(self._filas(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import contextvars
+import inspect
+import os
+import tempfile
+import threading
+import unittest
+
+from db.database import Database
+from models.semillero import Semillero
+from services.asincrono import (OMITIDOS, EntregableServiceAsincrono, GrupoServiceAsincrono,
+                                ServiciosAsincronos, SemilleroServiceAsincrono)
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+peticion = contextvars.ContextVar("peticion", default=None)
+
+
+class TestServiciosAsincronos(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _semillero(self, nombre):
+        semillero = Semillero(nombre=nombre, objetivo_principal="Objetivo", objetivos_especificos=["Uno"],
+                              grupo_id=1)
+        semillero.estudiantes = [{"nombre": "E1", "email": ""}, {"nombre": "E2", "email": ""}]
+        semillero.tutores = [{"nombre": "T1", "email": ""}]
+        return semillero
+
+    async def test_mismos_resultados_que_la_api_sincrona(self):
+        async with ServiciosAsincronos(self.db) as servicios:
+            semillero_id, errores = await servicios.semilleros.crear_semillero(self._semillero("Async"))
+            self.assertEqual(errores, [])
+
+            _, errores = await servicios.semilleros.crear_semillero(Semillero(nombre="Inválido"))
+            self.assertIn("Debe tener al menos dos estudiantes", errores)
+
+            semillero = await servicios.semilleros.obtener_por_id(semillero_id)
+            for relacion in servicios.semilleros.servicio.RELACIONES:
+                self.assertTrue(semillero.relacion_cargada(relacion))
+            self.assertEqual(semillero.grupo.id, 1)
+
+            grupo = await servicios.grupos.obtener_por_id(1)
+            self.assertEqual(semillero.grupo_nombre, grupo.nombre)
+            self.assertEqual([s.id for s in await servicios.semilleros.buscar("async")], [semillero_id])
+
+    async def test_peticiones_concurrentes_en_el_ejecutor(self):
+        hilo_bucle = threading.get_ident()
+        hilos = set()
+
+        async with ServiciosAsincronos(self.db, hilos=3) as servicios:
+            ids = await asyncio.gather(*(servicios.semilleros.crear_semillero(self._semillero(f"S{i}"))
+                                         for i in range(10)))
+            self.assertEqual(len({semillero_id for semillero_id, _ in ids}), 10)
+
+            async def leer(semillero_id):
+                peticion.set(semillero_id)
+
+                def en_hilo():
+                    hilos.add(threading.get_ident())
+                    return peticion.get()
+
+                return await servicios.semilleros._ejecutar(en_hilo)
+
+            self.assertEqual(await asyncio.gather(*(leer(i) for i in range(20))), list(range(20)))
+
+        self.assertNotIn(hilo_bucle, hilos)
+
+    def test_fachadas_cubren_los_metodos_publicos(self):
+        def publicos(clase):
+            return {nombre for nombre, miembro in vars(clase).items()
+                    if not nombre.startswith("_") and inspect.isfunction(miembro)}
+
+        for sincrono, asincrono in [(GrupoService, GrupoServiceAsincrono),
+                                    (SemilleroService, SemilleroServiceAsincrono),
+                                    (EntregableService, EntregableServiceAsincrono)]:
+            with self.subTest(servicio=sincrono.__name__):
+                esperados = {nombre for nombre in publicos(sincrono)
+                             if f"{sincrono.__name__}.{nombre}" not in OMITIDOS}
+                self.assertEqual(publicos(asincrono), esperados)
+
+    async def test_cola_y_cambio_de_estado_por_lotes(self):
+        async with ServiciosAsincronos(self.db) as servicios:
+            semillero_id, _ = await servicios.semilleros.crear_semillero(self._semillero("Lote"))
+            self.db.execute_query("INSERT INTO entregables (titulo, tipo, semillero_id) VALUES ('X', 'Prototipo', ?)",
+                                  (semillero_id,))
+
+            self.assertIn("aprobado", (await servicios.entregables.transiciones())["pendiente"])
+            pagina = await servicios.entregables.cola_revision()
+            self.assertEqual([e.titulo for e in pagina.elementos], ["X"])
+            self.assertEqual(await servicios.entregables.cambiar_estado_lote("aprobado", grupo_id=1), 1)
+            self.assertEqual((await servicios.entregables.cola_revision()).elementos, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
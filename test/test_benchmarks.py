@@ -0,0 +1,78 @@
+import copy
+import os
+import tempfile
+import unittest
+
+from benchmarks import servicios
+from benchmarks.datos_sinteticos import generar
+from db.database import Database
+from services.grupo_service import GrupoService
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _base(self, nombre, semilleros, semilla=42):
+        db = Database(os.path.join(self.directorio.name, nombre))
+        self.addCleanup(db.close)
+        GrupoService(db).cargar_datos_iniciales()
+        return db, generar(db, semilleros, semilla, tamano_lote=7)
+
+    def test_generador_reproducible(self):
+        db_a, totales = self._base("a.db", 20)
+        db_b, _ = self._base("b.db", 30)
+        consultas = ("SELECT nombre, tipo, email, semillero_id FROM investigadores",
+                     "SELECT titulo, tipo, semillero_id, fecha_entrega, estado FROM entregables")
+
+        self.assertEqual(totales["semilleros"], 20)
+        self.assertGreaterEqual(totales["investigadores"], 20 * 3)
+        # Los primeros 20 semilleros de una ejecución mayor son los mismos
+        for consulta in consultas:
+            consulta += " WHERE semillero_id <= 20 ORDER BY id"
+            self.assertEqual([tuple(f) for f in db_a.execute_query(consulta, fetch='all')],
+                             [tuple(f) for f in db_b.execute_query(consulta, fetch='all')])
+
+    def test_generador_indexa_cada_semillero_completo(self):
+        db, _ = self._base("fts.db", 20)
+        faltan = [db.execute_query(consulta, fetch='one')[0] for consulta in (
+            "SELECT COUNT(*) FROM investigadores i JOIN semilleros_fts f ON f.rowid = i.semillero_id "
+            "WHERE instr(f.investigadores, i.nombre || ' ' || i.email) = 0",
+            "SELECT COUNT(*) FROM semillero_objetivos o JOIN semilleros_fts f ON f.rowid = o.semillero_id "
+            "WHERE instr(f.objetivos, o.objetivo) = 0",
+        )]
+        self.assertEqual(faltan, [0, 0])
+        self.assertEqual(db.execute_query("SELECT COUNT(*) FROM semilleros_fts", fetch='one')[0], 20)
+
+    def test_cubre_todos_los_metodos_publicos(self):
+        sin_caso = set(servicios.metodos_publicos()) - set(servicios.CASOS) - set(servicios.EXCLUIDOS)
+        self.assertEqual(sin_caso, set())
+
+    def test_ejecutar_y_comparar(self):
+        db, _ = self._base("benchmark.db", 10)
+        resultados = servicios.ejecutar(db, 10, tiempo=60, max_iteraciones=2)
+
+        self.assertEqual(set(resultados["casos"]), set(servicios.CASOS))
+        obtener = resultados["casos"]["SemilleroService.obtener_por_id"]
+        self.assertEqual(obtener["iteraciones"], 2)
+        self.assertGreater(obtener["consultas"], 0)
+        self.assertLessEqual(obtener["p50_ms"], obtener["p95_ms"])
+        self.assertEqual(servicios.comparar(resultados, resultados), [])
+
+        peor = copy.deepcopy(resultados)
+        peor["casos"]["SemilleroService.obtener_por_id"]["p95_ms"] = obtener["p95_ms"] * 2 + 1
+        peor["casos"]["SemilleroService.buscar"]["consultas"] += 1
+        regresiones = servicios.comparar(peor, resultados)
+        self.assertEqual([r.split(" ", 2)[:2] for r in regresiones],
+                         [["SemilleroService.buscar:", "consultas"], ["SemilleroService.obtener_por_id:", "p95_ms"]])
+
+        peor["meta"]["semilleros"] = 1000
+        with self.assertRaises(ValueError):
+            servicios.comparar(peor, resultados)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import json
+import os
+import socket
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from api.feed_cambios import ServidorCambios
+from db.database import Database
+from models.semillero import Semillero
+from services.cambios_service import CambiosService
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+
+class TestCambiosService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.service = CambiosService(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _estado(self, cambios, estado=None):
+        """Reproduce los cambios como lo haría un consumidor"""
+        estado = {} if estado is None else estado
+        for cambio in cambios:
+            clave = (cambio.tabla, json.dumps(cambio.clave, sort_keys=True))
+            if cambio.operacion == "delete":
+                estado.pop(clave, None)
+            else:
+                estado[clave] = cambio.datos
+        return estado
+
+    def _semilleros(self):
+        filas = self.db.execute_query("SELECT * FROM semilleros", fetch='all')
+        # El registro no lleva la marca actualizado_en
+        return {json.dumps({"id": fila['id']}): {k: fila[k] for k in fila.keys() if k != "actualizado_en"}
+                for fila in filas}
+
+    def test_registra_inserciones_cambios_y_borrados(self):
+        inicio = self.service.ultimo_seq()
+        self.assertGreater(inicio, 0)  # los grupos iniciales
+
+        semillero_id = self.db.execute_query("INSERT INTO semilleros (nombre, grupo_id) VALUES ('S', 1)")
+        self.db.execute_query("INSERT INTO semillero_objetivos (semillero_id, orden, objetivo) VALUES (?, 1, 'O')",
+                              (semillero_id,))
+        self.db.execute_query("UPDATE semilleros SET status = 'activo' WHERE id = ?", (semillero_id,))
+        self.db.execute_query("DELETE FROM semillero_objetivos")
+
+        cambios = self.service.cambios_desde(inicio)
+        self.assertEqual([c.seq for c in cambios], sorted(c.seq for c in cambios))
+        self.assertEqual(cambios[0].operacion, "insert")
+        self.assertEqual(cambios[0].clave, {"id": semillero_id})
+        borrado = [c for c in cambios if c.tabla == "semillero_objetivos" and c.operacion == "delete"]
+        self.assertEqual(borrado[0].clave, {"semillero_id": semillero_id, "orden": 1})
+        self.assertIsNone(borrado[0].datos)
+
+        ultimo = [c for c in cambios if c.tabla == "semilleros"][-1]
+        self.assertEqual(ultimo.datos["status"], "activo")
+        self.assertEqual(self.service.cambios_desde(cambios[-1].seq), [])
+        self.assertEqual(len(self.service.cambios_desde(inicio, limite=2)), 2)
+
+    def test_crear_semillero_anota_una_insercion_por_fila(self):
+        semillero = Semillero(nombre="S", objetivo_principal="Objetivo", objetivos_especificos=["Uno", "Dos"],
+                              grupo_id=1)
+        semillero.estudiantes = [{"nombre": "Ana", "email": "ana@test.com"}, {"nombre": "Luis", "email": ""}]
+        semillero.tutores = [{"nombre": "Marta", "email": "marta@test.com"}]
+        inicio = self.service.ultimo_seq()
+        semillero_id, _ = SemilleroService(self.db).crear_semillero(semillero)
+
+        cambios = self.service.cambios_desde(inicio)
+        self.assertEqual([(c.tabla, c.operacion) for c in cambios], [
+            ("semilleros", "insert"),
+            ("semillero_objetivos", "insert"), ("semillero_objetivos", "insert"),
+            ("investigadores", "insert"), ("investigadores", "insert"), ("investigadores", "insert"),
+        ])
+        self.assertEqual(cambios[0].datos, {"id": semillero_id, "nombre": "S", "objetivo_principal": "Objetivo",
+                                            "grupo_id": 1, "status": "pendiente"})
+        self.assertNotIn("actualizado_en", cambios[3].datos)
+
+    def test_captura_escrituras_de_otros_procesos(self):
+        inicio = self.service.ultimo_seq()
+        with sqlite3.connect(self.db.db_path) as conn:
+            conn.execute("INSERT INTO semilleros (nombre, grupo_id) VALUES ('Externo', 2)")
+        cambios = self.service.cambios_desde(inicio)
+        self.assertEqual(cambios[0].datos["nombre"], "Externo")
+
+    def test_update_sin_cambios_no_se_anota(self):
+        self.db.execute_query("INSERT INTO semilleros (nombre, grupo_id) VALUES ('S', 1)")
+        self.db.execute_query("INSERT INTO semillero_objetivos (semillero_id, orden, objetivo) VALUES (1, 1, 'O')")
+        inicio = self.service.ultimo_seq()
+        self.db.execute_query("UPDATE semillero_objetivos SET objetivo = 'O'")
+        # Tampoco la marca temporal del semillero, que el trigger de objetivos reescribe
+        self.assertEqual(self.service.cambios_desde(inicio), [])
+
+        self.db.execute_query("UPDATE semillero_objetivos SET objetivo = 'Otro'")
+        self.assertIn("semillero_objetivos", [c.tabla for c in self.service.cambios_desde(inicio)])
+
+    def test_compactar_conserva_el_estado_final(self):
+        for i in range(5):
+            semillero_id = self.db.execute_query("INSERT INTO semilleros (nombre, grupo_id) VALUES (?, 1)", (f"S{i}",))
+            for status in ("activo", "pendiente", "activo"):
+                self.db.execute_query("UPDATE semilleros SET status = ? WHERE id = ?", (status, semillero_id))
+        self.db.execute_query("DELETE FROM semilleros WHERE id = 1")
+
+        a_medias = self._estado(self.service.cambios_desde(0, limite=10))
+        antes = self.service.cambios_desde(0, limite=100000)
+        self.assertEqual(self.service.compactar(dias=-1), len(antes) - len(self.service.cambios_desde(0, 100000)))
+        despues = self.service.cambios_desde(0, limite=100000)
+        self.assertLess(len(despues), len(antes))
+        self.assertEqual(despues[-1].seq, antes[-1].seq)
+
+        # Desde el principio o desde un punto intermedio se llega al mismo estado
+        final = {clave[1]: datos for clave, datos in self._estado(despues).items() if clave[0] == "semilleros"}
+        self.assertEqual(final, self._semilleros())
+        reanudado = self._estado(self.service.cambios_desde(antes[9].seq, 100000), a_medias)
+        self.assertEqual(reanudado, self._estado(despues))
+
+        self.assertEqual(self.service.compactar(dias=30), 0)
+
+    def test_exportar_jsonl_incremental(self):
+        destino = os.path.join(self.directorio.name, "cambios")
+        primeros = self.service.exportar_jsonl(destino, limite_por_archivo=5)
+        self.assertGreater(len(primeros), 1)
+        self.assertEqual(self.service.exportar_jsonl(destino), [])
+
+        self.db.execute_query("INSERT INTO semilleros (nombre, grupo_id) VALUES ('Nuevo', 1)")
+        nuevos = self.service.exportar_jsonl(destino)
+        self.assertEqual(len(nuevos), 1)
+        with open(nuevos[0], encoding="utf-8") as archivo:
+            lineas = [json.loads(linea) for linea in archivo]
+        self.assertEqual(lineas[0]["datos"]["nombre"], "Nuevo")
+        self.assertEqual(sorted(os.listdir(destino)), sorted(os.path.basename(r) for r in primeros + nuevos))
+
+    def test_feed_por_socket(self):
+        inicio = self.service.ultimo_seq()
+        servidor = ServidorCambios(("127.0.0.1", 0), self.db, intervalo=0.02)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        try:
+            with socket.create_connection(servidor.server_address, timeout=5) as conexion:
+                conexion.sendall(f"{inicio}\n".encode())
+                lector = conexion.makefile("r", encoding="utf-8")
+                self.db.execute_query("INSERT INTO semilleros (nombre, grupo_id) VALUES ('En vivo', 1)")
+                cambio = json.loads(lector.readline())
+                self.assertEqual((cambio["tabla"], cambio["operacion"]), ("semilleros", "insert"))
+                self.assertEqual(cambio["datos"]["nombre"], "En vivo")
+                self.assertGreater(cambio["seq"], inicio)
+        finally:
+            servidor.shutdown()
+            servidor.server_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
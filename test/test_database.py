@@ -0,0 +1,294 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+import warnings
+
+from db.consultas import AdvertenciaPlan, Consulta
+from db.database import Database
+from db.migraciones import VERSION_ACTUAL, AdvertenciaMigracion
+
+
+class TestDatabase(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"), pool_size=2)
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def test_reutiliza_conexiones(self):
+        for _ in range(10):
+            self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')
+        self.assertEqual(self.db.pool.abiertas, 1)
+
+    def test_pool_comprueba_solo_conexiones_inactivas_o_con_error(self):
+        pool = self.db.pool
+        sentencias = []
+        conn = pool.obtener()
+        conn.set_trace_callback(sentencias.append)
+
+        pool.liberar(conn)
+        self.assertIs(pool.obtener(), conn)
+        self.assertEqual(sentencias, [])
+
+        pool.liberar(conn, fallo=True)
+        self.assertIs(pool.obtener(), conn)
+        self.assertEqual(sentencias, ["SELECT 1"])
+
+        pool.inactividad_maxima = 0
+        pool.liberar(conn)
+        self.assertIs(pool.obtener(), conn)
+        self.assertEqual(sentencias, ["SELECT 1", "SELECT 1"])
+
+        # Una conexión rota se sustituye por otra nueva
+        conn.close()
+        pool.liberar(conn, fallo=True)
+        nueva = pool.obtener()
+        self.assertIsNot(nueva, conn)
+        self.assertEqual(nueva.execute("SELECT 1").fetchone()[0], 1)
+        pool.liberar(nueva)
+
+    def test_error_de_consulta_marca_la_conexion(self):
+        self.db.execute_query("SELECT 1", fetch='one')
+        with self.assertRaises(sqlite3.OperationalError):
+            self.db.execute_query("SELECT * FROM tabla_inexistente", fetch='all')
+        self.assertTrue(self.db.pool._disponibles.queue[-1][2])
+
+    def test_execute_query_devuelve_filas_por_nombre(self):
+        self.db.execute_query("INSERT INTO semilleros (nombre) VALUES (?)", ("Semillero Test",))
+        fila = self.db.execute_query("SELECT nombre FROM semilleros", fetch='one')
+        self.assertEqual(fila['nombre'], "Semillero Test")
+
+    def test_execute_many(self):
+        self.db.execute_many("INSERT INTO semilleros (nombre) VALUES (?)", [("A",), ("B",), ("C",)])
+        total = self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0]
+        self.assertEqual(total, 3)
+
+    def test_close_impide_nuevas_consultas(self):
+        self.db.close()
+        with self.assertRaises(sqlite3.OperationalError):
+            self.db.execute_query("SELECT 1", fetch='one')
+
+    def test_context_manager_cierra_conexiones(self):
+        with Database(os.path.join(self.directorio.name, "otra.db")) as db:
+            db.execute_query("SELECT 1", fetch='one')
+            self.assertEqual(db.pool.abiertas, 1)
+        self.assertEqual(db.pool.abiertas, 0)
+
+    def test_perfil_se_aplica_a_cada_conexion(self):
+        conexiones = [self.db.pool.obtener(), self.db.pool.obtener()]
+        try:
+            for conn in conexiones:
+                self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+                self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+                self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)  # MEMORY
+                self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -16384)
+        finally:
+            for conn in conexiones:
+                self.db.pool.liberar(conn)
+
+    def test_perfiles(self):
+        with Database(os.path.join(self.directorio.name, "compatible.db"), perfil="compatible") as db:
+            self.assertEqual(db.execute_query("PRAGMA journal_mode", fetch='one')[0], "delete")
+            self.assertEqual(db.checkpoint(), (0, -1, -1))
+        with self.assertRaises(ValueError):
+            Database(os.path.join(self.directorio.name, "x.db"), perfil="inexistente")
+
+    def test_lectores_no_esperan_al_escritor(self):
+        self.db.execute_query("INSERT INTO semilleros (nombre) VALUES ('Original')")
+        escribiendo = threading.Event()
+        terminar = threading.Event()
+
+        def escritor():
+            with self.db.transaction():
+                self.db.execute_query("UPDATE semilleros SET nombre = 'Cambiado'")
+                escribiendo.set()
+                terminar.wait(5)
+
+        hilo = threading.Thread(target=escritor)
+        hilo.start()
+        try:
+            self.assertTrue(escribiendo.wait(5))
+            # Con el escritor a mitad de transacción la lectura ve el último estado confirmado
+            fila = self.db.execute_query("SELECT nombre FROM semilleros", fetch='one')
+            self.assertEqual(fila['nombre'], "Original")
+        finally:
+            terminar.set()
+            hilo.join()
+
+        self.assertEqual(self.db.execute_query("SELECT nombre FROM semilleros", fetch='one')[0], "Cambiado")
+
+    def test_lectura_no_bloquea_a_los_escritores(self):
+        self.db.execute_query("INSERT INTO semilleros (nombre) VALUES ('Original')")
+        otra = sqlite3.connect(self.db.db_path, timeout=0)
+        try:
+            with self.db.lectura():
+                contar = "SELECT COUNT(*) FROM semilleros"
+                self.assertEqual(self.db.execute_query(contar, fetch='one')[0], 1)
+                # Otra conexión escribe sin esperar, y la lectura sigue viendo su instantánea
+                with otra:
+                    otra.execute("INSERT INTO semilleros (nombre) VALUES ('Nuevo')")
+                self.assertEqual(self.db.execute_query(contar, fetch='one')[0], 1)
+        finally:
+            otra.close()
+        self.assertEqual(self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0], 2)
+
+    def test_reintenta_si_la_base_esta_ocupada(self):
+        ruta = os.path.join(self.directorio.name, "ocupada.db")
+        with Database(ruta, perfil=dict(busy_timeout=0, journal_mode="WAL")) as db:
+            otro_proceso = sqlite3.connect(ruta, isolation_level=None, check_same_thread=False)
+            otro_proceso.execute("BEGIN IMMEDIATE")
+            threading.Timer(0.1, otro_proceso.execute, ("COMMIT",)).start()
+
+            db.execute_query("INSERT INTO semilleros (nombre) VALUES ('Tras esperar')")
+            self.assertEqual(db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0], 1)
+            otro_proceso.close()
+
+    def test_checkpoint(self):
+        self.db.execute_many("INSERT INTO semilleros (nombre) VALUES (?)", [(f"S{i}",) for i in range(100)])
+        ocupado, paginas, copiadas = self.db.checkpoint("TRUNCATE")
+        self.assertEqual(ocupado, 0)
+        self.assertEqual(os.path.getsize(self.db.db_path + "-wal"), 0)
+        with self.assertRaises(ValueError):
+            self.db.checkpoint("NINGUNO")
+
+    def test_esquema_en_version_actual(self):
+        version = self.db.execute_query("PRAGMA user_version", fetch='one')[0]
+        self.assertEqual(version, VERSION_ACTUAL)
+        self.assertEqual(self.db.migraciones_aplicadas, list(range(1, VERSION_ACTUAL + 1)))
+
+    def test_reabrir_no_aplica_migraciones(self):
+        with Database(self.db.db_path) as db:
+            self.assertEqual(db.migraciones_aplicadas, [])
+
+    def test_columnas_usadas_por_servicios(self):
+        columnas = {fila[1] for fila in self.db.execute_query("PRAGMA table_info(investigadores)", fetch='all')}
+        self.assertIn("semillero_id", columnas)
+        columnas = {fila[1] for fila in self.db.execute_query("PRAGMA table_info(grupos_investigacion)", fetch='all')}
+        self.assertTrue({"campo", "identificador", "director"} <= columnas)
+
+    def test_consultas_por_semillero_usan_indice(self):
+        plan = self.db.execute_query(
+            "EXPLAIN QUERY PLAN SELECT * FROM investigadores WHERE semillero_id = ?", (1,), fetch='all'
+        )
+        self.assertTrue(any("USING INDEX" in fila['detail'] for fila in plan))
+
+    def test_consulta_por_nombre(self):
+        self.db.consulta("grupos.insertar", ("Grupo", "Campo", "COL1", "Director"))
+        self.assertEqual(self.db.consulta("grupos.contar", fetch='one')[0], 1)
+        with self.assertRaises(ValueError):
+            self.db.consulta("grupos.inexistente")
+
+    def test_consultas_registradas_no_recorren_tablas(self):
+        self.assertEqual(self.db.revisar_planes(), {})
+
+        sin_indice = {"por_email": Consulta("SELECT * FROM investigadores WHERE email = ?", False)}
+        self.assertEqual(self.db.revisar_planes(sin_indice), {"por_email": ["SCAN investigadores"]})
+
+    def test_depurar_consultas_avisa_si_falta_un_indice(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            Database(self.db.db_path, depurar_consultas=True).close()
+
+        self.db.execute_query("DROP INDEX idx_entregables_semillero")
+        with self.assertWarns(AdvertenciaPlan) as aviso:
+            Database(self.db.db_path, depurar_consultas=True).close()
+        self.assertIn("entregables", str(aviso.warning))
+
+    def test_migra_base_antigua(self):
+        ruta = os.path.join(self.directorio.name, "antigua.db")
+        conn = sqlite3.connect(ruta)
+        conn.execute("CREATE TABLE semilleros (id INTEGER PRIMARY KEY, nombre TEXT NOT NULL, grupo_id INTEGER, status TEXT)")
+        conn.execute("INSERT INTO semilleros (nombre) VALUES ('Existente')")
+        conn.commit()
+        conn.close()
+
+        with Database(ruta) as db:
+            fila = db.execute_query("SELECT nombre, objetivo_principal FROM semilleros", fetch='one')
+            self.assertEqual(fila['nombre'], "Existente")
+            self.assertEqual(fila['objetivo_principal'], "")
+
+    def test_migracion_aparta_entregables_duplicados(self):
+        self.db.execute_query("INSERT INTO semilleros (nombre) VALUES ('S')")
+        self.db.execute_query("DROP INDEX idx_entregables_semillero")
+        self.db.execute_many("INSERT INTO entregables (titulo, tipo, semillero_id) VALUES (?, 'Prototipo', 1)",
+                             [("Primero",), ("Duplicado",)])
+        # Esquema anterior a la migración v8 (flujo de entregables)
+        self.db.execute_query("PRAGMA user_version = 7")
+
+        with self.assertWarnsRegex(AdvertenciaMigracion, r"entregables 2 \(semillero 1\)"):
+            db = Database(self.db.db_path)
+        with db:
+            filas = db.execute_query("SELECT titulo FROM entregables", fetch='all')
+            self.assertEqual([fila['titulo'] for fila in filas], ["Primero"])
+            # El duplicado no se pierde: queda apartado con todas sus columnas
+            apartado = db.execute_query("SELECT id, titulo, semillero_id FROM entregables_duplicados", fetch='all')
+            self.assertEqual([tuple(fila) for fila in apartado], [(2, "Duplicado", 1)])
+            with self.assertRaises(sqlite3.IntegrityError):
+                db.execute_query("INSERT INTO entregables (titulo, tipo, semillero_id) VALUES ('Otro', 'Prototipo', 1)")
+
+    def test_migracion_calcula_los_contadores(self):
+        self.db.execute_many("INSERT INTO semilleros (nombre, grupo_id, status) VALUES (?, ?, ?)",
+                             [("A", 1, "activo"), ("B", 1, "activo"), ("C", None, "pendiente")])
+        self.db.execute_query("DELETE FROM contador_semilleros")
+        # Esquema anterior a la migración v11 (contadores)
+        self.db.execute_query("PRAGMA user_version = 10")
+
+        with Database(self.db.db_path) as db:
+            filas = db.execute_query("SELECT grupo_id, status, total FROM contador_semilleros ORDER BY grupo_id",
+                                     fetch='all')
+            self.assertEqual([tuple(fila) for fila in filas], [(0, "pendiente", 1), (1, "activo", 2)])
+
+    def test_migra_objetivos_a_su_tabla(self):
+        ruta = os.path.join(self.directorio.name, "objetivos.db")
+        conn = sqlite3.connect(ruta)
+        conn.execute("CREATE TABLE semilleros (id INTEGER PRIMARY KEY, nombre TEXT NOT NULL, "
+                     "objetivos_especificos TEXT, grupo_id INTEGER, status TEXT)")
+        conn.executemany("INSERT INTO semilleros (id, nombre, objetivos_especificos) VALUES (?, ?, ?)", [
+            (1, "JSON", '["Primero", "Segundo"]'),
+            (2, "Lista de Python", "['Tercero', 'Cuarto']"),
+            (3, "Texto", "Quinto"),
+            (4, "Vacío", None),
+        ])
+        conn.commit()
+        conn.close()
+
+        with Database(ruta) as db:
+            filas = db.execute_query("SELECT semillero_id, orden, objetivo FROM semillero_objetivos "
+                                     "ORDER BY semillero_id, orden", fetch='all')
+            self.assertEqual([tuple(fila) for fila in filas], [
+                (1, 1, "Primero"), (1, 2, "Segundo"), (2, 1, "Tercero"), (2, 2, "Cuarto"), (3, 1, "Quinto")
+            ])
+            columnas = [fila['name'] for fila in db.execute_query("PRAGMA table_info(semilleros)", fetch='all')]
+            self.assertNotIn("objetivos_especificos", columnas)
+
+            fts = db.execute_query("SELECT rowid FROM semilleros_fts WHERE semilleros_fts MATCH 'cuarto'",
+                                   fetch='all')
+            self.assertEqual([fila[0] for fila in fts], [2])
+
+    def test_transaction_confirma_al_salir(self):
+        with self.db.transaction():
+            self.db.execute_query("INSERT INTO semilleros (nombre) VALUES ('A')")
+            self.db.execute_many("INSERT INTO semilleros (nombre) VALUES (?)", [("B",), ("C",)])
+        total = self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0]
+        self.assertEqual(total, 3)
+
+    def test_transaction_deshace_si_falla(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.db.transaction():
+                self.db.execute_query("INSERT INTO semilleros (nombre) VALUES ('A')")
+                self.db.execute_query("INSERT INTO semilleros (nombre) VALUES (NULL)")
+        total = self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0]
+        self.assertEqual(total, 0)
+
+    def test_transaction_anidada_se_une_a_la_exterior(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                with self.db.transaction():
+                    self.db.execute_query("INSERT INTO semilleros (nombre) VALUES ('A')")
+                raise RuntimeError("fallo tras la transacción interna")
+        total = self.db.execute_query("SELECT COUNT(*) FROM semilleros", fetch='one')[0]
+        self.assertEqual(total, 0)
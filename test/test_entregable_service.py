@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from db.database import Database
+from models.entregable import Entregable
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+
+
+class TestEntregableService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.db.execute_many("INSERT INTO semilleros (nombre, grupo_id) VALUES (?, ?)",
+                             [(f"S{i}", 1 if i <= 3 else 2) for i in range(1, 7)])
+        self.service = EntregableService(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _crear(self, semillero_id, fecha=None, tipo="Prototipo"):
+        entregable = Entregable(titulo=f"E{semillero_id}", descripcion="D", tipo=tipo,
+                                semillero_id=semillero_id, fecha_entrega=fecha)
+        creado, _ = self.service.crear_entregable(entregable)
+        self.assertTrue(creado)
+        return entregable.id
+
+    def test_un_entregable_por_semillero(self):
+        self._crear(1)
+        creado, mensaje = self.service.crear_entregable(
+            Entregable(titulo="Otro", descripcion="D", tipo="Prototipo", semillero_id=1))
+        self.assertFalse(creado)
+        self.assertEqual(mensaje, "Este semillero ya tiene un entregable asignado")
+
+    def test_transiciones_permitidas(self):
+        entregable_id = self._crear(1)
+        self.assertEqual(self.service.transiciones()["aprobado"], ["pendiente"])
+
+        self.assertTrue(self.service.cambiar_estado(entregable_id, "aprobado")[0])
+        cambiado, mensaje = self.service.cambiar_estado(entregable_id, "rechazado")
+        self.assertFalse(cambiado)
+        self.assertIn("aprobado", mensaje)
+        self.assertTrue(self.service.cambiar_estado(entregable_id, "pendiente")[0])
+        self.assertTrue(self.service.cambiar_estado(entregable_id, "pendiente")[0])
+
+        self.assertFalse(self.service.cambiar_estado(999, "aprobado")[0])
+        self.assertFalse(self.service.cambiar_estado(entregable_id, "archivado")[0])
+
+    def test_trigger_impide_transiciones_no_permitidas(self):
+        entregable_id = self._crear(1)
+        self.db.execute_query("UPDATE entregables SET estado = 'aprobado' WHERE id = ?", (entregable_id,))
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.execute_query("UPDATE entregables SET estado = 'rechazado' WHERE id = ?", (entregable_id,))
+
+    def test_cambiar_estado_lote(self):
+        ids = [self._crear(i, tipo="Prototipo" if i % 2 else "Working paper") for i in range(1, 7)]
+        self.service.cambiar_estado(ids[0], "rechazado")
+
+        # Grupo 1 (semilleros 1-3): el 1 ya está rechazado y no puede pasar a aprobado
+        self.assertEqual(self.service.cambiar_estado_lote("aprobado", grupo_id=1), 2)
+        self.assertEqual(self.service.cambiar_estado_lote("rechazado", tipo="Working paper"), 2)
+        self.assertEqual(self.service.cambiar_estado_lote("aprobado", ids=[ids[0], ids[4], 999]), 1)
+
+        estados = dict(self.db.execute_query("SELECT id, estado FROM entregables", fetch='all'))
+        self.assertEqual([estados[i] for i in ids],
+                         ["rechazado", "aprobado", "aprobado", "rechazado", "aprobado", "rechazado"])
+
+        with self.assertRaises(ValueError):
+            self.service.cambiar_estado_lote("archivado")
+
+    def test_cola_revision(self):
+        fechas = {1: "2024-03-01", 2: "2024-01-15", 3: "2024-02-10", 4: "2024-01-15", 5: "2024-04-01"}
+        ids = {semillero_id: self._crear(semillero_id, fecha) for semillero_id, fecha in fechas.items()}
+        self.db.execute_query("INSERT INTO entregables (titulo, tipo, semillero_id) VALUES ('Sin fecha', 'Prototipo', 6)")
+        self.service.cambiar_estado(ids[3], "aprobado")
+
+        pagina = self.service.cola_revision(tamano=2)
+        self.assertEqual([e.titulo for e in pagina.elementos], ["Sin fecha", "E2"])
+        pagina = self.service.cola_revision(tamano=2, despues=pagina.siguiente)
+        self.assertEqual([e.titulo for e in pagina.elementos], ["E4", "E1"])
+        self.assertEqual(pagina.elementos[0].semillero_nombre, "S4")
+        pagina = self.service.cola_revision(tamano=2, despues=pagina.siguiente)
+        self.assertEqual([e.titulo for e in pagina.elementos], ["E5"])
+        self.assertIsNone(pagina.siguiente)
+
+    def test_cola_revision_usa_indice_parcial(self):
+        plan = " ".join(fila[3] for fila in self.db.explicar("entregables.pendientes"))
+        self.assertIn("SEARCH e USING INDEX idx_entregables_pendientes", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
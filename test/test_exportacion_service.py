@@ -0,0 +1,84 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from db.database import Database
+from services.exportacion_service import ExportacionService, leer_columnar
+from services.grupo_service import GrupoService
+
+
+class TestExportacionService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.db.execute_many("INSERT INTO semilleros (nombre, grupo_id) VALUES (?, ?)",
+                             [(f"Semillero {i}", 1) for i in range(5)])
+        self.service = ExportacionService(self.db)
+        self.service.TAMANO_BLOQUE = 2
+        self.destino = os.path.join(self.directorio.name, "exportacion")
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def test_exportar_csv(self):
+        totales = self.service.exportar(self.destino, "csv")
+        self.assertEqual(totales["semilleros"], 5)
+        self.assertEqual(totales["grupos_investigacion"], 8)
+        with open(os.path.join(self.destino, "semilleros.csv"), encoding="utf-8") as archivo:
+            filas = list(csv.DictReader(archivo))
+        self.assertEqual([f["nombre"] for f in filas], [f"Semillero {i}" for i in range(5)])
+
+    def test_exportar_jsonl(self):
+        self.service.exportar(self.destino, "jsonl", tablas=["semilleros"])
+        with open(os.path.join(self.destino, "semilleros.jsonl"), encoding="utf-8") as archivo:
+            filas = [json.loads(linea) for linea in archivo]
+        self.assertEqual(len(filas), 5)
+        self.assertEqual(filas[0]["grupo_id"], 1)
+
+    def test_columnar_ida_y_vuelta(self):
+        self.service.exportar(self.destino, "columnar", tablas=["semilleros"])
+        bloques = list(leer_columnar(os.path.join(self.destino, "semilleros.col")))
+        self.assertEqual([len(b["id"]) for b in bloques], [2, 2, 1])
+        self.assertEqual(sum((b["nombre"] for b in bloques), []), [f"Semillero {i}" for i in range(5)])
+
+    def test_since_exporta_solo_cambios_recientes(self):
+        self.db.execute_query("UPDATE semilleros SET actualizado_en = '2000-01-01 00:00:00.000'")
+        self.db.execute_query("UPDATE semilleros SET status = 'activo' WHERE id = 3")
+        totales = self.service.exportar(self.destino, "jsonl", desde="2020-01-01", tablas=["semilleros"])
+        self.assertEqual(totales["semilleros"], 1)
+
+    def test_since_normaliza_la_fecha(self):
+        self.db.execute_query("UPDATE semilleros SET actualizado_en = '2024-01-05 10:00:00.000'")
+        self.db.execute_query("UPDATE semilleros SET actualizado_en = '2024-01-05 12:00:00.500' WHERE id = 3")
+
+        for desde, filas in [("2024-01-05T11:00", 1), ("2024-01-05 12:00:00.5", 0), ("2024-01-05T13:00+02:00", 1),
+                             ("2024-01-05T12:00:00Z", 1), ("2024-01-05", 5)]:
+            with self.subTest(desde=desde):
+                totales = self.service.exportar(self.destino, "jsonl", desde=desde, tablas=["semilleros"])
+                self.assertEqual(totales["semilleros"], filas)
+
+        for desde in ["2024-1-5", "ayer", "05/01/2024"]:
+            with self.subTest(desde=desde), self.assertRaises(ValueError):
+                self.service.exportar(self.destino, "jsonl", desde=desde)
+
+    def test_objetivos_siguen_a_su_semillero(self):
+        self.db.execute_many("INSERT INTO semillero_objetivos (semillero_id, orden, objetivo) VALUES (?, ?, ?)",
+                             [(1, 1, "Uno"), (1, 2, "Dos"), (2, 1, "Tres")])
+        self.db.execute_query("UPDATE semilleros SET actualizado_en = '2000-01-01 00:00:00.000'")
+        self.db.execute_query("DELETE FROM semillero_objetivos WHERE semillero_id = 1 AND orden = 2")
+
+        totales = self.service.exportar(self.destino, "jsonl", tablas=["semillero_objetivos"])
+        self.assertEqual(totales["semillero_objetivos"], 2)
+
+        totales = self.service.exportar(self.destino, "jsonl", desde="2020-01-01", tablas=["semillero_objetivos"])
+        with open(os.path.join(self.destino, "semillero_objetivos.jsonl"), encoding="utf-8") as archivo:
+            filas = [json.loads(linea) for linea in archivo]
+        self.assertEqual(filas, [{"semillero_id": 1, "orden": 1, "objetivo": "Uno"}])
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(ValueError):
+            self.service.exportar(self.destino, "xml")
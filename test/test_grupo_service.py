@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from db.database import Database
+from models.grupo import Grupo
+from services.grupo_service import GrupoService
+
+
+class TestGrupoService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        self.service = GrupoService(self.db)
+        self.service.cargar_datos_iniciales()
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def test_cargar_datos_iniciales_una_sola_vez(self):
+        self.assertEqual(self.service.cargar_datos_iniciales(), 0)
+        self.assertEqual(len(self.service.obtener_todos()), 8)
+
+    def test_obtener_todos_ordenado_por_nombre(self):
+        nombres = [grupo.nombre for grupo in self.service.obtener_todos()]
+        self.assertEqual(nombres, sorted(nombres))
+
+    def test_obtener_por_id(self):
+        grupo = self.service.obtener_por_id(4)
+        self.assertEqual(grupo.nombre, "ONTARE")
+        self.assertEqual(self.service.obtener_por_id("4").identificador, "COL0007814")
+        self.assertIsNone(self.service.obtener_por_id(99))
+
+    def test_lecturas_repetidas_usan_la_cache(self):
+        self.service.obtener_todos()
+        self.service.obtener_por_id(1)
+        self.service.obtener_por_id(2)
+        estadisticas = self.service.estadisticas_cache()
+        self.assertEqual(estadisticas["fallos"], 1)
+        self.assertEqual(estadisticas["aciertos"], 2)
+
+    def test_crear_grupo_invalida_la_cache(self):
+        self.service.obtener_todos()
+        grupo_id = self.service.crear_grupo(Grupo(nombre="NUEVO", campo="Campo", identificador="COL1",
+                                                  director="Director"))
+        self.assertEqual(self.service.obtener_por_id(grupo_id).nombre, "NUEVO")
+        self.assertEqual(len(self.service.obtener_todos()), 9)
+
+    def test_version_externa_una_vez_por_operacion_y_por_tabla(self):
+        self.service.obtener_todos()
+        with self.db.metricas.traza("Ver grupos") as traza:
+            for grupo_id in range(1, 9):
+                self.service.obtener_por_id(grupo_id)
+        self.assertEqual([consulta for consulta, _, _ in traza.consultas], ["cambios.ultimo_de_tabla"])
+
+        # Escribir en otra tabla del registro de cambios, desde otra conexión, no invalida los grupos
+        with Database(self.db.db_path) as otra:
+            otra.execute_query("INSERT INTO semilleros (nombre, grupo_id) VALUES ('Otro', 1)")
+        self.service.obtener_por_id(1)
+        self.assertEqual(self.service.estadisticas_cache()["fallos"], 1)
+
+        with Database(self.db.db_path) as otra:
+            otra.execute_query("UPDATE grupos_investigacion SET director = 'Otra persona' WHERE id = 1")
+        self.assertEqual(self.service.obtener_por_id(1).director, "Otra persona")
+
+    def test_ttl_expira_la_cache(self):
+        service = GrupoService(self.db, ttl=0)
+        service.obtener_todos()
+        service.obtener_todos()
+        self.assertEqual(service.estadisticas_cache()["fallos"], 2)
+
+    def test_listar_pagina(self):
+        primera = self.service.listar_pagina(tamano=5)
+        segunda = self.service.listar_pagina(tamano=5, despues=primera.siguiente)
+        nombres = [g.nombre for g in primera.elementos + segunda.elementos]
+        self.assertEqual(nombres, [g.nombre for g in self.service.obtener_todos()])
+        self.assertIsNone(segunda.siguiente)
+        self.assertEqual(self.service.listar_pagina(tamano=5, antes=segunda.anterior).elementos[0].nombre,
+                         nombres[0])
+
+    def test_lineas_investigacion(self):
+        self.assertIn("Inteligencia artificial", self.service.obtener_lineas_investigacion("4"))
+        self.assertEqual(self.service.obtener_lineas_investigacion(99),
+                         ["No hay líneas de investigación registradas"])
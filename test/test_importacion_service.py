@@ -0,0 +1,147 @@
+import csv
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from db.database import Database
+from services.grupo_service import GrupoService
+from services.importacion_service import ImportacionService
+from services.semillero_service import SemilleroService
+
+
+class TestImportacionService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.service = ImportacionService(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _ruta(self, nombre):
+        return os.path.join(self.directorio.name, nombre)
+
+    def _escribir_jsonl(self, nombre, registros):
+        ruta = self._ruta(nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            for registro in registros:
+                archivo.write(json.dumps(registro) + "\n")
+        return ruta
+
+    def _registro(self, nombre, grupo_id=1):
+        return {
+            "nombre": nombre,
+            "objetivo_principal": "Objetivo",
+            "objetivos_especificos": ["Objetivo 1"],
+            "grupo_id": grupo_id,
+            "estudiantes": [{"nombre": "E1", "email": "e1@test.com"}, {"nombre": "E2", "email": ""}],
+            "tutores": [{"nombre": "T1", "email": "t1@test.com"}],
+            "entregable": {"titulo": "Informe", "descripcion": "Descripción", "tipo": "Prototipo"}
+        }
+
+    def test_importar_csv(self):
+        ruta = self._ruta("semilleros.csv")
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["nombre", "objetivo_principal", "objetivos_especificos", "grupo_id",
+                               "estudiantes", "tutores", "entregable_titulo", "entregable_descripcion",
+                               "entregable_tipo"])
+            escritor.writerow(["Semillero CSV", "Objetivo", "Uno|Dos", "2", "Ana, ana@test.com|Luis",
+                               "Marta, marta@test.com", "Artículo", "Descripción", "Artículo científico"])
+
+        resultado = self.service.importar(ruta)
+
+        self.assertEqual(resultado.importados, 1)
+        self.assertEqual(resultado.investigadores, 3)
+        self.assertEqual(resultado.entregables, 1)
+        semillero = SemilleroService(self.db).obtener_todos()[0]
+        self.assertEqual(semillero.objetivos_especificos, ["Uno", "Dos"])
+        self.assertEqual([e.nombre for e in semillero.estudiantes], ["Ana", "Luis"])
+        self.assertEqual(semillero.tutores[0].email, "marta@test.com")
+
+    def test_rechazados_van_al_archivo_lateral(self):
+        ruta = self._escribir_jsonl("semilleros.jsonl", [
+            self._registro("Válido"),
+            self._registro("Grupo inexistente", grupo_id=99),
+            {"nombre": ""}
+        ])
+
+        resultado = self.service.importar(ruta)
+
+        self.assertEqual(resultado.importados, 1)
+        self.assertEqual(resultado.rechazados, 2)
+        with open(f"{ruta}.rechazados.jsonl", encoding="utf-8") as archivo:
+            rechazos = [json.loads(linea) for linea in archivo]
+        self.assertEqual([r["registro"] for r in rechazos], [2, 3])
+
+    def test_tipos_no_validos_van_a_rechazados(self):
+        nombre_nulo = self._registro("Nombre nulo")
+        nombre_nulo["estudiantes"][0]["nombre"] = None
+        nombre_numerico = self._registro("Nombre numérico")
+        nombre_numerico["tutores"] = [{"nombre": 42, "email": ""}]
+        objetivos_texto = self._registro("Objetivos como texto")
+        objetivos_texto["objetivos_especificos"] = "Un objetivo"
+        ruta = self._escribir_jsonl("semilleros.jsonl", [
+            nombre_nulo, self._registro("Válido"), nombre_numerico, objetivos_texto
+        ])
+
+        resultado = self.service.importar(ruta)
+
+        self.assertEqual((resultado.importados, resultado.rechazados), (1, 3))
+        with open(f"{ruta}.rechazados.jsonl", encoding="utf-8") as archivo:
+            rechazos = [json.loads(linea) for linea in archivo]
+        self.assertEqual([(r["registro"], r["errores"]) for r in rechazos], [
+            (1, ["estudiantes[1] debe tener un nombre de texto"]),
+            (3, ["tutores[1] debe tener un nombre de texto"]),
+            (4, ["objetivos_especificos debe ser una lista de textos"]),
+        ])
+        semillero = SemilleroService(self.db).obtener_todos()[0]
+        self.assertEqual(semillero.nombre, "Válido")
+        self.assertEqual(semillero.objetivos_especificos, ["Objetivo 1"])
+
+    def test_cambios_por_lote_iguales_a_los_de_los_triggers(self):
+        registros = [self._registro(f"S{i}") for i in range(5)]
+        registros[2]["estudiantes"] = []
+        self.service.importar(self._escribir_jsonl("lotes.jsonl", registros), tamano_lote=2)
+
+        # Las mismas filas insertadas una a una en otra base, con los triggers anotando cada una
+        ruta = self._ruta("por_fila.db")
+        Database(ruta).close()
+        conn = sqlite3.connect(ruta)
+        try:
+            conn.execute("ATTACH DATABASE ? AS importada", (self.db.db_path,))
+            with conn:
+                for tabla in ("semillero_objetivos", "investigadores", "semilleros", "entregables"):
+                    conn.execute(f"INSERT INTO {tabla} SELECT * FROM importada.{tabla}")
+            consulta = "SELECT tabla, operacion, clave, datos FROM {}cambios WHERE tabla <> 'grupos_investigacion'"
+            por_fila = sorted(conn.execute(consulta.format("")).fetchall())
+            por_lote = sorted(conn.execute(consulta.format("importada.")).fetchall())
+        finally:
+            conn.close()
+
+        self.assertEqual(len(por_lote), 4 + 4 + 4 * 3 + 4)
+        self.assertEqual(por_lote, por_fila)
+        self.assertEqual(self.db.execute_query("SELECT COUNT(*) FROM cambios_en_lote", fetch='one')[0], 0)
+
+        # Fuera de la importación los triggers siguen anotando cada escritura
+        self.db.execute_query("UPDATE semilleros SET nombre = 'Otro' WHERE id = 1")
+        ultimo = self.db.execute_query("SELECT tabla, operacion FROM cambios ORDER BY seq DESC", fetch='one')
+        self.assertEqual(tuple(ultimo), ("semilleros", "update"))
+
+    def test_reanudar_no_duplica_registros(self):
+        ruta = self._escribir_jsonl("semilleros.jsonl", [self._registro(f"S{i}") for i in range(5)])
+        self.service.importar(ruta, tamano_lote=2)
+
+        resultado = self.service.importar(ruta)
+
+        self.assertEqual(resultado.omitidos, 5)
+        self.assertEqual(resultado.importados, 0)
+        self.assertEqual(len(SemilleroService(self.db).listar_resumen()), 5)
+
+    def test_formato_no_soportado(self):
+        with self.assertRaises(ValueError):
+            self.service.importar(self._ruta("semilleros.xlsx"))
@@ -0,0 +1,62 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+from db.database import Database
+from services.grupo_service import GrupoService
+
+
+class TestArranque(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "test.db")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _ejecutar(self, *argumentos):
+        """Arranca el menú con la base temporal y sale en la primera opción"""
+        salida = io.StringIO()
+        with mock.patch("builtins.input", return_value="0"), contextlib.redirect_stdout(salida):
+            main.main(["--db", self.ruta, *argumentos])
+        return salida.getvalue()
+
+    def _grupos(self):
+        with Database(self.ruta) as db:
+            return db.execute_query("SELECT COUNT(*) FROM grupos_investigacion", fetch='one')[0]
+
+    def test_base_nueva_carga_los_grupos(self):
+        salida = self._ejecutar()
+        self.assertIn("Se han cargado 8 grupos de investigación.", salida)
+        self.assertEqual(self._grupos(), 8)
+
+    def test_base_ya_migrada_no_consulta_los_grupos(self):
+        self._ejecutar()
+
+        with mock.patch.object(GrupoService, "cargar_datos_iniciales") as cargar:
+            salida = self._ejecutar()
+        cargar.assert_not_called()
+        self.assertIn("Los datos de grupos ya están cargados", salida)
+        self.assertEqual(self._grupos(), 8)
+
+    def test_profile_startup(self):
+        salida = self._ejecutar("--profile-startup")
+        self.assertIn("=== TIEMPOS DE ARRANQUE ===", salida)
+        for fase in ("Abrir base de datos", "Cargar datos iniciales", "Importar interfaz", "Total"):
+            self.assertRegex(salida, rf"{fase} +\d+\.\d\d ms")
+
+        self.assertNotIn("TIEMPOS DE ARRANQUE", self._ejecutar())
+
+    def test_compactar_cada_exige_servidor_o_feed(self):
+        with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()) as errores:
+            self._ejecutar("--compactar-cada", "1")
+        self.assertIn("--compactar-cada", errores.getvalue())
+        self.assertFalse(os.path.exists(self.ruta))
+
+
+if __name__ == "__main__":
+    unittest.main()
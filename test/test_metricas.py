@@ -0,0 +1,107 @@
+import asyncio
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from db.database import Database
+from db.metricas import Metricas, normalizar, traza_actual
+from services.asincrono import ServiciosAsincronos
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+
+class TestMetricas(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.db.metricas.reiniciar()
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def test_normalizar_agrupa_listas_in(self):
+        self.assertEqual(normalizar("SELECT *\n   FROM t WHERE id IN (?, ?, ?)"), "SELECT * FROM t WHERE id IN (?...)")
+        self.assertEqual(normalizar("SELECT * FROM t WHERE id IN (?)"), "SELECT * FROM t WHERE id IN (?...)")
+
+    def test_histograma_y_contadores(self):
+        grupos = GrupoService(self.db)
+        grupos.obtener_todos()
+        grupos.crear_grupo(grupos.obtener_por_id(1))
+
+        datos = self.db.metricas.instantanea()
+        todos = datos["consultas"]["grupos.todos"]
+        self.assertEqual(todos["llamadas"], 1)
+        self.assertEqual(todos["filas"], 8)
+        self.assertEqual(sum(todos["histograma"].values()), 1)
+        self.assertEqual(datos["consultas"]["grupos.insertar"]["filas"], 1)
+        self.assertEqual(datos["contadores"]["commits"], 1)
+
+        with self.assertRaises(Exception):
+            self.db.execute_query("SELECT * FROM tabla_inexistente", fetch='all')
+        self.assertEqual(self.db.metricas.instantanea()["contadores"]["errores"], 1)
+
+    def test_conexiones_abiertas(self):
+        metricas = Metricas()
+        with Database(self.db.db_path, metricas=metricas) as db:
+            db.consulta("grupos.contar", fetch='one')
+        self.assertEqual(metricas.instantanea()["contadores"]["conexiones_abiertas"], 1)
+
+    def test_traza_muestra_consultas_repetidas(self):
+        servicio = SemilleroService(self.db)
+        with self.db.metricas.traza("Ver semilleros") as traza:
+            self.assertIs(traza_actual(), traza)
+            for semillero_id in range(1, 6):
+                servicio.obtener_por_id(semillero_id)
+        self.assertIsNone(traza_actual())
+
+        self.assertEqual(len(traza.consultas), 5)
+        self.assertEqual(traza.repetidas(), {"semilleros.por_id": 5})
+        self.assertIn("repetida 5 veces: semilleros.por_id", str(traza))
+        self.assertEqual(self.db.metricas.instantanea()["trazas"][-1]["id"], traza.id)
+
+    def test_traza_sigue_a_la_fachada_asincrona(self):
+        async def consultar():
+            async with ServiciosAsincronos(self.db) as servicios:
+                with self.db.metricas.traza("Petición") as traza:
+                    await asyncio.gather(servicios.grupos.obtener_todos(), servicios.semilleros.buscar("algo"))
+                return traza
+
+        traza = asyncio.run(consultar())
+        self.assertEqual({consulta for consulta, _, _ in traza.consultas},
+                         {"cambios.ultimo_de_tabla", "grupos.todos", "semilleros.buscar"})
+
+    def test_registro_de_consultas_lentas(self):
+        registro = io.StringIO()
+        metricas = Metricas(umbral_lenta=0, registro_lentas=registro)
+        with Database(self.db.db_path, metricas=metricas) as db:
+            with metricas.traza("Contar") as traza:
+                db.consulta("grupos.contar", fetch='one')
+
+        entrada = json.loads(registro.getvalue().splitlines()[-1])
+        self.assertEqual(entrada["consulta"], "grupos.contar")
+        self.assertEqual(entrada["traza"], traza.id)
+        self.assertGreater(metricas.instantanea()["contadores"]["consultas_lentas"], 0)
+
+    def test_exportar(self):
+        GrupoService(self.db).obtener_todos()
+
+        ruta = os.path.join(self.directorio.name, "metricas.prom")
+        self.db.metricas.exportar(ruta)
+        with open(ruta, encoding="utf-8") as archivo:
+            texto = archivo.read()
+        self.assertIn('semilleros_consulta_segundos_count{consulta="grupos.todos"} 1', texto)
+        self.assertIn('semilleros_consulta_segundos_bucket{consulta="grupos.todos",le="+Inf"} 1', texto)
+        self.assertIn('semilleros_consulta_filas_total{consulta="grupos.todos"} 8', texto)
+
+        ruta = os.path.join(self.directorio.name, "metricas.json")
+        self.db.metricas.exportar(ruta)
+        with open(ruta, encoding="utf-8") as archivo:
+            self.assertEqual(json.load(archivo)["consultas"]["grupos.todos"]["filas"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
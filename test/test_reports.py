@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+
+from db.database import Database
+from models.entregable import Entregable
+from models.semillero import Semillero
+from services.entregable_service import EntregableService
+from services.grupo_service import GrupoService
+from services.reports import DiferenciaContador, ReporteService
+from services.semillero_service import SemilleroService
+
+
+class TestReporteService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.db.execute_many("INSERT INTO semilleros (nombre, grupo_id, status) VALUES (?, ?, ?)", [
+            ("A", 1, "activo"), ("B", 1, "pendiente"), ("C", 2, "pendiente")
+        ])
+        self.db.execute_many("INSERT INTO investigadores (nombre, tipo, semillero_id) VALUES (?, ?, ?)", [
+            ("E1", "estudiante", 1), ("E2", "estudiante", 1), ("T1", "tutor", 1)
+        ])
+        self.db.execute_many(
+            "INSERT INTO entregables (titulo, tipo, semillero_id, estado) VALUES (?, ?, ?, ?)", [
+                ("X", "Prototipo", 1, "aprobado"), ("Y", "Prototipo", 2, "pendiente"),
+                ("Z", "Working paper", 3, "pendiente")
+            ])
+        self.service = ReporteService(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def test_semilleros_por_grupo(self):
+        reporte = self.service.semilleros_por_grupo()
+        por_grupo = {fila[0]: fila for fila in reporte.filas}
+        self.assertEqual(por_grupo[1][2:], (2, 1, 1))
+        self.assertEqual(por_grupo[2][2:], (1, 0, 1))
+        self.assertEqual(por_grupo[3][2:], (0, 0, 0))
+        self.assertEqual(len(reporte.filas), 8)
+
+    def test_proporcion_activos_pendientes(self):
+        reporte = self.service.proporcion_activos_pendientes()
+        self.assertEqual(reporte.columnas, ["activos", "pendientes", "proporcion"])
+        self.assertEqual(reporte.filas, [(1, 2, 0.5)])
+
+    def test_entregables_por_tipo_y_estado(self):
+        reporte = self.service.entregables_por_tipo_y_estado()
+        self.assertEqual(reporte.filas, [("Prototipo", "aprobado", 1), ("Prototipo", "pendiente", 1),
+                                         ("Working paper", "pendiente", 1)])
+
+    def test_investigadores_por_semillero(self):
+        reporte = self.service.investigadores_por_semillero()
+        self.assertEqual(reporte.filas[0], (1, "A", 2, 1, 3))
+        self.assertEqual(reporte.filas[1], (2, "B", 0, 0, 0))
+
+    def test_cache_se_invalida_al_escribir(self):
+        self.service.semilleros_por_status()
+        self.service.semilleros_por_status()
+        self.assertEqual(self.service.cache.estadisticas()["aciertos"], 1)
+
+        self.db.execute_query("UPDATE semilleros SET status = 'activo' WHERE id = 2")
+        reporte = self.service.semilleros_por_status()
+        self.assertEqual(reporte.filas, [("activo", 2), ("pendiente", 1)])
+        self.assertEqual(self.service.cache.estadisticas()["fallos"], 2)
+
+    def test_cache_ve_escrituras_de_otra_conexion(self):
+        self.assertEqual(self.service.semilleros_por_status().filas, [("activo", 1), ("pendiente", 2)])
+        self.assertEqual(self.service.total_semilleros(status="activo"), 1)
+
+        # Otro Database (como otro proceso) no pasa por los contadores de versión de self.db
+        with Database(self.db.db_path) as otra:
+            otra.execute_query("INSERT INTO semilleros (nombre, grupo_id, status) VALUES ('D', 3, 'activo')")
+
+        self.assertEqual(self.service.semilleros_por_status().filas, [("activo", 2), ("pendiente", 2)])
+        self.assertEqual(self.service.total_semilleros(status="activo"), 2)
+
+    def test_formatear(self):
+        texto = self.service.semilleros_por_status().formatear()
+        self.assertIn("SEMILLEROS POR ESTADO", texto)
+        self.assertIn("activo", texto)
+
+    def test_contadores_siguen_a_los_servicios(self):
+        semilleros = SemilleroService(self.db)
+        entregables = EntregableService(self.db)
+        semillero = Semillero(nombre="Nuevo", objetivo_principal="Objetivo", objetivos_especificos=["Uno"],
+                              grupo_id=2, status="pendiente")
+        semillero.estudiantes = ["Ana", "Luis"]
+        semillero.tutores = ["Marta"]
+        semillero_id, _ = semilleros.crear_semillero(semillero)
+        self.assertEqual(self.service.total_semilleros(grupo_id=2, status="pendiente"), 2)
+
+        semilleros.cambiar_status(semillero_id, "activo")
+        self.assertEqual(self.service.total_semilleros(grupo_id=2, status="pendiente"), 1)
+        self.assertEqual(self.service.total_semilleros(status="activo"), 2)
+        self.assertEqual(self.service.total_semilleros(grupo_id=2), 2)
+        self.assertEqual(self.service.total_semilleros(), 4)
+
+        entregable = Entregable(titulo="W", descripcion="D", tipo="Working paper", semillero_id=semillero_id)
+        entregables.crear_entregable(entregable)
+        entregables.cambiar_estado(entregable.id, "aprobado")
+        self.assertEqual(self.service.total_entregables(tipo="Working paper"), 2)
+        self.assertEqual(self.service.total_entregables(estado="aprobado"), 2)
+        self.assertEqual(self.service.total_entregables(tipo="Working paper", estado="pendiente"), 1)
+
+        self.db.execute_query("DELETE FROM semilleros WHERE grupo_id = 1")
+        self.assertEqual(self.service.total_semilleros(grupo_id=1), 0)
+        self.assertEqual(self.service.verificar_contadores(), [])
+
+    def test_reconstruir_contadores(self):
+        self.assertEqual(self.service.semilleros_por_status().filas, [("activo", 1), ("pendiente", 2)])
+        self.db.execute_query("UPDATE contador_semilleros SET total = 7 WHERE grupo_id = 1 AND status = 'activo'")
+        self.db.execute_query("DELETE FROM contador_entregables WHERE tipo = 'Working paper'")
+
+        esperadas = [
+            DiferenciaContador("contador_semilleros", (1, "activo"), 7, 1),
+            DiferenciaContador("contador_entregables", ("Working paper", "pendiente"), 0, 1),
+        ]
+        self.assertEqual(sorted(self.service.verificar_contadores()), sorted(esperadas))
+        self.assertEqual(self.service.semilleros_por_status().filas, [("activo", 7), ("pendiente", 2)])
+
+        self.assertEqual(sorted(self.service.reconstruir_contadores()), sorted(esperadas))
+        self.assertEqual(self.service.verificar_contadores(), [])
+        self.assertEqual(self.service.semilleros_por_status().filas, [("activo", 1), ("pendiente", 2)])
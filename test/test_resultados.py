@@ -0,0 +1,41 @@
+import unittest
+
+from models.resultados import ConjuntoResultados
+from models.semillero import Semillero, SemilleroResumen
+
+
+class TestConjuntoResultados(unittest.TestCase):
+    def setUp(self):
+        self.conjunto = ConjuntoResultados.desde_filas(
+            SemilleroResumen._fields,
+            [(1, "A", "activo", "Grupo 1"), (2, "B", "pendiente", None)],
+            SemilleroResumen,
+            tipos={"id": "q"}
+        )
+
+    def test_secuencia(self):
+        self.assertEqual(len(self.conjunto), 2)
+        self.assertTrue(self.conjunto)
+        self.assertEqual(self.conjunto[1], SemilleroResumen(2, "B", "pendiente", None))
+        self.assertEqual([r.nombre for r in self.conjunto], ["A", "B"])
+        self.assertEqual(self.conjunto[:1], [SemilleroResumen(1, "A", "activo", "Grupo 1")])
+
+    def test_columna_sin_materializar(self):
+        self.assertEqual(list(self.conjunto.columna("id")), [1, 2])
+
+    def test_vacio(self):
+        self.assertFalse(ConjuntoResultados(["id"], tuple))
+
+
+class TestModelosConSlots(unittest.TestCase):
+    def test_semillero_sin_dict(self):
+        semillero = Semillero(nombre="Test")
+        self.assertFalse(hasattr(semillero, "__dict__"))
+        with self.assertRaises(AttributeError):
+            semillero.atributo_inexistente = 1
+
+    def test_listas_de_investigadores_bajo_demanda(self):
+        semillero = Semillero(nombre="Test")
+        self.assertIsNone(semillero._estudiantes)
+        semillero.estudiantes.append("Ana")
+        self.assertEqual(semillero.estudiantes, ["Ana"])
@@ -1,5 +1,5 @@
 import unittest
-from models.semillero import Semillero
+from models.semillero import Semillero, SemilleroResumen
 
 class TestSemillero(unittest.TestCase):
     def setUp(self):
@@ -35,4 +35,9 @@ class TestSemillero(unittest.TestCase):
         detalles = self.semillero.detalles()
         self.assertIn("NOMBRE: Semillero Test", detalles)
         self.assertIn("ESTADO: PENDIENTE", detalles)
-        self.assertIn("OBJETIVO PRINCIPAL: Objetivo principal de prueba", detalles)
\ No newline at end of file
+        self.assertIn("OBJETIVO PRINCIPAL: Objetivo principal de prueba", detalles)
+
+    def test_resumen_str_igual_al_semillero(self):
+        resumen = SemilleroResumen(1, "Semillero Test", "pendiente", "Grupo Test")
+        self.assertEqual(str(resumen), str(self.semillero))
+        self.assertEqual(resumen.grupo_nombre, "Grupo Test")
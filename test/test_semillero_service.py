@@ -0,0 +1,246 @@
+import os
+import tempfile
+import unittest
+
+from db.database import Database
+from models.semillero import Semillero
+from services.grupo_service import GrupoService
+from services.semillero_service import SemilleroService
+
+
+class TestSemilleroService(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+        self.service = SemilleroService(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _crear(self, nombre, grupo_id=1):
+        semillero = Semillero(
+            nombre=nombre,
+            objetivo_principal="Objetivo principal",
+            objetivos_especificos=["Objetivo 1", "Objetivo 2"],
+            grupo_id=grupo_id
+        )
+        semillero.estudiantes = [{"nombre": f"{nombre} E1", "email": "e1@test.com"},
+                                 {"nombre": f"{nombre} E2", "email": "e2@test.com"}]
+        semillero.tutores = [{"nombre": f"{nombre} T1", "email": "t1@test.com"}]
+        semillero_id, errores = self.service.crear_semillero(semillero)
+        self.assertEqual(errores, [])
+        return semillero_id
+
+    def test_obtener_por_id_carga_investigadores(self):
+        semillero_id = self._crear("Semillero A")
+        semillero = self.service.obtener_por_id(semillero_id)
+        self.assertEqual(semillero.objetivos_especificos, ["Objetivo 1", "Objetivo 2"])
+        self.assertEqual([e.nombre for e in semillero.estudiantes], ["Semillero A E1", "Semillero A E2"])
+        self.assertEqual([t.nombre for t in semillero.tutores], ["Semillero A T1"])
+
+    def test_obtener_todos_asigna_investigadores_a_cada_semillero(self):
+        for nombre in ("C", "A", "B"):
+            self._crear(nombre)
+        semilleros = self.service.obtener_todos()
+        self.assertEqual([s.nombre for s in semilleros], ["A", "B", "C"])
+        for semillero in semilleros:
+            self.assertEqual(len(semillero.estudiantes), 2)
+            self.assertTrue(all(e.nombre.startswith(semillero.nombre) for e in semillero.estudiantes))
+            self.assertEqual(len(semillero.tutores), 1)
+
+    def test_carga_por_lotes_con_muchos_semilleros(self):
+        self.service.TAMANO_LOTE = 2
+        for i in range(5):
+            self._crear(f"S{i}")
+        semilleros = self.service.obtener_todos()
+        self.assertTrue(all(len(s.estudiantes) == 2 for s in semilleros))
+        self.assertTrue(all(s.objetivos_especificos == ["Objetivo 1", "Objetivo 2"] for s in semilleros))
+
+    def test_carga_por_lotes_igual_que_por_semillero(self):
+        # 1001 semilleros: dos lotes completos de 500 IDs y uno de un solo ID
+        n = 2 * SemilleroService.TAMANO_LOTE + 1
+        self.db.execute_many("INSERT INTO semilleros (id, nombre, grupo_id) VALUES (?, ?, 1)",
+                             [(i, f"S{i:04d}") for i in range(1, n + 1)])
+        # Entre 0 y 3 investigadores por semillero, insertados en orden distinto al de la consulta
+        self.db.execute_many("INSERT INTO investigadores (nombre, tipo, email, semillero_id) VALUES (?, ?, ?, ?)",
+                             [(f"P{j}-{i}", "tutor" if j == 0 else "estudiante", f"p{j}.{i}@test.com", i)
+                              for i in range(n, 0, -1) for j in reversed(range(i % 4))])
+
+        with self.db.metricas.traza("lotes") as traza:
+            semilleros = self.service.obtener_todos(prefetch=["investigadores"])
+        self.assertEqual(sum("FROM investigadores" in consulta for consulta, _, _ in traza.consultas), 3)
+
+        def datos(personas):
+            return [(p.id, p.nombre, p.tipo, p.email, p.semillero_id) for p in personas]
+
+        self.assertEqual(len(semilleros), n)
+        for semillero in semilleros:
+            # Lo que cargaba la consulta por semillero anterior a la carga por lotes
+            filas = self.db.execute_query("SELECT id, nombre, tipo, email, semillero_id FROM investigadores "
+                                          "WHERE semillero_id = ? ORDER BY tipo, nombre", (semillero.id,),
+                                          fetch='all')
+            self.assertEqual(datos(semillero.estudiantes), [tuple(f) for f in filas if f['tipo'] == "estudiante"])
+            self.assertEqual(datos(semillero.tutores), [tuple(f) for f in filas if f['tipo'] == "tutor"])
+
+    def test_obtener_por_grupo(self):
+        self._crear("Grupo 1", grupo_id=1)
+        self._crear("Grupo 2 B", grupo_id=2)
+        self._crear("Grupo 2 A", grupo_id=2)
+        semilleros = self.service.obtener_por_grupo(2)
+        self.assertEqual([s.nombre for s in semilleros], ["Grupo 2 A", "Grupo 2 B"])
+
+        # Como obtener_todos: los investigadores se cargan al primer acceso, para todo el grupo a la vez
+        with self.db.metricas.traza("grupo") as traza:
+            self.assertEqual([e.nombre for e in semilleros[1].estudiantes], ["Grupo 2 B E1", "Grupo 2 B E2"])
+            self.assertEqual([t.nombre for t in semilleros[0].tutores], ["Grupo 2 A T1"])
+        self.assertEqual(len(traza.consultas), 1)
+
+    def test_listar_resumen(self):
+        self._crear("B", grupo_id=2)
+        self._crear("A", grupo_id=1)
+        resumen = self.service.listar_resumen()
+        self.assertEqual([r.nombre for r in resumen], ["A", "B"])
+        self.assertEqual(resumen[0].grupo_nombre, "ENTREPRENEURSHIP GROUP")
+        self.assertEqual(len(self.service.listar_resumen(grupo_id=2)), 1)
+
+    def test_listar_pagina_recorre_en_ambas_direcciones(self):
+        # Nombres repetidos: el id desempata dentro del cursor
+        for nombre in ("B", "A", "C", "B", "D", "E", "A"):
+            self._crear(nombre, grupo_id=2 if nombre == "C" else 1)
+
+        paginas = []
+        pagina = self.service.listar_pagina(tamano=3)
+        self.assertIsNone(pagina.anterior)
+        while True:
+            paginas.append([(s.nombre, s.id) for s in pagina.elementos])
+            if not pagina.siguiente:
+                break
+            pagina = self.service.listar_pagina(tamano=3, despues=pagina.siguiente)
+
+        todos = [(s.nombre, s.id) for s in self.service.listar_resumen()]
+        self.assertEqual([len(p) for p in paginas], [3, 3, 1])
+        self.assertEqual(sum(paginas, []), sorted(todos))
+
+        anterior = self.service.listar_pagina(tamano=3, antes=pagina.anterior)
+        self.assertEqual([(s.nombre, s.id) for s in anterior.elementos], paginas[1])
+        self.assertIsNotNone(anterior.anterior)
+        self.assertIsNotNone(anterior.siguiente)
+
+        primera = self.service.listar_pagina(tamano=3, antes=anterior.anterior)
+        self.assertEqual([(s.nombre, s.id) for s in primera.elementos], paginas[0])
+        self.assertIsNone(primera.anterior)
+
+        del_grupo = self.service.listar_pagina(grupo_id=2)
+        self.assertEqual([s.nombre for s in del_grupo.elementos], ["C"])
+        self.assertIsNone(del_grupo.siguiente)
+        self.assertEqual(self.service.listar_pagina(status="activo").elementos, [])
+
+    def test_buscar_por_nombre_objetivos_e_investigadores(self):
+        robotica = self._crear("Robótica Educativa")
+        datos = self._crear("Ciencia de Datos")
+
+        self.assertEqual([s.id for s in self.service.buscar("robotica")], [robotica])
+        self.assertEqual([s.id for s in self.service.buscar("Robót educ")], [robotica])
+        self.assertEqual([s.id for s in self.service.buscar("Ciencia de Datos T1")], [datos])
+        self.assertEqual({s.id for s in self.service.buscar("objetivo 2")}, {robotica, datos})
+        self.assertEqual(self.service.buscar("inexistente"), [])
+        self.assertEqual(self.service.buscar('"*'), [])
+
+    def test_buscar_sigue_los_cambios(self):
+        semillero_id = self._crear("Semillero A")
+        self.db.execute_query("UPDATE semilleros SET nombre = ? WHERE id = ?", ("Bioinformática", semillero_id))
+        self.assertEqual([s.id for s in self.service.buscar("bioinformatica")], [semillero_id])
+
+        self.db.execute_query("INSERT INTO investigadores (nombre, tipo, email, semillero_id) VALUES (?, ?, ?, ?)",
+                              ("Zoe Quintero", "estudiante", "zoe@test.com", semillero_id))
+        self.assertEqual([s.id for s in self.service.buscar("quinter")], [semillero_id])
+
+        self.db.execute_query("DELETE FROM investigadores WHERE nombre = ?", ("Zoe Quintero",))
+        self.assertEqual(self.service.buscar("quinter"), [])
+
+        self.db.execute_query("DELETE FROM semilleros WHERE id = ?", (semillero_id,))
+        self.assertEqual(self.service.buscar("bioinformatica"), [])
+
+    def test_objetivos_se_cargan_al_primer_acceso(self):
+        for nombre in ("A", "B"):
+            self._crear(nombre)
+        semilleros = self.service.obtener_todos()
+        self.assertFalse(any(s.relacion_cargada("objetivos") for s in semilleros))
+
+        self.assertEqual(semilleros[0].objetivos_especificos, ["Objetivo 1", "Objetivo 2"])
+        self.assertTrue(all(s.relacion_cargada("objetivos") for s in semilleros))
+        self.assertEqual(semilleros[1].objetivos_especificos, ["Objetivo 1", "Objetivo 2"])
+
+        self.assertEqual([s.id for s in self.service.buscar("objetivo 2")], [s.id for s in semilleros])
+
+    def test_crear_semillero_es_atomico(self):
+        semillero = Semillero(nombre="Atómico", objetivo_principal="Objetivo",
+                              objetivos_especificos=["Objetivo 1"], grupo_id=1)
+        # Un tutor sin nombre viola el NOT NULL de investigadores y debe deshacer todo
+        semillero.estudiantes = ["E1", "E2"]
+        semillero.tutores = [{"nombre": None}]
+        with self.assertRaises(Exception):
+            self.service.crear_semillero(semillero)
+        self.assertEqual(len(self.service.listar_resumen()), 0)
+        total = self.db.execute_query("SELECT COUNT(*) FROM investigadores", fetch='one')[0]
+        self.assertEqual(total, 0)
+
+    def test_database_crear_semillero_usa_el_servicio(self):
+        semillero = Semillero(nombre="Desde Database", objetivo_principal="Objetivo",
+                              objetivos_especificos=["Objetivo 1"], grupo_id=1)
+        semillero.estudiantes = ["E1", "E2"]
+        semillero.tutores = ["T1"]
+        semillero_id, errores = self.db.crear_semillero(semillero)
+        self.assertEqual(errores, [])
+        self.assertEqual(len(self.service.obtener_por_id(semillero_id).estudiantes), 2)
+
+    def test_relaciones_se_cargan_al_primer_acceso(self):
+        for nombre in ("A", "B"):
+            self._crear(nombre)
+        semilleros = self.service.obtener_todos()
+        self.assertFalse(any(s.relacion_cargada("investigadores") for s in semilleros))
+
+        # Acceder a un semillero carga los investigadores de todo el resultado
+        self.assertEqual(len(semilleros[0].estudiantes), 2)
+        self.assertTrue(all(s.relacion_cargada("investigadores") for s in semilleros))
+        self.assertFalse(semilleros[0].relacion_cargada("grupo"))
+
+    def test_prefetch(self):
+        semillero_id = self._crear("A")
+        self.db.execute_query(
+            "INSERT INTO entregables (titulo, descripcion, tipo, semillero_id) VALUES (?, ?, ?, ?)",
+            ("Título", "Descripción", "Prototipo", semillero_id))
+
+        semillero = self.service.obtener_por_id(semillero_id, prefetch=SemilleroService.RELACIONES)
+
+        for relacion in SemilleroService.RELACIONES:
+            self.assertTrue(semillero.relacion_cargada(relacion))
+        self.assertEqual(semillero.grupo.nombre, "ENTREPRENEURSHIP GROUP")
+        self.assertEqual(semillero.entregable.titulo, "Título")
+        with self.assertRaises(ValueError):
+            self.service.obtener_todos(prefetch=["desconocida"])
+
+    def test_prefetch_de_grupo_consulta_la_cache_una_vez(self):
+        self.db.execute_many("INSERT INTO semilleros (nombre, grupo_id) VALUES (?, ?)",
+                             [(f"S{i}", i % 8 + 1) for i in range(50)])
+
+        semilleros = self.service.obtener_todos(prefetch=["grupo"])
+        self.assertEqual([s.grupo.id for s in semilleros], [s.grupo_id for s in semilleros])
+        estadisticas = self.service.grupo_service.estadisticas_cache()
+        self.assertEqual(estadisticas["aciertos"] + estadisticas["fallos"], 1)
+
+    def test_mapa_de_identidad_de_investigadores(self):
+        semillero_id = self._crear("A")
+        primero = self.service.obtener_por_id(semillero_id)
+        segundo = self.service.obtener_por_id(semillero_id)
+        self.assertIs(primero.tutores[0], segundo.tutores[0])
+
+    def test_cambiar_status(self):
+        semillero_id = self._crear("Semillero")
+        self.assertTrue(self.service.cambiar_status(semillero_id, "activo"))
+        self.assertFalse(self.service.cambiar_status(semillero_id, "otro"))
+        self.assertTrue(self.service.cambiar_status(semillero_id, "activo"))  # ya lo tenía
+        self.assertFalse(self.service.cambiar_status(999, "activo"))
+        self.assertEqual(self.service.obtener_por_id(semillero_id).status, "activo")
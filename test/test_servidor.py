@@ -0,0 +1,204 @@
+import gzip
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from api.servidor import ServidorApi
+from db.database import Database
+from services.grupo_service import GrupoService
+
+
+class TestServidorApi(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.directorio.name, "test.db"))
+        GrupoService(self.db).cargar_datos_iniciales()
+
+        self.servidor = ServidorApi(("127.0.0.1", 0), self.db, registrar=False)
+        self.hilo = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        self.hilo.start()
+        self.conexion = http.client.HTTPConnection("127.0.0.1", self.servidor.server_port, timeout=10)
+
+    def tearDown(self):
+        self.conexion.close()
+        self.servidor.shutdown()
+        self.servidor.server_close()
+        self.db.close()
+        self.directorio.cleanup()
+
+    def _pedir(self, metodo, ruta, datos=None, cabeceras=None):
+        cuerpo = json.dumps(datos).encode("utf-8") if datos is not None else None
+        self.conexion.request(metodo, ruta, body=cuerpo, headers=cabeceras or {})
+        respuesta = self.conexion.getresponse()
+        contenido = respuesta.read()
+        if respuesta.getheader("Content-Encoding") == "gzip":
+            contenido = gzip.decompress(contenido)
+        return respuesta, json.loads(contenido) if contenido else None
+
+    def _crear_semillero(self, nombre="Semillero API", grupo_id=1):
+        return self._pedir("POST", "/semilleros", {
+            "nombre": nombre,
+            "objetivo_principal": "Objetivo",
+            "objetivos_especificos": ["Uno", "Dos"],
+            "grupo_id": grupo_id,
+            "estudiantes": [{"nombre": "Ana", "email": "ana@test.com"}, {"nombre": "Luis", "email": ""}],
+            "tutores": [{"nombre": "Marta", "email": "marta@test.com"}],
+        })
+
+    def test_etag_y_respuesta_condicional(self):
+        respuesta, grupos = self._pedir("GET", "/grupos")
+        self.assertEqual(respuesta.status, 200)
+        self.assertEqual(len(grupos), 8)
+        etag = respuesta.getheader("ETag")
+        self.assertIsNotNone(respuesta.getheader("Last-Modified"))
+
+        respuesta, cuerpo = self._pedir("GET", "/grupos", cabeceras={"If-None-Match": etag})
+        self.assertEqual(respuesta.status, 304)
+        self.assertIsNone(cuerpo)
+
+        respuesta, _ = self._pedir("GET", "/grupos",
+                                   cabeceras={"If-Modified-Since": respuesta.getheader("Last-Modified")})
+        self.assertEqual(respuesta.status, 304)
+
+        # Una escritura cambia la versión de la tabla y con ella el ETag
+        self.db.execute_query("UPDATE grupos_investigacion SET director = 'Otro' WHERE id = 1")
+        respuesta, _ = self._pedir("GET", "/grupos", cabeceras={"If-None-Match": etag})
+        self.assertEqual(respuesta.status, 200)
+        self.assertNotEqual(respuesta.getheader("ETag"), etag)
+
+    def test_cache_ve_escrituras_de_otro_proceso(self):
+        respuesta, _ = self._pedir("GET", "/grupos/1")
+        etag = respuesta.getheader("ETag")
+
+        # Como el menú u otro proceso: otra conexión que no pasa por este Database
+        with Database(self.db.db_path) as otra:
+            otra.execute_query("UPDATE grupos_investigacion SET director = 'Otra persona' WHERE id = 1")
+
+        respuesta, grupo = self._pedir("GET", "/grupos/1", cabeceras={"If-None-Match": etag})
+        self.assertEqual(respuesta.status, 200)
+        self.assertEqual(grupo["director"], "Otra persona")
+
+    def test_gzip_para_listados_grandes(self):
+        respuesta, grupos = self._pedir("GET", "/grupos", cabeceras={"Accept-Encoding": "gzip"})
+        self.assertEqual(respuesta.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(len(grupos), 8)
+
+        respuesta, _ = self._pedir("GET", "/grupos/1", cabeceras={"Accept-Encoding": "gzip"})
+        self.assertIsNone(respuesta.getheader("Content-Encoding"))
+
+    def test_crear_y_consultar_semillero(self):
+        respuesta, creado = self._crear_semillero()
+        self.assertEqual(respuesta.status, 201)
+
+        respuesta, semillero = self._pedir("GET", f"/semilleros/{creado['id']}")
+        self.assertEqual(semillero["objetivos_especificos"], ["Uno", "Dos"])
+        self.assertEqual([e["nombre"] for e in semillero["estudiantes"]], ["Ana", "Luis"])
+        self.assertEqual(semillero["grupo"]["id"], 1)
+
+        respuesta, _ = self._pedir("PATCH", f"/semilleros/{creado['id']}", {"status": "activo"})
+        self.assertEqual(respuesta.status, 200)
+        _, semillero = self._pedir("GET", f"/semilleros/{creado['id']}")
+        self.assertEqual(semillero["status"], "activo")
+
+        entregable = {"titulo": "Artículo", "descripcion": "Resultados", "tipo": "Prototipo"}
+        respuesta, _ = self._pedir("POST", f"/semilleros/{creado['id']}/entregable", entregable)
+        self.assertEqual(respuesta.status, 201)
+        respuesta, error = self._pedir("POST", f"/semilleros/{creado['id']}/entregable", entregable)
+        self.assertEqual(respuesta.status, 409)
+
+        _, encontrados = self._pedir("GET", "/semilleros?q=marta")
+        self.assertEqual([s["id"] for s in encontrados], [creado["id"]])
+
+    def test_paginacion_con_cursor(self):
+        for i in range(5):
+            self._crear_semillero(f"Semillero {i}")
+
+        _, pagina = self._pedir("GET", "/semilleros?tamano=3")
+        self.assertEqual([s["nombre"] for s in pagina["elementos"]], ["Semillero 0", "Semillero 1", "Semillero 2"])
+        _, pagina = self._pedir("GET", f"/semilleros?tamano=3&despues={pagina['siguiente']}")
+        self.assertEqual([s["nombre"] for s in pagina["elementos"]], ["Semillero 3", "Semillero 4"])
+        self.assertIsNone(pagina["siguiente"])
+
+        respuesta, _ = self._pedir("GET", "/semilleros?despues=no-es-un-cursor")
+        self.assertEqual(respuesta.status, 400)
+
+    def test_metricas_y_traza(self):
+        respuesta, _ = self._pedir("GET", "/grupos")
+        traza = respuesta.getheader("X-Traza")
+        self.assertTrue(traza)
+        self.assertIn(traza, [t["id"] for t in self.db.metricas.instantanea()["trazas"]])
+
+        self.conexion.request("GET", "/metricas")
+        respuesta = self.conexion.getresponse()
+        texto = respuesta.read().decode("utf-8")
+        self.assertTrue(respuesta.getheader("Content-Type").startswith("text/plain"))
+        self.assertIn('semilleros_consulta_segundos_count{consulta="grupos.todos"}', texto)
+
+        _, datos = self._pedir("GET", "/metricas?formato=json")
+        self.assertIn("grupos.todos", datos["consultas"])
+
+    def test_registro_de_cambios(self):
+        _, inicial = self._pedir("GET", "/cambios?limite=1")
+        self.assertEqual(len(inicial["cambios"]), 1)
+
+        _, todos = self._pedir("GET", f"/cambios?desde={inicial['siguiente']}&limite=10000")
+        _, creado = self._crear_semillero()
+        _, nuevos = self._pedir("GET", f"/cambios?desde={todos['siguiente']}")
+        self.assertIn({"id": creado["id"]}, [c["clave"] for c in nuevos["cambios"] if c["tabla"] == "semilleros"])
+
+        _, vacio = self._pedir("GET", f"/cambios?desde={nuevos['siguiente']}")
+        self.assertEqual((vacio["cambios"], vacio["siguiente"]), ([], nuevos["siguiente"]))
+
+    def test_actividad_por_usuario(self):
+        _, creado = self._crear_semillero()
+        self._pedir("PATCH", f"/semilleros/{creado['id']}", {"status": "activo"}, {"X-Usuario": "coordinador"})
+
+        _, actividades = self._pedir("GET", f"/actividad?semillero_id={creado['id']}")
+        self.assertEqual([(a["accion"], a["actor"]) for a in actividades],
+                         [("cambiar_status", "coordinador"), ("crear_semillero", "api:127.0.0.1")])
+
+        _, actividades = self._pedir("GET", "/actividad?actor=coordinador")
+        self.assertEqual(actividades[0]["detalle"], {"status": "activo"})
+
+    def test_cola_y_cambio_de_estado_por_lotes(self):
+        entregable = {"titulo": "Artículo", "descripcion": "Resultados", "tipo": "Prototipo"}
+        for i in range(3):
+            _, creado = self._crear_semillero(f"Semillero {i}")
+            self._pedir("POST", f"/semilleros/{creado['id']}/entregable",
+                        dict(entregable, fecha_entrega=f"2024-0{3 - i}-01"))
+
+        _, pagina = self._pedir("GET", "/entregables/pendientes?tamano=2")
+        self.assertEqual([e["semillero_nombre"] for e in pagina["elementos"]], ["Semillero 2", "Semillero 1"])
+        _, pagina = self._pedir("GET", f"/entregables/pendientes?tamano=2&despues={pagina['siguiente']}")
+        self.assertEqual([e["semillero_nombre"] for e in pagina["elementos"]], ["Semillero 0"])
+
+        respuesta, resultado = self._pedir("POST", "/entregables/estado",
+                                           {"estado": "aprobado", "entregado_hasta": "2024-02-01"})
+        self.assertEqual(resultado["cambiados"], 2)
+        _, pagina = self._pedir("GET", "/entregables/pendientes")
+        self.assertEqual(len(pagina["elementos"]), 1)
+
+        respuesta, _ = self._pedir("POST", "/entregables/estado", {"estado": "archivado"})
+        self.assertEqual(respuesta.status, 422)
+
+    def test_errores(self):
+        respuesta, error = self._crear_semillero(grupo_id=99)
+        self.assertEqual(respuesta.status, 422)
+        self.assertEqual(error["errores"], ["El grupo con ID 99 no existe"])
+
+        respuesta, error = self._pedir("POST", "/semilleros", {"nombre": "Incompleto"})
+        self.assertEqual(respuesta.status, 422)
+        self.assertIn("Debe tener al menos dos estudiantes", error["errores"])
+
+        self.assertEqual(self._pedir("GET", "/semilleros/999")[0].status, 404)
+        self.assertEqual(self._pedir("PATCH", "/semilleros/999", {"status": "activo"})[0].status, 404)
+        self.assertEqual(self._pedir("PATCH", "/semilleros/999", {"status": "otro"})[0].status, 422)
+        self.assertEqual(self._pedir("GET", "/inexistente")[0].status, 404)
+        self.assertEqual(self._pedir("GET", "/grupos/abc")[0].status, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 from ui.prompts import (
     mostrar_lista_grupos, mostrar_detalles_grupo, solicitar_id_grupo,
     mostrar_lista_semilleros, mostrar_detalles_semillero, solicitar_id_semillero,
-    solicitar_datos_semillero
+    solicitar_datos_semillero, mostrar_cola_entregables, solicitar_ids
 )
 from models.semillero import Semillero
 from models.entregable import Entregable
@@ -10,10 +10,27 @@ from models.entregable import Entregable
 class Menu:
     """Menú principal de la aplicación"""
 
-    def __init__(self, grupo_service, semillero_service, entregable_service):
+    def __init__(self, grupo_service, semillero_service, entregable_service, reporte_service=None, metricas=None):
+        """
+        Args:
+            metricas (Metricas, optional): Si se indica, cada acción se ejecuta en una
+                traza y al terminar se muestran las consultas que lanzó
+        """
         self.grupo_service = grupo_service
         self.semillero_service = semillero_service
         self.entregable_service = entregable_service
+        self.reporte_service = reporte_service
+        self.metricas = metricas
+
+    def _accion(self, nombre, accion):
+        """Ejecuta una acción del menú, trazando sus consultas si hay métricas"""
+        if self.metricas is None:
+            accion()
+            return
+
+        with self.metricas.traza(nombre) as traza:
+            accion()
+        print(f"\n{traza}")
 
     def mostrar_menu(self):
         """Muestra el menú principal de la aplicación"""
@@ -21,6 +38,8 @@ class Menu:
             print("\n==== SISTEMA DE GESTIÓN DE GRUPOS DE INVESTIGACIÓN ====")
             print("1. Gestionar Grupos de Investigación")
             print("2. Gestionar Semilleros de Investigación")
+            if self.reporte_service:
+                print("3. Ver reportes")
             print("0. Salir")
             print("=" * 56)
 
@@ -30,6 +49,8 @@ class Menu:
                 self._menu_grupos()
             elif opcion == "2":
                 self._menu_semilleros()
+            elif opcion == "3" and self.reporte_service:
+                self._accion("Ver reportes", self._ver_reportes)
             elif opcion == "0":
                 print("Gracias por usar el sistema. ¡Hasta pronto!")
                 break
@@ -49,11 +70,11 @@ class Menu:
             opcion = input("Seleccione una opción: ")
 
             if opcion == "1":
-                self._listar_grupos()
+                self._accion("Listar grupos", self._listar_grupos)
             elif opcion == "2":
-                self._ver_detalles_grupo()
+                self._accion("Ver detalles de un grupo", self._ver_detalles_grupo)
             elif opcion == "3":
-                self._ver_semilleros_grupo()
+                self._accion("Ver semilleros de un grupo", self._ver_semilleros_grupo)
             elif opcion == "0":
                 break
             else:
@@ -68,35 +89,45 @@ class Menu:
             print("3. Buscar semillero")
             print("4. Asignar entregable a semillero")
             print("5. Ver entregable de semillero")
+            print("6. Revisar entregables pendientes")
+            print("7. Ver actividad de un semillero")
             print("0. Volver al menú principal")
             print("=" * 45)
 
             opcion = input("Seleccione una opción: ")
 
             if opcion == "1":
-                self._crear_semillero()
+                self._accion("Crear semillero", self._crear_semillero)
             elif opcion == "2":
-                self._listar_semilleros()
+                self._accion("Ver todos los semilleros", self._listar_semilleros)
             elif opcion == "3":
-                self._ver_detalles_semillero()
+                self._accion("Buscar semillero", self._buscar_semillero)
             elif opcion == "4":
-                self._asignar_entregable()
+                self._accion("Asignar entregable", self._asignar_entregable)
             elif opcion == "5":
-                self._ver_entregable_semillero()
+                self._accion("Ver entregable de semillero", self._ver_entregable_semillero)
+            elif opcion == "6":
+                self._accion("Revisar entregables pendientes", self._revisar_entregables)
+            elif opcion == "7":
+                self._accion("Ver actividad de un semillero", self._ver_actividad_semillero)
             elif opcion == "0":
                 break
             else:
                 print("Opción no válida. Intente de nuevo.")
 
+    def _ver_reportes(self):
+        """Muestra los reportes agregados de grupos, semilleros y entregables"""
+        for reporte in self.reporte_service.reportes_estandar():
+            print("\n" + reporte.formatear())
+        input("\nPresione Enter para continuar...")
+
     def _listar_grupos(self):
         """Muestra la lista de todos los grupos disponibles"""
-        grupos = self.grupo_service.obtener_todos()
-        mostrar_lista_grupos(grupos)
+        mostrar_lista_grupos(self.grupo_service.listar_pagina)
 
     def _ver_detalles_grupo(self):
         """Permite seleccionar y ver los detalles de un grupo"""
-        grupos = self.grupo_service.obtener_todos()
-        if mostrar_lista_grupos(grupos):
+        if mostrar_lista_grupos(self.grupo_service.listar_pagina):
             grupo_id = solicitar_id_grupo()
             if grupo_id is not None:
                 grupo = self.grupo_service.obtener_por_id(grupo_id)
@@ -104,53 +135,49 @@ class Menu:
 
     def _ver_semilleros_grupo(self):
         """Muestra los semilleros asociados a un grupo"""
-        grupos = self.grupo_service.obtener_todos()
-        if mostrar_lista_grupos(grupos):
+        if mostrar_lista_grupos(self.grupo_service.listar_pagina):
             grupo_id = solicitar_id_grupo()
             if grupo_id is not None:
-                semilleros = self.semillero_service.obtener_por_grupo(grupo_id)
-                if not mostrar_lista_semilleros(semilleros):
+                def pagina_grupo(despues=None, antes=None):
+                    return self.semillero_service.listar_pagina(despues=despues, antes=antes, grupo_id=grupo_id)
+
+                if not mostrar_lista_semilleros(pagina_grupo):
                     print(f"El grupo seleccionado no tiene semilleros asociados.")
 
     def _listar_semilleros(self):
         """Muestra la lista de todos los semilleros disponibles (activos y pendientes)"""
-        # Obtener todos los semilleros
-        semilleros = self.semillero_service.obtener_todos()
+        # Cada página se obtiene con el nombre de su grupo en una sola consulta
+        return mostrar_lista_semilleros(self.semillero_service.listar_pagina, mostrar_grupo=True)
 
-        if not semilleros:
-            print("\nNo hay semilleros registrados en el sistema.")
-            input("\nPresione Enter para continuar...")
-            return False
-
-        # Filtrar semilleros activos y pendientes
-        semilleros_validos = [s for s in semilleros if s.status in ["activo", "pendiente"]]
-
-        if not semilleros_validos:
-            print("\nNo hay semilleros activos o pendientes en el sistema.")
-            input("\nPresione Enter para continuar...")
-            return False
+    def _ver_detalles_semillero(self):
+        """Permite seleccionar y ver los detalles de un semillero"""
+        if mostrar_lista_semilleros(self.semillero_service.listar_pagina):
+            semillero_id = solicitar_id_semillero()
+            if semillero_id is not None:
+                semillero = self.semillero_service.obtener_por_id(semillero_id)
+                mostrar_detalles_semillero(semillero)
 
-        print("\n=== LISTA DE SEMILLEROS ===")
-        print(f"{'ID':<5} {'NOMBRE':<30} {'ESTADO':<10} {'GRUPO':<20}")
-        print("-" * 70)
+    def _buscar_semillero(self):
+        """Busca semilleros por texto y muestra los detalles del elegido
 
-        for semillero in semilleros_validos:
-            # Obtener nombre del grupo asociado
-            grupo = self.grupo_service.obtener_por_id(semillero.grupo_id)
-            grupo_nombre = grupo.nombre if grupo else "Grupo no encontrado"
+        Sin texto de búsqueda se recorre el listado completo página a página.
+        """
+        texto = input("\nBuscar (nombre, objetivo, estudiante o tutor; Enter para ver todos): ").strip()
+        if not texto:
+            self._ver_detalles_semillero()
+            return
 
-            estado = semillero.status.upper()
-            print(f"{semillero.id:<5} {semillero.nombre:<30} {estado:<10} {grupo_nombre:<20}")
+        semilleros = self.semillero_service.buscar(texto)
+        if not semilleros:
+            print(f"\nNo se encontraron semilleros para '{texto}'.")
+            input("\nPresione Enter para continuar...")
+            return
 
-        print("-" * 70)
-        print(f"Total de semilleros: {len(semilleros_validos)}")
-        input("\nPresione Enter para continuar...")
-        return True
+        if len(semilleros) == 1:
+            mostrar_detalles_semillero(self.semillero_service.obtener_por_id(semilleros[0].id))
+            return
 
-    def _ver_detalles_semillero(self):
-        """Permite seleccionar y ver los detalles de un semillero"""
-        semilleros = self.semillero_service.obtener_todos()
-        if mostrar_lista_semilleros(semilleros):
+        if mostrar_lista_semilleros(semilleros, mostrar_grupo=True):
             semillero_id = solicitar_id_semillero()
             if semillero_id is not None:
                 semillero = self.semillero_service.obtener_por_id(semillero_id)
@@ -214,8 +241,7 @@ class Menu:
 
     def _cambiar_estado_semillero(self):
         """Permite cambiar el estado de un semillero"""
-        semilleros = self.semillero_service.obtener_todos()
-        if mostrar_lista_semilleros(semilleros):
+        if mostrar_lista_semilleros(self.semillero_service.listar_pagina):
             semillero_id = solicitar_id_semillero()
             if semillero_id is None:
                 return
@@ -237,31 +263,33 @@ class Menu:
                 else:
                     print("Error al actualizar el estado del semillero")
 
-    def _asignar_entregable(self):
-        """Asigna un entregable a un semillero"""
-        semilleros = self.semillero_service.obtener_todos()
+    def _seleccionar_semillero(self):
+        """Muestra los semilleros página a página y pide el ID de uno de ellos
 
-        if not semilleros:
-            print("\nNo hay semilleros registrados.")
-            input("\nPresione Enter para continuar...")
-            return
+        Returns:
+            Semillero: El semillero elegido o None si no hay o el ID no es válido
+        """
+        if not mostrar_lista_semilleros(self.semillero_service.listar_pagina):
+            return None
 
-        print("\n--- SEMILLEROS DISPONIBLES ---")
-        for i, semillero in enumerate(semilleros, 1):
-            print(f"{i}. {semillero}")
+        semillero_id = solicitar_id_semillero()
+        if semillero_id is None:
+            input("\nPresione Enter para continuar...")
+            return None
 
-        try:
-            opcion = int(input("\nSeleccione un semillero: ")) - 1
-            if opcion < 0 or opcion >= len(semilleros):
-                print("\nOpción inválida.")
-                input("\nPresione Enter para continuar...")
-                return
-        except ValueError:
-            print("\nOpción inválida.")
+        semillero = self.semillero_service.obtener_por_id(semillero_id)
+        if not semillero:
+            print("\nSemillero no encontrado.")
             input("\nPresione Enter para continuar...")
-            return
+            return None
 
-        semillero_seleccionado = semilleros[opcion]
+        return semillero
+
+    def _asignar_entregable(self):
+        """Asigna un entregable a un semillero"""
+        semillero_seleccionado = self._seleccionar_semillero()
+        if not semillero_seleccionado:
+            return
 
         # Verificar si ya tiene un entregable
         entregable_existente = self.entregable_service.obtener_por_semillero(semillero_seleccionado.id)
@@ -318,30 +346,10 @@ class Menu:
 
     def _ver_entregable_semillero(self):
         """Muestra el entregable asociado a un semillero"""
-        semilleros = self.semillero_service.obtener_todos()
-
-        if not semilleros:
-            print("\nNo hay semilleros registrados.")
-            input("\nPresione Enter para continuar...")
+        semillero_seleccionado = self._seleccionar_semillero()
+        if not semillero_seleccionado:
             return
 
-        print("\n--- SEMILLEROS DISPONIBLES ---")
-        for i, semillero in enumerate(semilleros, 1):
-            print(f"{i}. {semillero}")
-
-        try:
-            opcion = int(input("\nSeleccione un semillero: ")) - 1
-            if opcion < 0 or opcion >= len(semilleros):
-                print("\nOpción inválida.")
-                input("\nPresione Enter para continuar...")
-                return
-        except ValueError:
-            print("\nOpción inválida.")
-            input("\nPresione Enter para continuar...")
-            return
-
-        semillero_seleccionado = semilleros[opcion]
-
         # Obtener entregable
         entregable = self.entregable_service.obtener_por_semillero(semillero_seleccionado.id)
 
@@ -376,3 +384,35 @@ class Menu:
                     print("\nOpción inválida.")
 
         input("\nPresione Enter para continuar...")
+
+    def _revisar_entregables(self):
+        """Recorre la cola de entregables pendientes y aprueba o rechaza varios a la vez"""
+        def pagina(despues=None, antes=None):
+            return self.entregable_service.cola_revision(despues=despues)
+
+        if not mostrar_cola_entregables(pagina):
+            input("\nPresione Enter para continuar...")
+            return
+
+        for nuevo_estado, accion in (("aprobado", "aprobar"), ("rechazado", "rechazar")):
+            ids = solicitar_ids(accion)
+            if ids:
+                cambiados = self.entregable_service.cambiar_estado_lote(nuevo_estado, ids=ids)
+                print(f"{cambiados} entregables {nuevo_estado}s.")
+
+        input("\nPresione Enter para continuar...")
+
+    def _ver_actividad_semillero(self):
+        """Muestra quién creó un semillero y los cambios de estado del semillero y su entregable"""
+        semillero_seleccionado = self._seleccionar_semillero()
+        if not semillero_seleccionado:
+            return
+
+        actividades = self.semillero_service.actividad_service.por_semillero(semillero_seleccionado.id)
+        print(f"\n--- ACTIVIDAD DEL SEMILLERO: {semillero_seleccionado.nombre} ---")
+        if not actividades:
+            print("No hay actividad registrada.")
+        for actividad in actividades:
+            print(actividad)
+
+        input("\nPresione Enter para continuar...")
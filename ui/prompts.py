@@ -1,13 +1,73 @@
+def _navegar_paginas(obtener_pagina, mostrar_pagina, esperar=False):
+    """Muestra un listado paginado y permite avanzar o retroceder entre páginas
+
+    Args:
+        obtener_pagina (callable): Recibe despues= o antes= y devuelve una Pagina
+        mostrar_pagina (callable): Imprime los elementos de una página y su número
+        esperar (bool): Pedir Enter al terminar si el listado cabe en una página
+
+    Returns:
+        bool: False si el listado está vacío
+    """
+    pagina = obtener_pagina()
+    if not pagina.elementos:
+        return False
+
+    numero = 1
+    while True:
+        mostrar_pagina(pagina.elementos, numero)
+
+        opciones = []
+        if pagina.siguiente:
+            opciones.append("[s] Siguiente")
+        if pagina.anterior:
+            opciones.append("[a] Anterior")
+
+        if not opciones:
+            if esperar:
+                input("\nPresione Enter para continuar...")
+            return True
+
+        opcion = input(f"\n{'  '.join(opciones)}  [Enter] Continuar: ").strip().lower()
+        if opcion == "s" and pagina.siguiente:
+            pagina = obtener_pagina(despues=pagina.siguiente)
+            numero += 1
+        elif opcion == "a" and pagina.anterior:
+            pagina = obtener_pagina(antes=pagina.anterior)
+            numero -= 1
+        elif opcion == "":
+            return True
+        else:
+            print("Opción no válida.")
+
+
 def mostrar_lista_grupos(grupos):
-    """Muestra una lista de grupos de investigación"""
+    """Muestra una lista de grupos de investigación
+
+    Args:
+        grupos (list | callable): Lista de grupos o función que devuelve páginas
+            de grupos (GrupoService.listar_pagina)
+    """
+    def mostrar_pagina(elementos, numero=None):
+        titulo = "GRUPOS DE INVESTIGACIÓN DISPONIBLES"
+        if numero is not None:
+            titulo += f" (página {numero})"
+        print(f"\n==== {titulo} ====")
+        for grupo in elementos:
+            print(f"{grupo.id}. {grupo.nombre}")
+        print("=" * 45)
+
+    if callable(grupos):
+        if not _navegar_paginas(grupos, mostrar_pagina):
+            print("\nNo hay grupos de investigación registrados.")
+            return False
+        return True
+
     if not grupos:
         print("\nNo hay grupos de investigación registrados.")
         return False
 
-    print("\n==== GRUPOS DE INVESTIGACIÓN DISPONIBLES ====")
-    for grupo in grupos:
-        print(f"{grupo.id}. {grupo.nombre}")
-    print("=" * 45)
+    mostrar_pagina(grupos)
 
     return True
 
@@ -41,22 +101,49 @@ def solicitar_id_grupo():
         return None
 
 
-def mostrar_lista_semilleros(semilleros):
-    """Función auxiliar para mostrar la lista de semilleros"""
+def mostrar_lista_semilleros(semilleros, mostrar_grupo=False):
+    """Función auxiliar para mostrar la lista de semilleros
+
+    Args:
+        semilleros (list | callable): Lista de semilleros o función que devuelve
+            páginas de semilleros (SemilleroService.listar_pagina)
+        mostrar_grupo (bool): Añadir la columna con el nombre del grupo
+    """
+    ancho = 70 if mostrar_grupo else 50
+
+    def mostrar_pagina(elementos, numero=None):
+        titulo = "LISTA DE SEMILLEROS"
+        if numero is not None:
+            titulo += f" (página {numero})"
+        print(f"\n=== {titulo} ===")
+        cabecera = f"{'ID':<5} {'NOMBRE':<30} {'ESTADO':<10}"
+        if mostrar_grupo:
+            cabecera += f" {'GRUPO':<20}"
+        print(cabecera)
+        print("-" * ancho)
+
+        for semillero in elementos:
+            estado = semillero.status.upper()
+            linea = f"{semillero.id:<5} {semillero.nombre:<30} {estado:<10}"
+            if mostrar_grupo:
+                linea += f" {semillero.grupo_nombre or 'Grupo no encontrado':<20}"
+            print(linea)
+
+        print("-" * ancho)
+
+    if callable(semilleros):
+        if not _navegar_paginas(semilleros, mostrar_pagina, esperar=True):
+            print("\nNo hay semilleros disponibles.")
+            input("\nPresione Enter para continuar...")
+            return False
+        return True
+
     if not semilleros:
         print("\nNo hay semilleros disponibles.")
         input("\nPresione Enter para continuar...")
         return False
 
-    print("\n=== LISTA DE SEMILLEROS ===")
-    print(f"{'ID':<5} {'NOMBRE':<30} {'ESTADO':<10}")
-    print("-" * 50)
-
-    for semillero in semilleros:
-        estado = semillero.status.upper()
-        print(f"{semillero.id:<5} {semillero.nombre:<30} {estado:<10}")
-
-    print("-" * 50)
+    mostrar_pagina(semilleros)
     input("\nPresione Enter para continuar...")
     return True
 
@@ -87,6 +174,50 @@ def solicitar_id_semillero():
         return None
 
 
+def mostrar_cola_entregables(obtener_pagina):
+    """Muestra los entregables pendientes de revisión página a página
+
+    Args:
+        obtener_pagina (callable): Función que devuelve páginas de entregables
+            (EntregableService.cola_revision)
+
+    Returns:
+        bool: False si no hay entregables pendientes
+    """
+    def mostrar_pagina(elementos, numero):
+        print(f"\n=== ENTREGABLES PENDIENTES DE REVISIÓN (página {numero}) ===")
+        print(f"{'ID':<5} {'ENTREGA':<11} {'SEMILLERO':<25} {'TÍTULO':<30}")
+        print("-" * 74)
+        for entregable in elementos:
+            print(f"{entregable.id:<5} {entregable.fecha_entrega or 'Sin fecha':<11} "
+                  f"{(entregable.semillero_nombre or '')[:25]:<25} {entregable.titulo[:30]:<30}")
+        print("-" * 74)
+
+    if not _navegar_paginas(obtener_pagina, mostrar_pagina):
+        print("\nNo hay entregables pendientes de revisión.")
+        return False
+    return True
+
+
+def solicitar_ids(accion):
+    """Solicita una lista de IDs separados por comas o espacios
+
+    Args:
+        accion (str): Verbo que se muestra en la pregunta ('aprobar', 'rechazar'...)
+
+    Returns:
+        list: IDs introducidos (vacía si no se introdujo ninguno válido)
+    """
+    texto = input(f"\nIDs a {accion}, separados por comas (Enter para ninguno): ")
+    ids = []
+    for parte in texto.replace(",", " ").split():
+        if parte.isdigit():
+            ids.append(int(parte))
+        else:
+            print(f"Se ignora '{parte}': no es un ID válido.")
+    return ids
+
+
 def solicitar_datos_semillero(grupos, lineas_investigacion=None):
     """Solicita al usuario los datos para crear un nuevo semillero
 